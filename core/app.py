@@ -9,23 +9,66 @@ from coman.version import (
     LEGACY_ROUTE_REMOVAL_DATE,
 )
 
+from .codec import CodecNegotiationMiddleware, CodecResponse
 from .registry import Core
 from .scheduler import Scheduler
 from coman.modules.ui.mount import mount_ui
 
 
+class LazyModuleMiddleware:
+    """ASGI middleware that imports lazily registered modules on first request."""
+
+    def __init__(self, app, core: Core):
+        self.app = app
+        self.core = core
+
+    async def __call__(self, scope, receive, send):
+        if scope.get("type") in {"http", "websocket"}:
+            name = self.core.resolve_pending(scope.get("path", ""))
+            if name is not None:
+                from starlette.concurrency import run_in_threadpool
+
+                await run_in_threadpool(self.core.get_module, name)
+        await self.app(scope, receive, send)
+
+
+def _attach_module(app: FastAPI, m) -> None:
+    routers = getattr(m, "get_routers", None)
+    if callable(routers):
+        for router in routers():
+            app.include_router(router)
+    else:  # pragma: no cover - compatibility fallback
+        app.include_router(m.get_router())
+    try:
+        m.register_schedules()
+    except Exception:
+        pass
+
+
 def build_fastapi_app(core: Core) -> FastAPI:
     core.scheduler = Scheduler()
 
     @asynccontextmanager
     async def lifespan(_app: FastAPI):
+        http = getattr(core, "http", None)
+        if http is not None:
+            await http.open()
         core.scheduler.start()
         try:
             yield
         finally:
             core.scheduler.shutdown()
+            if http is not None:
+                await http.aclose()
 
-    app = FastAPI(title="Coman API", version=COMAN_VERSION, lifespan=lifespan)
+    app = FastAPI(
+        title="Coman API",
+        version=COMAN_VERSION,
+        lifespan=lifespan,
+        default_response_class=CodecResponse,
+    )
+    # Lets app-level views (e.g. the UI) dispatch module calls in-process.
+    app.state.core = core
     instrument_fastapi_app(app, module_name="core", module_version=COMAN_VERSION)
 
     legacy_metadata = {"sunset": LEGACY_ROUTE_REMOVAL_DATE.isoformat()}
@@ -38,17 +81,35 @@ def build_fastapi_app(core: Core) -> FastAPI:
     def legacy_health() -> dict[str, object]:
         return health()
 
-    for m in core.modules.values():
-        routers = getattr(m, "get_routers", None)
-        if callable(routers):
-            for router in routers():
-                app.include_router(router)
-        else:  # pragma: no cover - compatibility fallback
-            app.include_router(m.get_router())
-        try:
-            m.register_schedules()
-        except Exception:
-            pass
+    @app.get(f"/v{API_MAJOR_VERSION}/health/modules")
+    def module_load_report() -> dict[str, object]:
+        timings = getattr(core, "load_timings", {})
+        pending = getattr(core, "pending_modules", None)
+        report = getattr(core, "startup_report", [])
+        return {
+            "loaded": {name: round(seconds * 1000, 3) for name, seconds in timings.items()},
+            "pending": pending() if callable(pending) else [],
+            "report": [record.to_payload() for record in report],
+        }
+
+    @app.get(f"/v{API_MAJOR_VERSION}/health/registry-cache")
+    def registry_cache_stats() -> dict[str, object]:
+        from .registry_cache import registry_cache
+
+        return registry_cache.stats()
+
+    for m in list(core.modules.values()):
+        _attach_module(app, m)
+
+    if getattr(core, "module_specs", None):
+
+        def _attach_lazy(module) -> None:
+            _attach_module(app, module)
+            app.openapi_schema = None
+
+        core.add_module_listener(_attach_lazy)
+        app.add_middleware(LazyModuleMiddleware, core=core)
 
+    app.add_middleware(CodecNegotiationMiddleware)
     mount_ui(app)
     return app
@@ -2,23 +2,33 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-from contextlib import nullcontext
+import json
+import time
+from collections.abc import Callable, Iterable, Mapping
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Callable, Dict, Iterable, List, Mapping
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter
+from opentelemetry.trace import Tracer
 
-from observability import setup_module_observability
 from coman.version import (
     API_MAJOR_VERSION,
     LEGACY_ROUTE_REMOVAL_DATE,
     get_module_version,
 )
-from opentelemetry.trace import Tracer
+from fastapi import APIRouter
+from observability import setup_module_observability
+
+from .http import aclose_loop_clients
 
+if TYPE_CHECKING:
+    from .dispatch import Dispatcher
+    from .http import HttpClientPool
 
-def _normalise_route_methods(route: Any) -> List[str]:
+
+def _normalise_route_methods(route: Any) -> list[str]:
     methods: Iterable[str] | None = getattr(route, "methods", None)
     if not methods:
         method = getattr(route, "method", None)
@@ -45,32 +55,79 @@ def _is_fastapi_param(default: Any) -> bool:
     return name in {"Body", "File", "Form", "Query", "Header", "Path"}
 
 
-def _coerce_parameter_value(value: Any, annotation: Any) -> Any:
-    if annotation is inspect._empty or value is None:
+def _coerce_json_list(value: Any) -> Any:
+    if not isinstance(value, str):
         return value
-    origin = getattr(annotation, "__origin__", None)
-    if origin in (list, List) and isinstance(value, str):
-        try:
-            import json
-
-            parsed = json.loads(value)
-        except Exception:
-            return [value]
-        if isinstance(parsed, list):
-            return parsed
-        return [parsed]
-    if origin in (dict, Dict, Mapping) and isinstance(value, str):
-        try:
-            import json
-
-            parsed = json.loads(value)
-        except Exception:
-            return value
-        if isinstance(parsed, dict):
-            return parsed
+    try:
+        parsed = json.loads(value)
+    except Exception:
+        return [value]
+    if isinstance(parsed, list):
+        return parsed
+    return [parsed]
+
+
+def _coerce_json_dict(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        parsed = json.loads(value)
+    except Exception:
+        return value
+    if isinstance(parsed, dict):
+        return parsed
     return value
 
 
+def _coercer_for(annotation: Any) -> Callable[[Any], Any] | None:
+    """Return the CLI string coercer for ``annotation`` (``None`` if not needed)."""
+
+    if annotation is inspect._empty:
+        return None
+    origin = getattr(annotation, "__origin__", None)
+    if origin in (list, list):
+        return _coerce_json_list
+    if origin in (dict, dict, Mapping):
+        return _coerce_json_dict
+    return None
+
+
+def _coerce_parameter_value(value: Any, annotation: Any) -> Any:
+    coercer = _coercer_for(annotation)
+    if coercer is None or value is None:
+        return value
+    return coercer(value)
+
+
+_REQUIRED = object()
+
+
+@dataclass(frozen=True)
+class _ParameterBinder:
+    """Precomputed binding rule for one endpoint parameter."""
+
+    name: str
+    default: Any = _REQUIRED
+    coercer: Callable[[Any], Any] | None = None
+
+    @classmethod
+    def compile(cls, parameter: inspect.Parameter) -> _ParameterBinder:
+        default = parameter.default
+        if default is inspect._empty:
+            default = _REQUIRED
+        elif _is_fastapi_param(default):
+            default = getattr(default, "default", None)
+        return cls(parameter.name, default, _coercer_for(parameter.annotation))
+
+
+async def _run_closing_http_clients(coro: Any) -> Any:
+    # ``asyncio.run`` discards its loop, so close the async clients bound to it.
+    try:
+        return await coro
+    finally:
+        await aclose_loop_clients()
+
+
 @dataclass
 class ConsoleOperation:
     """Representation of a module endpoint that can be invoked from the CLI."""
@@ -81,7 +138,7 @@ class ConsoleOperation:
     module_name: str
     tracer: Tracer | None = None
 
-    def describe(self) -> Dict[str, Any]:
+    def describe(self) -> dict[str, Any]:
         return {
             "name": self.name,
             "path": _normalise_route_path(self.route),
@@ -89,23 +146,33 @@ class ConsoleOperation:
             "summary": getattr(self.route, "summary", ""),
         }
 
-    def invoke(self, arguments: Mapping[str, Any] | None = None) -> Any:
-        arguments = dict(arguments or {})
-        signature = inspect.signature(self.endpoint)
-        bound: Dict[str, Any] = {}
-        for name, parameter in signature.parameters.items():
-            if name in arguments:
-                value = arguments[name]
-            elif parameter.default is not inspect._empty:
-                default = parameter.default
-                if _is_fastapi_param(default):
-                    value = getattr(default, "default", None)
-                else:
-                    value = default
+    @cached_property
+    def signature(self) -> inspect.Signature:
+        return inspect.signature(self.endpoint)
+
+    @cached_property
+    def _binders(self) -> tuple[_ParameterBinder, ...]:
+        return tuple(_ParameterBinder.compile(p) for p in self.signature.parameters.values())
+
+    def _bind(self, arguments: Mapping[str, Any] | None) -> dict[str, Any]:
+        arguments = arguments or {}
+        bound: dict[str, Any] = {}
+        for binder in self._binders:
+            if binder.name in arguments:
+                value = arguments[binder.name]
+            elif binder.default is not _REQUIRED:
+                value = binder.default
             else:
-                raise TypeError(f"Missing required argument '{name}' for operation '{self.name}'")
-            value = _coerce_parameter_value(value, parameter.annotation)
-            bound[name] = value
+                raise TypeError(
+                    f"Missing required argument '{binder.name}' for operation '{self.name}'",
+                )
+            if binder.coercer is not None and value is not None:
+                value = binder.coercer(value)
+            bound[binder.name] = value
+        return bound
+
+    @contextmanager
+    def _span(self):
         span_context = (
             self.tracer.start_as_current_span(f"{self.module_name}.console.{self.name}")
             if self.tracer is not None
@@ -121,11 +188,27 @@ class ConsoleOperation:
                     span.set_attribute("coman.route", route_path)
                 if methods:
                     span.set_attribute("coman.methods", methods)
+            yield span
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.endpoint)
+
+    def invoke(self, arguments: Mapping[str, Any] | None = None) -> Any:
+        bound = self._bind(arguments)
+        with self._span():
             result = self.endpoint(**bound)
-            if inspect.iscoroutine(result):  # pragma: no cover - async endpoints
-                return asyncio.run(result)
+            if inspect.iscoroutine(result):
+                return asyncio.run(_run_closing_http_clients(result))
             return result
 
+    async def ainvoke(self, arguments: Mapping[str, Any] | None = None) -> Any:
+        """Invoke from a running event loop; the endpoint must be ``async def``."""
+
+        bound = self._bind(arguments)
+        with self._span():
+            return await self.endpoint(**bound)
+
 
 class BaseModule:
     name: str = "base"
@@ -135,7 +218,7 @@ class BaseModule:
     enable_legacy_routes: bool = True
     legacy_sunset: date | None = LEGACY_ROUTE_REMOVAL_DATE
 
-    def __init__(self, core: "Core"):
+    def __init__(self, core: Core):
         self.core = core
         self.version = self.version or get_module_version(self.name)
         self.router = APIRouter(
@@ -143,7 +226,7 @@ class BaseModule:
             tags=[self.name],
         )
         self._legacy_router: APIRouter | None = None
-        legacy_openapi_extra: Dict[str, Any] | None = None
+        legacy_openapi_extra: dict[str, Any] | None = None
         if self.legacy_sunset is not None:
             legacy_openapi_extra = {"sunset": self.legacy_sunset.isoformat()}
         if self.enable_legacy_routes:
@@ -155,7 +238,12 @@ class BaseModule:
             if legacy_openapi_extra is not None:
                 self._legacy_router.openapi_extra = dict(legacy_openapi_extra)
         self._legacy_openapi_extra = legacy_openapi_extra
+        # Compiled console operations (route count, name index, per-route index).
+        self._console_operations: (
+            tuple[int, dict[str, ConsoleOperation], dict[int, ConsoleOperation]] | None
+        ) = None
         self._wrap_router_with_legacy_mirroring()
+        tracer_started = time.perf_counter()
         self._tracer = setup_module_observability(
             self.name,
             self.version,
@@ -167,10 +255,28 @@ class BaseModule:
                 self.version,
                 router=self._legacy_router,
             )
+        # Reported by the registry's startup report.
+        self._tracer_setup_s = time.perf_counter() - tracer_started
 
     def get_router(self):
         return self.router
 
+    @property
+    def dispatcher(self) -> Dispatcher:
+        """Dispatcher for calling other modules' endpoints in-process."""
+
+        from .dispatch import get_dispatcher
+
+        return get_dispatcher(self.core)
+
+    @property
+    def http(self) -> HttpClientPool:
+        """Core-owned pooled HTTP client for outbound requests."""
+
+        from .http import get_http_pool
+
+        return get_http_pool(self.core)
+
     @property
     def legacy_router(self) -> APIRouter | None:
         return self._legacy_router
@@ -184,7 +290,7 @@ class BaseModule:
             *,
             summary: str | None = None,
             deprecated: bool | None = None,
-            openapi_extra: Dict[str, Any] | None = None,
+            openapi_extra: dict[str, Any] | None = None,
             include_in_schema: bool = True,
             methods: Iterable[str] | None = None,
             **kwargs: Any,
@@ -215,6 +321,7 @@ class BaseModule:
                 route=route,
                 extra_kwargs=extra_kwargs,
             )
+            self._console_operations = None
             return route
 
         self.router.add_api_route = add_api_route  # type: ignore[assignment]
@@ -226,11 +333,11 @@ class BaseModule:
         endpoint: Callable[..., Any],
         summary: str | None,
         deprecated: bool | None,
-        openapi_extra: Dict[str, Any] | None,
+        openapi_extra: dict[str, Any] | None,
         include_in_schema: bool,
         methods: Iterable[str] | None,
         route: Any,
-        extra_kwargs: Dict[str, Any],
+        extra_kwargs: dict[str, Any],
     ) -> None:
         if not self.enable_legacy_routes or self._legacy_router is None:
             return
@@ -239,14 +346,14 @@ class BaseModule:
             legacy_methods = sorted(route.methods or [])
         if not legacy_methods:
             legacy_methods = ["GET"]
-        legacy_kwargs: Dict[str, Any] = dict(extra_kwargs)
+        legacy_kwargs: dict[str, Any] = dict(extra_kwargs)
         legacy_kwargs.pop("methods", None)
         legacy_kwargs["include_in_schema"] = include_in_schema
         legacy_kwargs["deprecated"] = True
         if summary:
             legacy_kwargs["summary"] = f"[Deprecated] {summary}"
         if openapi_extra or self._legacy_openapi_extra:
-            merged_extra: Dict[str, Any] = {}
+            merged_extra: dict[str, Any] = {}
             if openapi_extra:
                 merged_extra.update(openapi_extra)
             if self._legacy_openapi_extra:
@@ -267,7 +374,7 @@ class BaseModule:
             **legacy_kwargs,
         )
 
-    def get_routers(self) -> List[APIRouter]:
+    def get_routers(self) -> list[APIRouter]:
         routers = [self.router]
         if self._legacy_router is not None:
             routers.append(self._legacy_router)
@@ -286,9 +393,9 @@ class BaseModule:
                 continue
             yield route
 
-    def _operation_keys(self, route: Any) -> List[str]:
+    def _operation_keys(self, route: Any) -> list[str]:
         endpoint = getattr(route, "endpoint", None)
-        keys: List[str] = []
+        keys: list[str] = []
         func_name = getattr(endpoint, "__name__", None)
         if func_name:
             keys.append(func_name)
@@ -303,8 +410,11 @@ class BaseModule:
                 keys.append(short)
         return [k for k in keys if k]
 
-    def get_console_operations(self) -> Dict[str, ConsoleOperation]:
-        operations: Dict[str, ConsoleOperation] = {}
+    def _build_console_operations(
+        self,
+    ) -> tuple[dict[str, ConsoleOperation], dict[int, ConsoleOperation]]:
+        operations: dict[str, ConsoleOperation] = {}
+        by_route: dict[int, ConsoleOperation] = {}
         for route in self._iter_console_routes():
             endpoint = getattr(route, "endpoint", None)
             if endpoint is None:
@@ -318,6 +428,7 @@ class BaseModule:
                 module_name=self.name,
                 tracer=getattr(self, "_tracer", None),
             )
+            by_route[id(route)] = op
             for key in self._operation_keys(route):
                 key = key.strip()
                 if not key:
@@ -326,10 +437,32 @@ class BaseModule:
                 if lower in operations:
                     continue
                 operations[lower] = op
-        return operations
+        return operations, by_route
+
+    def _compiled_operations(
+        self,
+    ) -> tuple[int, dict[str, ConsoleOperation], dict[int, ConsoleOperation]]:
+        route_count = len(getattr(self.router, "routes", []))
+        cached = self._console_operations
+        if cached is None or cached[0] != route_count:
+            cached = self._console_operations = (route_count, *self._build_console_operations())
+        return cached
+
+    def _operation_index(self) -> dict[str, ConsoleOperation]:
+        """Case-insensitive operation index, rebuilt only when routes change."""
+
+        return self._compiled_operations()[1]
+
+    def get_console_operations(self) -> dict[str, ConsoleOperation]:
+        return dict(self._operation_index())
+
+    def console_operation_for(self, route: Any) -> ConsoleOperation | None:
+        """Return the compiled operation serving ``route``."""
+
+        return self._compiled_operations()[2].get(id(route))
 
-    def describe_console_operations(self) -> List[Dict[str, Any]]:
-        descriptions: List[Dict[str, Any]] = []
+    def describe_console_operations(self) -> list[dict[str, Any]]:
+        descriptions: list[dict[str, Any]] = []
         seen = set()
         for route in self._iter_console_routes():
             endpoint = getattr(route, "endpoint", None)
@@ -351,7 +484,7 @@ class BaseModule:
         return descriptions
 
     def invoke_console_operation(self, name: str, arguments: Mapping[str, Any] | None = None) -> Any:
-        operations = self.get_console_operations()
+        operations = self._operation_index()
         key = name.strip().lower()
         operation = operations.get(key)
         if operation is None:
@@ -0,0 +1,188 @@
+"""JSON/msgpack codec shared by the API apps and module-to-module calls.
+
+:func:`dumps`/:func:`loads` use ``orjson`` when it is installed and fall back
+to the standard library otherwise.  :class:`CodecResponse` is the default
+response class of ``build_fastapi_app`` and the standalone analysis and text
+apps; it renders msgpack instead of JSON when
+:class:`CodecNegotiationMiddleware` saw a request whose ``Accept`` header
+prefers ``application/msgpack`` (and ``msgpack`` is installed).  The dispatcher
+asks for msgpack on remote calls when ``COMAN_HTTP_MSGPACK`` is enabled.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import datetime as _dt
+import json
+from collections.abc import Mapping
+from typing import Any
+
+try:  # pragma: no cover - optional speed-up
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - the vendored FastAPI stub ships without Starlette
+    from starlette.responses import JSONResponse
+except ImportError:  # pragma: no cover
+    JSONResponse = None  # type: ignore[assignment,misc]
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_MSGPACK_MEDIA_TYPES = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack"})
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+# Set per request by CodecNegotiationMiddleware, read by CodecResponse.
+_prefer_msgpack: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "coman_prefer_msgpack",
+    default=False,
+)
+
+
+def _default(obj: Any) -> Any:
+    """Serialise the types both encoders reject natively."""
+
+    if hasattr(obj, "to_payload"):
+        return obj.to_payload()
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, (_dt.date, _dt.time)):
+        return obj.isoformat()
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.decode("utf-8", "replace")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder copes.
+            pass
+    text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default)
+    return text.encode("utf-8")
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def msgpack_available() -> bool:
+    return msgpack is not None
+
+
+def packb(obj: Any) -> bytes:
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(obj, default=_default, use_bin_type=True)
+
+
+def unpackb(data: bytes) -> Any:
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.unpackb(data, raw=False)
+
+
+def is_msgpack(media_type: str | None) -> bool:
+    return (media_type or "").split(";", 1)[0].strip().lower() in _MSGPACK_MEDIA_TYPES
+
+
+def prefers_msgpack(accept: str | None) -> bool:
+    """Return ``True`` if the highest-ranked type in ``accept`` is msgpack."""
+
+    if not accept or msgpack is None:
+        return False
+    best_q = 0.0
+    best_msgpack = False
+    for item in accept.split(","):
+        media_type, _, params = item.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        # Earlier entries win ties, as listed by the client.
+        if q > best_q:
+            best_q = q
+            best_msgpack = is_msgpack(media_type)
+    return best_msgpack
+
+
+def decode_body(body: bytes, media_type: str | None) -> Any:
+    """Decode a response body by content type (msgpack, JSON or text)."""
+
+    if is_msgpack(media_type):
+        return unpackb(body)
+    if "json" in (media_type or ""):
+        return loads(body or b"null")
+    return body.decode("utf-8", "replace")
+
+
+def accept_header() -> str:
+    if msgpack is None:
+        return JSON_MEDIA_TYPE
+    return f"{MSGPACK_MEDIA_TYPE}, {JSON_MEDIA_TYPE};q=0.9"
+
+
+if JSONResponse is not None:
+
+    class CodecResponse(JSONResponse):
+        """``JSONResponse`` rendered with :func:`dumps`, or msgpack when negotiated."""
+
+        def __init__(
+            self,
+            content: Any,
+            status_code: int = 200,
+            headers: Mapping[str, str] | None = None,
+            media_type: str | None = None,
+            background: Any = None,
+        ) -> None:
+            if media_type is None and _prefer_msgpack.get():
+                media_type = MSGPACK_MEDIA_TYPE
+            super().__init__(content, status_code, headers, media_type, background)
+
+        def render(self, content: Any) -> bytes:
+            if self.media_type == MSGPACK_MEDIA_TYPE:
+                return packb(content)
+            return dumps(content)
+
+else:  # pragma: no cover - vendored FastAPI stub
+    CodecResponse = None  # type: ignore[assignment,misc]
+
+
+class CodecNegotiationMiddleware:
+    """ASGI middleware recording whether the client asked for msgpack."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Mapping[str, Any], receive: Any, send: Any) -> None:
+        if scope.get("type") != "http" or msgpack is None:
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for key, value in scope.get("headers") or ():
+            if key == b"accept":
+                accept = value.decode("latin-1")
+                break
+        token = _prefer_msgpack.set(prefers_msgpack(accept))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _prefer_msgpack.reset(token)
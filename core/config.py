@@ -15,6 +15,41 @@ def _split_paths(val: str):
     return norm
 
 
+def _env_flag(name: str, default: bool = False) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _parse_remote_modules(val: str) -> dict:
+    """Parse ``name[=base_url]`` pairs; ``*`` marks every module as remote."""
+
+    remote = {}
+    for item in (val or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, base = item.partition("=")
+        remote[name.strip()] = base.strip()
+    return remote
+
+
+def _parse_timeouts(val: str) -> dict:
+    """Parse ``host[:port]=seconds`` pairs into per-destination timeouts."""
+
+    timeouts = {}
+    for item in (val or "").split(","):
+        host, sep, seconds = item.strip().partition("=")
+        if not sep or not host.strip():
+            continue
+        try:
+            timeouts[host.strip().lower()] = float(seconds)
+        except ValueError:
+            continue
+    return timeouts
+
+
 _DEFAULT_DATA_DIR = Path(__file__).resolve().parents[1] / "data"
 
 
@@ -24,11 +59,65 @@ class Settings:
         self.log_level = os.getenv("COMAN_LOG_LEVEL", "INFO")
         default_data_dir = str(_DEFAULT_DATA_DIR)
         self.data_dir = os.getenv("COMAN_DATA_DIR", default_data_dir)
+        self.cache_dir = os.getenv("COMAN_CACHE_DIR", os.path.join(self.data_dir, "cache"))
         self.api_base = os.getenv("COMAN_API_BASE", "http://127.0.0.1:8000")
+        # Unix socket of the warm CLI daemon (``main daemon``).
+        self.daemon_socket = os.getenv(
+            "COMAN_DAEMON_SOCKET",
+            os.path.join(self.cache_dir, "coman.sock"),
+        )
+        # Seconds ``call`` waits for a daemon response before giving up.
+        self.daemon_call_timeout = float(os.getenv("COMAN_DAEMON_CALL_TIMEOUT", "300"))
+        # Modules served by another process; everything else is dispatched in-process.
+        self.remote_modules = _parse_remote_modules(os.getenv("COMAN_REMOTE_MODULES", ""))
+        # Shared outbound HTTP client pool (see core/http.py).
+        self.http_max_connections = int(os.getenv("COMAN_HTTP_MAX_CONNECTIONS", "100"))
+        self.http_max_keepalive = int(os.getenv("COMAN_HTTP_MAX_KEEPALIVE", "20"))
+        self.http_keepalive_expiry = float(os.getenv("COMAN_HTTP_KEEPALIVE_EXPIRY", "5.0"))
+        self.http2 = _env_flag("COMAN_HTTP2")
+        self.http_timeout = float(os.getenv("COMAN_HTTP_TIMEOUT", "10"))
+        self.http_destination_timeouts = _parse_timeouts(os.getenv("COMAN_HTTP_TIMEOUTS", ""))
+        # Ask remote modules for msgpack responses (needs ``msgpack`` on both ends).
+        self.http_msgpack = _env_flag("COMAN_HTTP_MSGPACK")
+        # Seconds between stat() checks of the cached JSON registries.
+        self.registry_stat_interval = float(os.getenv("COMAN_REGISTRY_STAT_INTERVAL", "1.0"))
+        # Registry storage: "json" (files in data_dir) or "sqlite" (see core/registry_store.py).
+        self.registry_backend = (
+            os.getenv("COMAN_REGISTRY_BACKEND", "json").strip().lower() or "json"
+        )
+        self.registry_db = os.getenv("COMAN_REGISTRY_DB", "")
+        # Upper bound on concurrent tool calls of one manager ``/run-batch`` request.
+        self.manager_batch_concurrency = int(os.getenv("COMAN_MANAGER_BATCH_CONCURRENCY", "16"))
+        # Result cache for tools declaring ``cacheable`` (see modules/manager/cache.py).
+        self.manager_cache_size = int(os.getenv("COMAN_MANAGER_CACHE_SIZE", "1024"))
+        self.manager_cache_ttl = float(os.getenv("COMAN_MANAGER_CACHE_TTL", "300"))
+        # Share one upstream call between identical concurrent GET/cacheable tool calls.
+        self.manager_coalesce = _env_flag("COMAN_MANAGER_COALESCE", True)
+        # Per-tool health window and circuit breaker (see modules/manager/health.py).
+        self.manager_health_window = int(os.getenv("COMAN_MANAGER_HEALTH_WINDOW", "100"))
+        self.manager_breaker_failures = int(os.getenv("COMAN_MANAGER_BREAKER_FAILURES", "5"))
+        self.manager_breaker_cooldown = float(os.getenv("COMAN_MANAGER_BREAKER_COOLDOWN", "30"))
         self.allowed_integration_paths = _split_paths(os.getenv("COMAN_ALLOWED_INTEGRATION_PATHS", "./integrations,."))
+        # Warm runner pool for non-inproc integration calls (see modules/integration/pool.py).
+        self.integration_call_timeout = float(os.getenv("COMAN_INTEGRATION_CALL_TIMEOUT", "30"))
+        self.integration_pool_size = int(os.getenv("COMAN_INTEGRATION_POOL_SIZE", "2"))
+        self.integration_pool_warmup = int(os.getenv("COMAN_INTEGRATION_POOL_WARMUP", "1"))
+        self.integration_worker_max_calls = int(
+            os.getenv("COMAN_INTEGRATION_WORKER_MAX_CALLS", "1000"),
+        )
+        self.integration_worker_max_rss_mb = float(
+            os.getenv("COMAN_INTEGRATION_WORKER_MAX_RSS_MB", "512"),
+        )
+        # Seconds between background re-checks of integration source digests (0: stat per call).
+        self.integration_sig_watch = float(os.getenv("COMAN_INTEGRATION_SIG_WATCH", "0"))
         self.openai_api_key = os.getenv("OPENAI_API_KEY", "")
         self.openrouter_api_key = os.getenv("OPENROUTER_API_KEY", "")
         self.openrouter_base_url = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
+        # Register module routes from the static manifest and import on first request.
+        self.lazy_modules = _env_flag("COMAN_LAZY_MODULES")
+        # Import and construct modules on a thread pool at startup.
+        self.parallel_module_init = _env_flag("COMAN_PARALLEL_MODULE_INIT")
+        self.module_init_workers = int(os.getenv("COMAN_MODULE_INIT_WORKERS", "0")) or None
 
         self._telegram_token_file = os.path.join(self.data_dir, "telegram_token.txt")
         env_token_raw = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -40,6 +129,15 @@ class Settings:
             self.telegram_bot_token = self._load_telegram_token_from_disk()
             self.telegram_token_source = "file" if self.telegram_bot_token else "none"
 
+    def remote_base(self, module_name: str) -> str | None:
+        """Return the base URL for a remote module, or ``None`` if it is local."""
+
+        if module_name in self.remote_modules:
+            return self.remote_modules[module_name] or self.api_base
+        if "*" in self.remote_modules:
+            return self.remote_modules["*"] or self.api_base
+        return None
+
     def _load_telegram_token_from_disk(self) -> str:
         try:
             with open(self._telegram_token_file, "r", encoding="utf-8") as fh:
@@ -0,0 +1,131 @@
+"""Warm CLI daemon: a resident core answering console calls over a Unix socket.
+
+``python -m coman.modules.main daemon`` loads every module once and serves
+newline-delimited JSON requests (``{"module", "operation", "args"}``) on
+``COMAN_DAEMON_SOCKET``.  ``call`` forwards to the daemon when the socket
+accepts connections and runs in-process otherwise, so console operations skip
+the import cost of a cold start.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import socket
+import socketserver
+from collections.abc import Callable
+from typing import Any
+
+log = logging.getLogger("coman.daemon")
+
+# Upper bound for a single request or response line.
+MAX_LINE_BYTES = 16 * 1024 * 1024
+
+
+class DaemonUnavailable(Exception):
+    """The daemon is not running (no socket or nobody listening)."""
+
+
+def unix_sockets_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def _encode(payload: dict[str, Any]) -> bytes:
+    return (json.dumps(payload, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        while True:
+            line = self.rfile.readline(MAX_LINE_BYTES)
+            if not line:
+                return
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                response = self.server.handle_line(line.decode("utf-8"))
+            except Exception as exc:  # pragma: no cover - handler bugs must not kill the daemon
+                log.exception("Daemon request failed")
+                response = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            self.wfile.write(_encode(response))
+            self.wfile.flush()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server handing each request line to ``handle_line``."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, handle_line: Callable[[str], dict[str, Any]]):
+        self.socket_path = socket_path
+        self.handle_line = handle_line
+        _claim_socket_path(socket_path)
+        super().__init__(socket_path, _Handler)
+
+    def server_bind(self) -> None:
+        # Only the owning user may drive the resident core.  The socket is
+        # created 0600 by the umask; a chmod after bind would leave a window
+        # in which other local users could connect.
+        previous = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous)
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(OSError):
+            os.remove(self.socket_path)
+
+
+def _claim_socket_path(socket_path: str) -> None:
+    """Remove a stale socket file, refusing to replace a live daemon."""
+
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+    if not os.path.exists(socket_path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.settimeout(0.5)
+        probe.connect(socket_path)
+    except OSError:
+        os.remove(socket_path)
+    else:
+        raise RuntimeError(f"A daemon is already listening on {socket_path}")
+    finally:
+        probe.close()
+
+
+class DaemonClient:
+    """Send console calls to a running daemon."""
+
+    def __init__(self, socket_path: str, timeout: float | None = None):
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if not unix_sockets_supported() or not os.path.exists(self.socket_path):
+            raise DaemonUnavailable(self.socket_path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            try:
+                sock.connect(self.socket_path)
+            except (FileNotFoundError, ConnectionRefusedError) as exc:
+                raise DaemonUnavailable(self.socket_path) from exc
+            sock.settimeout(self.timeout)
+            sock.sendall(_encode(payload))
+            with sock.makefile("rb") as reader:
+                line = reader.readline(MAX_LINE_BYTES)
+        finally:
+            sock.close()
+        if not line:
+            raise ConnectionError("Daemon closed the connection without a response")
+        return json.loads(line)
+
+    def call(self, module: str, operation: str, args: dict[str, Any]) -> dict[str, Any]:
+        return self.request({"module": module, "operation": operation, "args": args})
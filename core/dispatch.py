@@ -0,0 +1,538 @@
+"""In-process dispatch of module API paths.
+
+Modules used to call each other through ``httpx`` at ``settings.api_base``,
+paying a loopback TCP round trip, two JSON encode/decode cycles and a second
+threadpool slot per call (which can deadlock a single-worker server).  The
+:class:`Dispatcher` resolves a path such as ``/v1/logic/rulesx/list`` to the
+owning module's endpoint through ``Core.modules`` and calls it directly.
+Modules listed in ``COMAN_REMOTE_MODULES`` are still reached over HTTP, as are
+routes :class:`RouteBinding` cannot bind faithfully.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from collections.abc import Mapping
+from typing import Any
+
+from coman.core.config import settings
+
+from coman.version import API_MAJOR_VERSION
+
+from . import codec
+from .base_module import ConsoleOperation, _normalise_route_methods, _normalise_route_path
+
+log = logging.getLogger("coman.dispatch")
+
+_PREFIX_RX = re.compile(rf"^/(?:v{API_MAJOR_VERSION}/)?([^/]+)")
+
+
+class DispatchError(Exception):
+    """Raised by :meth:`DispatchResponse.raise_for_status` for error responses."""
+
+    def __init__(self, status_code: int, detail: Any):
+        super().__init__(f"{status_code}: {detail}")
+        self.status_code = status_code
+        self.detail = detail
+
+
+class DispatchResponse:
+    """Minimal response object mirroring the parts of ``httpx.Response`` we use."""
+
+    def __init__(self, status_code: int, payload: Any):
+        self.status_code = status_code
+        self._payload = payload
+
+    @property
+    def is_success(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    @property
+    def text(self) -> str:
+        if isinstance(self._payload, str):
+            return self._payload
+        return codec.dumps(self._payload).decode("utf-8")
+
+    def json(self) -> Any:
+        if isinstance(self._payload, (bytes, bytearray)):
+            return codec.loads(self._payload)
+        return self._payload
+
+    def raise_for_status(self) -> DispatchResponse:
+        if not self.is_success:
+            detail = (
+                self._payload.get("detail") if isinstance(self._payload, dict) else self._payload
+            )
+            raise DispatchError(self.status_code, detail)
+        return self
+
+
+def _module_name_for(path: str) -> str | None:
+    match = _PREFIX_RX.match(path)
+    return match.group(1) if match else None
+
+
+def _canonical_path(name: str, path: str) -> str:
+    legacy = f"/{name}"
+    if path == legacy or path.startswith(legacy + "/"):
+        return f"/v{API_MAJOR_VERSION}{path}"
+    return path
+
+
+def _jsonable(result: Any) -> Any:
+    if hasattr(result, "to_payload"):
+        return result.to_payload()
+    body = getattr(result, "body", None)
+    if isinstance(body, (bytes, bytearray)) and hasattr(result, "status_code"):
+        media_type = getattr(result, "media_type", "") or ""
+        if "json" in media_type or codec.is_msgpack(media_type):
+            return codec.decode_body(body, media_type)
+        return body.decode(getattr(result, "charset", "utf-8") or "utf-8")
+    try:
+        from fastapi.encoders import jsonable_encoder
+    except ImportError:  # pragma: no cover - vendored FastAPI stub
+        return result
+    return jsonable_encoder(result)
+
+
+# Request machinery the in-process path does not emulate; such routes go over HTTP.
+_UNBINDABLE_PARAMS = (
+    "header_params",
+    "cookie_params",
+    "dependencies",
+    "request_param_name",
+    "websocket_param_name",
+    "http_connection_param_name",
+    "response_param_name",
+    "background_tasks_param_name",
+    "security_scopes_param_name",
+)
+
+
+def _loop_is_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _missing_field_error(loc: tuple[str, ...]) -> dict[str, Any]:
+    return {"type": "missing", "loc": loc, "msg": "Field required", "input": None}
+
+
+def _validate_field(field: Any, value: Any, loc: tuple[str, ...]) -> tuple[Any, list[Any]]:
+    if value is None:
+        if field.required:
+            return None, [_missing_field_error(loc)]
+        return field.get_default(), []
+    value, errors = field.validate(value, {}, loc=loc)
+    return value, list(errors or [])
+
+
+class RouteBinding:
+    """Bind HTTP-style inputs to a route's parameters the way FastAPI does.
+
+    Parameters are classified by the route's ``dependant`` (path, query and
+    body fields) and validated with the same field definitions, so a call
+    dispatched in-process sees the arguments and 422 errors an HTTP request
+    would.  :meth:`for_route` returns ``None`` for routes that need headers,
+    cookies, ``Depends``, ``Request`` or form data.
+    """
+
+    def __init__(self, dependant: Any, status_code: int | None):
+        self.path_fields = list(dependant.path_params)
+        self.query_fields = list(dependant.query_params)
+        self.body_fields = list(dependant.body_params)
+        first = self.body_fields[0] if self.body_fields else None
+        self.embed_body = len(self.body_fields) > 1 or bool(
+            getattr(getattr(first, "field_info", None), "embed", False),
+        )
+        self.status_code = status_code or 200
+
+    @classmethod
+    def for_route(cls, route: Any) -> RouteBinding | None:
+        dependant = getattr(route, "dependant", None)
+        if dependant is None or any(getattr(dependant, name, None) for name in _UNBINDABLE_PARAMS):
+            return None
+        from fastapi import params as fastapi_params
+
+        if any(
+            isinstance(field.field_info, fastapi_params.Form) for field in dependant.body_params
+        ):
+            return None
+        return cls(dependant, getattr(route, "status_code", None))
+
+    def bind(
+        self,
+        path_params: Mapping[str, Any],
+        params: Mapping[str, Any] | None,
+        body: Any,
+    ) -> tuple[dict[str, Any], list[Any]]:
+        """Return ``(arguments, errors)`` for one call."""
+
+        from fastapi.dependencies.utils import request_params_to_args
+
+        arguments, errors = request_params_to_args(self.path_fields, path_params)
+        query_values, query_errors = request_params_to_args(self.query_fields, params or {})
+        arguments.update(query_values)
+        errors.extend(query_errors)
+        if self.body_fields and not self.embed_body:
+            field = self.body_fields[0]
+            arguments[field.name], body_errors = _validate_field(field, body, ("body",))
+            errors.extend(body_errors)
+        else:
+            received = body if isinstance(body, Mapping) else {}
+            for field in self.body_fields:
+                arguments[field.name], body_errors = _validate_field(
+                    field,
+                    received.get(field.alias),
+                    ("body", field.alias),
+                )
+                errors.extend(body_errors)
+        return arguments, errors
+
+
+class Dispatcher:
+    """Route module API calls in-process, falling back to HTTP for remote modules."""
+
+    def __init__(self, core: Any | None):
+        self.core = core
+        self._routes: dict[str, tuple[Any, list[tuple[list[str], Any, Any]]]] = {}
+        self._bindings: dict[int, tuple[Any, RouteBinding | None]] = {}
+
+    # Resolution --------------------------------------------------------
+
+    def _get_module(self, name: str) -> Any | None:
+        if self.core is None:
+            return None
+        getter = getattr(self.core, "get_module", None)
+        if callable(getter):
+            return getter(name)
+        return getattr(self.core, "modules", {}).get(name)
+
+    def _route_table(self, module: Any) -> list[tuple[list[str], Any, Any]]:
+        cached = self._routes.get(module.name)
+        if cached is not None and cached[0] is module:
+            return cached[1]
+        table = [
+            (_normalise_route_methods(route), getattr(route, "path_regex", None), route)
+            for route in getattr(module.router, "routes", [])
+            if getattr(route, "endpoint", None) is not None
+        ]
+        self._routes[module.name] = (module, table)
+        return table
+
+    def _binding(self, route: Any) -> RouteBinding | None:
+        cached = self._bindings.get(id(route))
+        if cached is not None and cached[0] is route:
+            return cached[1]
+        binding = RouteBinding.for_route(route)
+        if binding is None:
+            log.debug(
+                "Route %s cannot be bound in-process; using HTTP",
+                _normalise_route_path(route),
+            )
+        self._bindings[id(route)] = (route, binding)
+        return binding
+
+    def resolve(self, method: str, path: str) -> tuple[Any, Any, dict[str, Any]] | None:
+        """Return ``(module, route, path_params)`` for a local path, if any."""
+
+        name = _module_name_for(path)
+        if name is None:
+            return None
+        module = self._get_module(name)
+        if module is None:
+            return None
+        path = _canonical_path(name, path)
+        method = method.upper()
+        for methods, regex, route in self._route_table(module):
+            if methods and method not in methods:
+                continue
+            if regex is not None:
+                match = regex.match(path)
+                if match is None:
+                    continue
+                convertors = getattr(route, "param_convertors", {})
+                path_params = {
+                    key: convertors[key].convert(value) if key in convertors else value
+                    for key, value in match.groupdict().items()
+                }
+                return module, route, path_params
+            if _normalise_route_path(route) == path:
+                return module, route, {}
+        return None
+
+    def is_remote(self, path: str) -> bool:
+        name = _module_name_for(path)
+        return self.core is None or settings.remote_base(name or "") is not None
+
+    # Calls -------------------------------------------------------------
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any = None,
+        http_timeout: float | None = None,
+    ) -> Any:
+        """Call ``path`` and return a response exposing ``status_code``/``json()``.
+
+        Async endpoints run on a fresh event loop, so calling one from a thread
+        with a running loop raises :class:`RuntimeError`; use :meth:`arequest`.
+        ``http_timeout`` is the httpx timeout for remote calls; left unset, the
+        pool's per-destination timeout (``COMAN_HTTP_TIMEOUTS``) is used.
+        """
+
+        if self.is_remote(path):
+            return self._http_request(
+                method,
+                path,
+                params=params,
+                json=json,
+                http_timeout=http_timeout,
+            )
+        resolved = self.resolve(method, path)
+        if resolved is None:
+            return DispatchResponse(404, {"detail": "Not Found"})
+        module, route, path_params = resolved
+        binding = self._binding(route)
+        if binding is None:
+            return self._http_request(
+                method,
+                path,
+                params=params,
+                json=json,
+                http_timeout=http_timeout,
+            )
+        return self._call_local(module, route, binding, path_params, params, json)
+
+    def get(self, path: str, **kwargs: Any) -> Any:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> Any:
+        return self.request("POST", path, **kwargs)
+
+    async def arequest(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        json: Any = None,
+        http_timeout: float | None = None,
+    ) -> Any:
+        """Async variant of :meth:`request` for ``async def`` endpoints.
+
+        ``http_timeout`` only configures httpx for remote calls; bound the whole
+        call, local ones included, with ``asyncio.timeout``.
+
+        ``async`` endpoints are awaited on the caller's loop and remote modules
+        use the pooled async client, so neither holds a threadpool slot; sync
+        endpoints still run on the threadpool.
+        """
+
+        if self.is_remote(path):
+            return await self._ahttp_request(
+                method,
+                path,
+                params=params,
+                json=json,
+                http_timeout=http_timeout,
+            )
+        name = _module_name_for(path)
+        if name is not None and name not in getattr(self.core, "modules", {}):
+            from starlette.concurrency import run_in_threadpool
+
+            # Importing a lazily registered module blocks, keep it off the loop.
+            resolved = await run_in_threadpool(self.resolve, method, path)
+        else:
+            resolved = self.resolve(method, path)
+        if resolved is None:
+            return DispatchResponse(404, {"detail": "Not Found"})
+        module, route, path_params = resolved
+        binding = self._binding(route)
+        if binding is None:
+            return await self._ahttp_request(
+                method,
+                path,
+                params=params,
+                json=json,
+                http_timeout=http_timeout,
+            )
+        return await self._acall_local(module, route, binding, path_params, params, json)
+
+    async def aget(self, path: str, **kwargs: Any) -> Any:
+        return await self.arequest("GET", path, **kwargs)
+
+    async def apost(self, path: str, **kwargs: Any) -> Any:
+        return await self.arequest("POST", path, **kwargs)
+
+    @staticmethod
+    def _operation(module: Any, route: Any) -> ConsoleOperation:
+        lookup = getattr(module, "console_operation_for", None)
+        operation = lookup(route) if callable(lookup) else None
+        if operation is not None:
+            return operation
+        endpoint = route.endpoint
+        return ConsoleOperation(
+            name=getattr(endpoint, "__name__", "") or _normalise_route_path(route),
+            route=route,
+            endpoint=endpoint,
+            module_name=module.name,
+            tracer=getattr(module, "_tracer", None),
+        )
+
+    @staticmethod
+    def _error_response(route: Any, exc: Exception) -> DispatchResponse:
+        from fastapi import HTTPException
+
+        if isinstance(exc, HTTPException):
+            return DispatchResponse(exc.status_code, {"detail": exc.detail})
+        if isinstance(exc, TypeError) and "Missing required argument" in str(exc):
+            return DispatchResponse(422, {"detail": str(exc)})
+        log.error("In-process call to %s failed", _normalise_route_path(route), exc_info=exc)
+        return DispatchResponse(500, "Internal Server Error")
+
+    @staticmethod
+    def _success_response(result: Any, status_code: int) -> DispatchResponse:
+        if hasattr(result, "body"):
+            status_code = getattr(result, "status_code", status_code)
+        return DispatchResponse(status_code, _jsonable(result))
+
+    def _call_local(
+        self,
+        module: Any,
+        route: Any,
+        binding: RouteBinding,
+        path_params: Mapping[str, Any],
+        params: Mapping[str, Any] | None,
+        body: Any,
+    ) -> DispatchResponse:
+        operation = self._operation(module, route)
+        if operation.is_async and _loop_is_running():
+            # ``invoke`` would need ``asyncio.run``, which cannot nest in a running loop.
+            raise RuntimeError(
+                f"{_normalise_route_path(route)} is an async endpoint and an event loop is running "
+                "in this thread; use 'await dispatcher.arequest(...)' instead of request()",
+            )
+        try:
+            arguments, errors = binding.bind(path_params, params, body)
+            if errors:
+                return DispatchResponse(422, {"detail": _jsonable(errors)})
+            result = operation.invoke(arguments)
+        except Exception as exc:
+            return self._error_response(route, exc)
+        return self._success_response(result, binding.status_code)
+
+    async def _acall_local(
+        self,
+        module: Any,
+        route: Any,
+        binding: RouteBinding,
+        path_params: Mapping[str, Any],
+        params: Mapping[str, Any] | None,
+        body: Any,
+    ) -> DispatchResponse:
+        operation = self._operation(module, route)
+        if not operation.is_async:
+            from starlette.concurrency import run_in_threadpool
+
+            return await run_in_threadpool(
+                self._call_local,
+                module,
+                route,
+                binding,
+                path_params,
+                params,
+                body,
+            )
+        try:
+            arguments, errors = binding.bind(path_params, params, body)
+            if errors:
+                return DispatchResponse(422, {"detail": _jsonable(errors)})
+            result = await operation.ainvoke(arguments)
+        except Exception as exc:
+            return self._error_response(route, exc)
+        return self._success_response(result, binding.status_code)
+
+    def _remote_url(self, path: str) -> str:
+        base = settings.remote_base(_module_name_for(path) or "") or settings.api_base
+        return f"{base.rstrip('/')}{path}"
+
+    def _http_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None,
+        json: Any,
+        http_timeout: float | None,
+    ) -> Any:
+        from .http import get_http_pool
+
+        headers = self._remote_headers()
+        response = get_http_pool(self.core).request(
+            method,
+            self._remote_url(path),
+            params=params,
+            json=json,
+            **headers,
+            **self._timeout_kwargs(http_timeout),
+        )
+        return self._decode_remote(response) if headers else response
+
+    async def _ahttp_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None,
+        json: Any,
+        http_timeout: float | None,
+    ) -> Any:
+        from .http import get_http_pool
+
+        headers = self._remote_headers()
+        response = await get_http_pool(self.core).arequest(
+            method,
+            self._remote_url(path),
+            params=params,
+            json=json,
+            **headers,
+            **self._timeout_kwargs(http_timeout),
+        )
+        return self._decode_remote(response) if headers else response
+
+    @staticmethod
+    def _timeout_kwargs(timeout: float | None) -> dict[str, Any]:
+        # Unset timeouts are left to the pool's per-destination defaults.
+        return {} if timeout is None else {"http_timeout": timeout}
+
+    @staticmethod
+    def _remote_headers() -> dict[str, Any]:
+        if settings.http_msgpack and codec.msgpack_available():
+            return {"headers": {"Accept": codec.accept_header()}}
+        return {}
+
+    @staticmethod
+    def _decode_remote(response: Any) -> Any:
+        """Unpack a negotiated msgpack body so callers can keep using ``json()``."""
+
+        if codec.is_msgpack(response.headers.get("content-type")):
+            return DispatchResponse(response.status_code, codec.unpackb(response.content))
+        return response
+
+
+def get_dispatcher(core: Any | None) -> Dispatcher:
+    """Return the core's dispatcher, creating a throwaway one for bare cores."""
+
+    dispatcher = getattr(core, "dispatcher", None)
+    if isinstance(dispatcher, Dispatcher):
+        return dispatcher
+    return Dispatcher(core)
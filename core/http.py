@@ -0,0 +1,220 @@
+"""Shared, pooled HTTP clients owned by the core.
+
+Creating an ``httpx.Client`` per call throws away keep-alive connections and
+repeats the TLS handshake every time.  :class:`HttpClientPool` keeps one
+sync and one async client with configurable pool limits, optional HTTP/2 and
+per-destination timeouts.  ``build_fastapi_app`` opens and closes the pool in
+its lifespan; outside the server (CLI, tests) clients are created on first use.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any
+from urllib.parse import urlsplit
+
+from coman.core.config import settings
+
+log = logging.getLogger("coman.http")
+
+# Every live pool, so a short-lived event loop can close the clients it created.
+_POOLS: weakref.WeakSet[HttpClientPool] = weakref.WeakSet()
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpClientPool:
+    """Lazily created ``httpx.Client``/``httpx.AsyncClient`` shared by all modules."""
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        http2: bool = False,
+        timeout: float = 10.0,
+        destination_timeouts: dict[str, float] | None = None,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.timeout = timeout
+        self.destination_timeouts = dict(destination_timeouts or {})
+        self._lock = threading.Lock()
+        self._client: Any | None = None
+        # AsyncClient instances cannot be shared across event loops.
+        self._async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = (
+            weakref.WeakKeyDictionary()
+        )
+        _POOLS.add(self)
+
+    @classmethod
+    def from_settings(cls) -> HttpClientPool:
+        return cls(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive,
+            keepalive_expiry=settings.http_keepalive_expiry,
+            http2=settings.http2,
+            timeout=settings.http_timeout,
+            destination_timeouts=settings.http_destination_timeouts,
+        )
+
+    # Configuration -----------------------------------------------------
+
+    def timeout_for(self, url: str) -> float:
+        """Return the timeout for ``url`` (``host:port`` beats ``host``)."""
+
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        if parts.port is not None:
+            with_port = f"{host}:{parts.port}"
+            if with_port in self.destination_timeouts:
+                return self.destination_timeouts[with_port]
+        return self.destination_timeouts.get(host, self.timeout)
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        import httpx
+
+        http2 = self.http2
+        if http2 and not _http2_available():
+            log.warning("HTTP/2 requested but the 'h2' package is missing; using HTTP/1.1")
+            http2 = False
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "timeout": self.timeout,
+            "http2": http2,
+        }
+
+    # Clients -----------------------------------------------------------
+
+    def get_client(self) -> Any:
+        """Return the sync client, creating it on first use."""
+
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import httpx
+
+                    self._client = httpx.Client(**self._client_kwargs())
+        return self._client
+
+    def get_async_client(self) -> Any:
+        """Return the async client bound to the running event loop.
+
+        The server loop keeps one client for its lifetime; short-lived loops
+        (e.g. ``asyncio.run`` in the CLI) get their own, closed by
+        :func:`aclose_loop_clients` before the loop ends.
+        """
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            import httpx
+
+            client = self._async_clients[loop] = httpx.AsyncClient(**self._client_kwargs())
+        return client
+
+    @property
+    def client(self) -> Any:
+        return self.get_client()
+
+    @property
+    def async_client(self) -> Any:
+        return self.get_async_client()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        http_timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a request; ``http_timeout`` defaults to :meth:`timeout_for` ``url``.
+
+        ``http_timeout`` is httpx's per-operation timeout (connect, read, write,
+        pool acquisition), not a deadline for the whole call.
+        """
+
+        if http_timeout is None:
+            http_timeout = self.timeout_for(url)
+        return self.client.request(method, url, timeout=http_timeout, **kwargs)
+
+    async def arequest(
+        self,
+        method: str,
+        url: str,
+        *,
+        http_timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Async :meth:`request`; bound the whole call with ``asyncio.timeout`` if needed."""
+
+        if http_timeout is None:
+            http_timeout = self.timeout_for(url)
+        return await self.async_client.request(method, url, timeout=http_timeout, **kwargs)
+
+    # Lifespan ----------------------------------------------------------
+
+    async def open(self) -> None:
+        """Create both clients up front so the first request pays no setup."""
+
+        self.get_client()
+        self.get_async_client()
+
+    async def aclose_async_client(self) -> None:
+        """Close the running loop's async client, if one was created."""
+
+        async_client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if async_client is not None:
+            await async_client.aclose()
+
+    async def aclose(self) -> None:
+        await self.aclose_async_client()
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+
+async def aclose_loop_clients() -> None:
+    """Close the async clients every pool created on the running loop."""
+
+    for pool in list(_POOLS):
+        await pool.aclose_async_client()
+
+
+_DEFAULT_POOL: HttpClientPool | None = None
+_DEFAULT_POOL_LOCK = threading.Lock()
+
+
+def get_http_pool(core: Any | None = None) -> HttpClientPool:
+    """Return the core's pool, or a process-wide pool for bare cores."""
+
+    global _DEFAULT_POOL
+    pool = getattr(core, "http", None)
+    if isinstance(pool, HttpClientPool):
+        return pool
+    if _DEFAULT_POOL is None:
+        with _DEFAULT_POOL_LOCK:
+            if _DEFAULT_POOL is None:
+                _DEFAULT_POOL = HttpClientPool.from_settings()
+    return _DEFAULT_POOL
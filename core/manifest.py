@@ -0,0 +1,324 @@
+"""Lightweight discovery of module packages without importing their code."""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import importlib
+import json
+import logging
+import os
+import pkgutil
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from coman.core.config import settings
+
+from coman.version import API_MAJOR_VERSION
+
+log = logging.getLogger("coman.manifest")
+
+MODULES_PACKAGE = "coman.modules"
+MANIFEST_VERSION = 2
+
+_ROOT = Path(__file__).resolve().parents[1]
+# Sources outside the module packages that shape every entry (operation
+# descriptions, module versions); a change to any of them rebuilds the manifest.
+SHARED_SOURCES: tuple[str, ...] = (
+    str(_ROOT / "core" / "base_module.py"),
+    str(_ROOT / "coman" / "version.py"),
+)
+
+
+@dataclass(frozen=True)
+class ModuleSpec:
+    """Statically discovered description of a module package."""
+
+    package: str
+    import_path: str
+    name: str | None = None
+    description: str = ""
+    source: str | None = None
+
+    @property
+    def prefixes(self) -> tuple[str, ...]:
+        if not self.name:
+            return ()
+        return (f"/v{API_MAJOR_VERSION}/{self.name}", f"/{self.name}")
+
+    def owns_path(self, path: str) -> bool:
+        return any(path == prefix or path.startswith(prefix + "/") for prefix in self.prefixes)
+
+
+def _literal_str(node: ast.AST) -> str | None:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def read_module_attributes(source: str) -> dict[str, str]:
+    """Return the literal ``name``/``description`` declared on ``class Module``."""
+
+    try:
+        with open(source, encoding="utf-8") as fh:
+            tree = ast.parse(fh.read(), filename=source)
+    except (OSError, SyntaxError, ValueError):
+        return {}
+    attributes: dict[str, str] = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef) or node.name != "Module":
+            continue
+        for stmt in node.body:
+            if isinstance(stmt, ast.Assign):
+                targets = stmt.targets
+                value = stmt.value
+            elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+                targets = [stmt.target]
+                value = stmt.value
+            else:
+                continue
+            literal = _literal_str(value)
+            if literal is None:
+                continue
+            for target in targets:
+                if isinstance(target, ast.Name) and target.id in {"name", "description"}:
+                    attributes[target.id] = literal
+    return attributes
+
+
+def _find_module_source(search_paths: list[str], short_name: str) -> str | None:
+    for base in search_paths:
+        candidate = os.path.join(base, short_name, "module.py")
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def discover_module_specs(package: str = MODULES_PACKAGE) -> list[ModuleSpec]:
+    """List module packages and read their names without importing ``module.py``."""
+
+    pkg = importlib.import_module(package)
+    search_paths = list(getattr(pkg, "__path__", []))
+    specs: list[ModuleSpec] = []
+    for info in pkgutil.iter_modules(search_paths, pkg.__name__ + "."):
+        if not info.ispkg:
+            continue
+        short_name = info.name.rsplit(".", 1)[-1]
+        source = _find_module_source(search_paths, short_name)
+        attributes = read_module_attributes(source) if source else {}
+        specs.append(
+            ModuleSpec(
+                package=info.name,
+                import_path=f"{info.name}.module",
+                name=attributes.get("name"),
+                description=attributes.get("description", ""),
+                source=source,
+            ),
+        )
+    log.debug("Discovered %d module packages under %s", len(specs), package)
+    return specs
+
+
+# Persisted operation manifest ------------------------------------------------
+
+
+def manifest_path() -> Path:
+    return Path(settings.cache_dir) / "module_manifest.json"
+
+
+def _sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(65536), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _package_files(package_dir: str) -> list[str]:
+    files: list[str] = []
+    for root, dirs, names in os.walk(package_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for filename in sorted(names):
+            if filename.endswith(".py"):
+                files.append(os.path.join(root, filename))
+    return files
+
+
+def _fingerprint_files(base_dir: str, paths: Iterable[str]) -> list[dict[str, Any]]:
+    entries: list[dict[str, Any]] = []
+    for path in paths:
+        st = os.stat(path)
+        entries.append(
+            {
+                "path": os.path.relpath(path, base_dir),
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "sha256": _sha256_file(path),
+            },
+        )
+    return entries
+
+
+def fingerprint_package(package_dir: str) -> list[dict[str, Any]]:
+    """Return ``path``/``mtime_ns``/``size``/``sha256`` for every source file."""
+
+    return _fingerprint_files(package_dir, _package_files(package_dir))
+
+
+def fingerprint_shared_sources() -> list[dict[str, Any]]:
+    """Fingerprint :data:`SHARED_SOURCES` (missing files are skipped)."""
+
+    return _fingerprint_files(str(_ROOT), [p for p in SHARED_SOURCES if os.path.isfile(p)])
+
+
+def _fingerprint_matches(
+    base_dir: str,
+    paths: Iterable[str],
+    recorded: Iterable[dict[str, Any]],
+) -> tuple[bool, bool]:
+    """Return ``(valid, touched)`` for a fingerprint recorded for ``paths``."""
+
+    recorded = list(recorded)
+    current = {os.path.relpath(p, base_dir) for p in paths}
+    if current != {item.get("path") for item in recorded}:
+        return False, False
+    touched = False
+    for item in recorded:
+        path = os.path.join(base_dir, item["path"])
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False, False
+        if st.st_mtime_ns == item.get("mtime_ns") and st.st_size == item.get("size"):
+            continue
+        # The file was touched; only a content change invalidates the entry.
+        if st.st_size != item.get("size") or _sha256_file(path) != item.get("sha256"):
+            return False, False
+        item["mtime_ns"] = st.st_mtime_ns
+        touched = True
+    return True, touched
+
+
+class ModuleManifest:
+    """On-disk cache of module descriptions and console operations.
+
+    Entries are keyed by the module package and carry the mtime, size and
+    SHA-256 of every source file, so listing modules does not require
+    importing them until their sources change.  The manifest as a whole also
+    records :data:`SHARED_SOURCES` and is dropped when one of them changes.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = Path(path) if path is not None else manifest_path()
+        # Set by :meth:`split` when cached mtimes were refreshed after a re-hash.
+        self.touched = False
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        try:
+            with self.path.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        shared = [p for p in SHARED_SOURCES if os.path.isfile(p)]
+        valid, touched = _fingerprint_matches(str(_ROOT), shared, data.get("shared") or [])
+        if not valid:
+            return {}
+        self.touched = self.touched or touched
+        modules = data.get("modules")
+        return modules if isinstance(modules, dict) else {}
+
+    def save(self, entries: dict[str, dict[str, Any]]) -> None:
+        try:
+            payload = {
+                "version": MANIFEST_VERSION,
+                "shared": fingerprint_shared_sources(),
+                "modules": entries,
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError:
+            log.debug("Unable to persist module manifest to %s", self.path, exc_info=True)
+
+    def split(
+        self,
+        specs: Iterable[ModuleSpec],
+    ) -> tuple[dict[str, dict[str, Any]], list[ModuleSpec]]:
+        """Return the still-valid cached entries and the specs needing a rebuild."""
+
+        cached = self.load()
+        fresh: dict[str, dict[str, Any]] = {}
+        stale: list[ModuleSpec] = []
+        for spec in specs:
+            entry = cached.get(spec.package)
+            package_dir = os.path.dirname(spec.source) if spec.source else None
+            if entry is None or package_dir is None or entry.get("import_path") != spec.import_path:
+                stale.append(spec)
+                continue
+            valid, touched = _fingerprint_matches(
+                package_dir,
+                _package_files(package_dir),
+                entry.get("files", []),
+            )
+            if valid:
+                fresh[spec.package] = entry
+                self.touched = self.touched or touched
+            else:
+                stale.append(spec)
+        return fresh, stale
+
+
+def build_manifest_entry(spec: ModuleSpec, module: Any) -> dict[str, Any]:
+    package_dir = os.path.dirname(spec.source) if spec.source else None
+    return {
+        "name": module.name,
+        "import_path": spec.import_path,
+        "description": module.description,
+        "version": module.version,
+        "operations": module.describe_console_operations(),
+        "files": fingerprint_package(package_dir) if package_dir else [],
+    }
+
+
+def describe_modules(*, refresh: bool = False) -> list[dict[str, Any]]:
+    """Describe every module, importing only those whose sources changed."""
+
+    specs = discover_module_specs()
+    manifest = ModuleManifest()
+    if refresh:
+        fresh, stale = {}, list(specs)
+    else:
+        fresh, stale = manifest.split(specs)
+    if stale:
+        from .registry import Core, load_module
+
+        core = Core()
+        for spec in stale:
+            module = load_module(core, spec.import_path)
+            if module is not None and spec.source:
+                fresh[spec.package] = build_manifest_entry(spec, module)
+    if stale or manifest.touched:
+        manifest.save(
+            {spec.package: fresh[spec.package] for spec in specs if spec.package in fresh},
+        )
+    described: list[dict[str, Any]] = []
+    for spec in specs:
+        entry = fresh.get(spec.package)
+        if entry is None:
+            continue
+        described.append(
+            {
+                "name": entry["name"],
+                "description": entry.get("description", ""),
+                "version": entry.get("version"),
+                "operations": entry.get("operations", []),
+            },
+        )
+    return described
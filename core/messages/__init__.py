@@ -1,5 +1,13 @@
 from .base import ModuleMessage, ModuleRequest, ModuleResponse
-from .manager import ToolDefinition, ToolRegistry, ManagerRunRequest, ManagerRunResult
+from .manager import (
+    ToolDefinition,
+    ToolRegistry,
+    ManagerBatchRequest,
+    ManagerRunRequest,
+    ManagerRunResult,
+    PlanStep,
+    PlanStepResult,
+)
 from .integration import IntegrationDefinition, IntegrationRegistry, IntegrationCallRequest, IntegrationCallResult
 from .orchestrator import Capability, CapabilityRegistry
 
@@ -9,8 +17,11 @@ __all__ = [
     "ModuleResponse",
     "ToolDefinition",
     "ToolRegistry",
+    "ManagerBatchRequest",
     "ManagerRunRequest",
     "ManagerRunResult",
+    "PlanStep",
+    "PlanStepResult",
     "IntegrationDefinition",
     "IntegrationRegistry",
     "IntegrationCallRequest",
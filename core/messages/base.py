@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Type, TypeVar
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
 try:  # pragma: no cover - compatibility shim
     from pydantic import BaseModel, ConfigDict, ValidationError
@@ -8,9 +10,99 @@ except ImportError:  # pragma: no cover
     from pydantic import BaseModel, ValidationError  # type: ignore
     ConfigDict = None  # type: ignore
 
+try:  # pragma: no cover - the vendored stub has no private attributes
+    from pydantic import PrivateAttr
+except ImportError:  # pragma: no cover
+    PrivateAttr = None  # type: ignore
+
+try:  # pragma: no cover - Pydantic v2 only
+    from pydantic import model_serializer
+except ImportError:  # pragma: no cover
+    model_serializer = None  # type: ignore
+
 T = TypeVar("T", bound="ModuleMessage")
 
 
+@dataclass(frozen=True)
+class _MessageSpec:
+    """Per-class validation shortcuts, built on first use."""
+
+    field_names: frozenset[str]
+    # Field names plus aliases; the keys kept by the lenient path.
+    payload_keys: frozenset[str]
+    # With ``extra="ignore"`` unknown keys are dropped by validation itself.
+    ignores_extra: bool
+    validate: Callable[[Any], Any]
+    # Pydantic v2 rejects non-mapping input outright unless ``from_attributes``.
+    mapping_only: bool
+    # Validates and sets one field in place (Pydantic v2 only); ``None`` makes
+    # ``clone`` fall back to a full round trip.
+    assign: Callable[[Any, str, Any], Any] | None
+
+
+_SPECS: dict[type, _MessageSpec] = {}
+
+_MISSING = object()
+
+
+def _private_attr(model: Any, name: str) -> Any:
+    """Return a private attribute of ``model``, or ``None`` when unset.
+
+    On Pydantic v2 ``model._name`` first fails the regular lookup and then
+    goes through ``BaseModel.__getattr__`` (several microseconds); reading
+    ``__pydantic_private__`` directly is a plain dict lookup.
+    """
+
+    private = getattr(model, "__pydantic_private__", None)
+    if private is not None:
+        return private.get(name)
+    return getattr(model, name, None)
+
+
+def _build_spec(cls: type[ModuleMessage]) -> _MessageSpec:
+    fields = getattr(cls, "model_fields", None) or getattr(cls, "__fields__", None) or {}
+    keys = set(fields)
+    for info in fields.values():
+        alias = getattr(info, "alias", None)
+        if isinstance(alias, str):
+            keys.add(alias)
+
+    config = getattr(cls, "model_config", None)
+    if isinstance(config, dict):
+        extra = config.get("extra")
+    else:  # pragma: no cover - Pydantic v1
+        extra = getattr(getattr(cls, "__config__", None), "extra", None)
+    extra = getattr(extra, "value", extra) or "ignore"
+
+    validator = getattr(cls, "__pydantic_validator__", None)
+    complete = getattr(cls, "__pydantic_complete__", False)
+    compiled = complete and hasattr(validator, "validate_python")
+    if compiled:
+        validate = validator.validate_python
+    elif hasattr(cls, "model_validate"):
+        validate = cls.model_validate  # type: ignore[attr-defined]
+    else:  # pragma: no cover - Pydantic v1
+        validate = cls.parse_obj  # type: ignore[attr-defined]
+
+    # A custom ``__init__`` normalises values, so updated fields must go through it.
+    subclasses = cls.__mro__[: cls.__mro__.index(ModuleMessage)]
+    custom_init = any("__init__" in vars(klass) for klass in subclasses)
+    assign = None
+    if compiled and not custom_init and hasattr(cls, "model_copy"):
+        assign = getattr(validator, "validate_assignment", None)
+
+    from_attributes = isinstance(config, dict) and config.get("from_attributes")
+    mapping_only = bool(compiled) and not from_attributes
+    return _MessageSpec(
+        frozenset(fields),
+        frozenset(keys),
+        extra == "ignore",
+        validate,
+        mapping_only,
+        assign,
+    )
+
+
 class ModuleMessage(BaseModel):
     """Base class for serialisable messages exchanged between modules."""
 
@@ -22,28 +114,41 @@ class ModuleMessage(BaseModel):
             extra = "ignore"
 
     @classmethod
-    def from_payload(cls: Type[T], payload: Any | None = None) -> T:
-        """Create an instance from arbitrary payload data."""
+    def _message_spec(cls) -> _MessageSpec:
+        spec = _SPECS.get(cls)
+        if spec is None:
+            spec = _SPECS[cls] = _build_spec(cls)
+        return spec
+
+    @classmethod
+    def from_payload(cls: type[T], payload: Any | None = None) -> T:
+        """Create an instance from arbitrary payload data.
+
+        Mappings are validated exactly once: unknown keys are dropped up front
+        (or by validation when the model ignores extras), so an invalid value
+        raises immediately instead of being validated a second time.
+        """
 
         if isinstance(payload, cls):
             return payload
+        spec = _SPECS.get(cls) or cls._message_spec()
         if payload is None:
             payload = {}
-        try:
-            if hasattr(cls, "model_validate"):  # Pydantic v2
-                return cls.model_validate(payload)  # type: ignore[attr-defined]
-            return cls.parse_obj(payload)  # type: ignore[call-arg]
-        except ValidationError:
-            # fall back to constructing with the subset of recognised keys
-            data: Dict[str, Any] = {}
-            for field in getattr(cls, "model_fields", getattr(cls, "__fields__", {})):
-                if isinstance(payload, dict) and field in payload:
-                    data[field] = payload[field]
-            if hasattr(cls, "model_validate"):
-                return cls.model_validate(data)  # type: ignore[attr-defined]
-            return cls.parse_obj(data)  # type: ignore[call-arg]
-
-    def to_payload(self) -> Dict[str, Any]:
+        elif type(payload) is not dict:
+            if not isinstance(payload, Mapping):
+                # Not a mapping: try the object as-is, else fall back to defaults.
+                if spec.mapping_only:
+                    return spec.validate({})
+                try:
+                    return spec.validate(payload)
+                except ValidationError:
+                    return spec.validate({})
+            payload = dict(payload)
+        if not spec.ignores_extra:
+            payload = {key: value for key, value in payload.items() if key in spec.payload_keys}
+        return spec.validate(payload)
+
+    def to_payload(self) -> dict[str, Any]:
         """Return a plain JSON-serialisable payload."""
 
         if hasattr(self, "model_dump"):
@@ -51,9 +156,30 @@ class ModuleMessage(BaseModel):
         return self.dict(exclude_none=True)  # type: ignore[call-arg]
 
     def clone(self: T, **updates: Any) -> T:
-        data = self.to_payload()
-        data.update(updates)
-        return self.__class__.from_payload(data)
+        """Return a copy with ``updates`` applied; unknown names are ignored.
+
+        On Pydantic v2 models without a custom ``__init__`` this is a shallow
+        ``model_copy`` that validates only the updated fields; otherwise the
+        current field values are validated again.  Either way nested values
+        may be shared with the original.
+        """
+
+        spec = self._message_spec()
+        if spec.assign is None:
+            # Re-run validation (and any custom ``__init__``) from the current
+            # field values; nested models are reused rather than re-dumped.
+            data = {}
+            for name in spec.field_names:
+                value = getattr(self, name, None)
+                if value is not None:
+                    data[name] = value
+            data.update(updates)
+            return self.__class__.from_payload(data)
+        copy = self.model_copy()  # type: ignore[attr-defined]
+        for name, value in updates.items():
+            if name in spec.field_names:
+                spec.assign(copy, name, value)
+        return copy
 
 
 class ModuleRequest(ModuleMessage):
@@ -62,3 +188,110 @@ class ModuleRequest(ModuleMessage):
 
 class ModuleResponse(ModuleMessage):
     """Marker base class for response payloads."""
+
+
+@dataclass
+class _NameIndex:
+    """Name index of a :class:`NamedItemRegistry` and the list it mirrors."""
+
+    items: list[Any]
+    # Length of ``items`` when last indexed; later entries were appended directly.
+    indexed: int
+    entries: dict[str, Any]
+    # The list lags behind ``entries`` (an update, a delete or a duplicate name).
+    stale: bool = False
+
+
+class NamedItemRegistry(ModuleResponse):
+    """Response holding a list of named items, indexed by name.
+
+    Registry operations work on an insertion-ordered ``name -> item`` dict, so
+    lookups, updates and deletes are O(1); an updated name keeps its position.
+    The list field is the serialised representation and is rewritten from the
+    dict when serialised.  Duplicate names collapse once, at validation: the
+    last entry wins, at the position of the first occurrence.
+
+    Entries appended to the list directly are picked up by the next registry
+    call and assigning a new list re-indexes it; other in-place edits of the
+    list bypass the index.
+    """
+
+    if PrivateAttr is not None:
+        _name_index: _NameIndex | None = PrivateAttr(default=None)
+
+    if model_serializer is not None:
+
+        # No return annotation: it would replace the serialisation JSON schema.
+        @model_serializer(mode="wrap")
+        def _serialise_synced(self, handler: Callable[[Any], Any]):
+            self._sync_items()
+            return handler(self)
+
+    def model_post_init(self, context: Any, /) -> None:
+        super().model_post_init(context)
+        self._sync_items()
+
+    def _items(self) -> list[Any]:  # pragma: no cover - overridden
+        raise NotImplementedError
+
+    @staticmethod
+    def _item_name(item: Any) -> str:
+        return item["name"] if isinstance(item, dict) else item.name
+
+    def _index(self) -> _NameIndex:
+        items = self._items()
+        state = _private_attr(self, "_name_index")
+        if state is None or state.items is not items or len(items) < state.indexed:
+            entries = {self._item_name(item): item for item in items}
+            state = _NameIndex(items, len(items), entries, len(entries) != len(items))
+            self._name_index = state
+        elif len(items) > state.indexed:
+            for item in items[state.indexed :]:
+                state.entries[self._item_name(item)] = item
+            state.indexed = len(items)
+            state.stale = state.stale or len(state.entries) != len(items)
+        return state
+
+    def _sync_items(self) -> None:
+        """Rewrite the list field from the index if it fell behind."""
+
+        state = self._index()
+        if state.stale:
+            state.items[:] = state.entries.values()
+            state.indexed = len(state.items)
+            state.stale = False
+
+    def _mark_stale(self, state: _NameIndex) -> None:
+        state.stale = True
+        if model_serializer is None:  # pragma: no cover - stub and Pydantic v1
+            # Nested dumps read the list field directly, so keep it current.
+            self._sync_items()
+
+    def get_item(self, name: str) -> Any | None:
+        return self._index().entries.get(name)
+
+    def put_item(self, item: Any) -> None:
+        state = self._index()
+        name = self._item_name(item)
+        if name in state.entries:
+            state.entries[name] = item
+            self._mark_stale(state)
+            return
+        state.entries[name] = item
+        if not state.stale:
+            state.items.append(item)
+            state.indexed += 1
+
+    def remove_item(self, name: str) -> bool:
+        state = self._index()
+        if state.entries.pop(name, _MISSING) is _MISSING:
+            return False
+        self._mark_stale(state)
+        return True
+
+    def names(self) -> list[str]:
+        return list(self._index().entries)
+
+    def to_payload(self) -> dict[str, Any]:
+        self._sync_items()
+        return super().to_payload()
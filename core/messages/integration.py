@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any
 
 try:  # pragma: no cover - optional import (pydantic v1 compatibility)
     from pydantic import Field
 except ImportError:  # pragma: no cover
     from pydantic import Field  # type: ignore
 
-from .base import ModuleRequest, ModuleResponse
+from .base import ModuleRequest, ModuleResponse, NamedItemRegistry, PrivateAttr, _private_attr
 
 
 class IntegrationDefinition(ModuleResponse):
@@ -17,7 +17,12 @@ class IntegrationDefinition(ModuleResponse):
     path: str
     module: str
     callable: str
-    sig: Optional[str] = None
+    sig: str | None = None
+    # Warm worker pool for non-inproc calls; unset fields use COMAN_INTEGRATION_* defaults.
+    pool_size: int | None = None
+    pool_warmup: int | None = None
+    worker_max_calls: int | None = None
+    worker_max_rss_mb: float | None = None
 
     def __init__(self, **data: Any) -> None:  # pragma: no cover - invoked by FastAPI
         super().__init__(**data)
@@ -29,44 +34,63 @@ class IntegrationDefinition(ModuleResponse):
             self.sig = self.sig.strip()
 
 
-class IntegrationRegistry(ModuleResponse):
+class IntegrationRegistry(NamedItemRegistry):
     """Collection of registered integrations."""
 
-    integrations: List[IntegrationDefinition] = Field(default_factory=list)
+    integrations: list[IntegrationDefinition] = Field(default_factory=list)
+
+    if PrivateAttr is not None:
+        # (list, count): the first ``count`` entries of ``list`` are validated models.
+        _validated: tuple[list[Any], int] | None = PrivateAttr(default=None)
 
     def __init__(self, **data: Any) -> None:
         super().__init__(**data)
         self._ensure_models()
 
+    def _items(self) -> list[IntegrationDefinition]:
+        return self.integrations
+
     def upsert(self, integration: IntegrationDefinition) -> None:
         self._ensure_models()
-        current = [it for it in self.integrations if it.name != integration.name]
-        current.append(integration)
-        self.integrations = current
+        if not isinstance(integration, IntegrationDefinition):
+            integration = IntegrationDefinition.from_payload(integration)
+        self.put_item(integration)
+        self._validated = (self.integrations, len(self.integrations))
+
+    def find(self, name: str) -> IntegrationDefinition | None:
+        self._ensure_models()
+        return self.get_item(name)
 
-    def find(self, name: str) -> Optional[IntegrationDefinition]:
+    def delete(self, name: str) -> bool:
         self._ensure_models()
-        for it in self.integrations:
-            if it.name == name:
-                return it
-        return None
+        removed = self.remove_item(name)
+        self._validated = (self.integrations, len(self.integrations))
+        return removed
 
     def _ensure_models(self) -> None:
-        converted: List[IntegrationDefinition] = []
-        for item in self.integrations:
-            if isinstance(item, IntegrationDefinition):
-                converted.append(item)
-            else:
-                converted.append(IntegrationDefinition.from_payload(item))
-        self.integrations = converted
+        """Validate raw entries appended since the last call; a no-op when clean."""
+
+        items = self.integrations
+        state = _private_attr(self, "_validated")
+        start = 0
+        if state is not None and state[0] is items and state[1] <= len(items):
+            start = state[1]
+            if start == len(items):
+                return
+        # Converted in place so the name index keeps tracking the same list.
+        for position in range(start, len(items)):
+            item = items[position]
+            if not isinstance(item, IntegrationDefinition):
+                items[position] = IntegrationDefinition.from_payload(item)
+        self._validated = (items, len(items))
 
 
 class IntegrationCallRequest(ModuleRequest):
     """Request payload for executing an integration."""
 
     name: str
-    callable: Optional[str] = None
-    kwargs: Dict[str, Any] = Field(default_factory=dict)
+    callable: str | None = None
+    kwargs: dict[str, Any] = Field(default_factory=dict)
     mode: str = "inproc"
     verify_sig: bool = True
 
@@ -85,6 +109,6 @@ class IntegrationCallResult(ModuleResponse):
     """Response returned by the integration module."""
 
     result: Any | None = None
-    stdout: Optional[str] = None
-    stderr: Optional[str] = None
-    ok: Optional[bool] = None
+    stdout: str | None = None
+    stderr: str | None = None
+    ok: bool | None = None
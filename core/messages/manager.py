@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional
+from collections.abc import Iterable
+from typing import Any
 
 try:  # pragma: no cover - optional import (pydantic v1 compatibility)
     from pydantic import Field
 except ImportError:  # pragma: no cover
     from pydantic import Field  # type: ignore
 
-from .base import ModuleMessage, ModuleRequest, ModuleResponse
+from .base import ModuleMessage, ModuleRequest, ModuleResponse, NamedItemRegistry
 
 
 class ToolDefinition(ModuleMessage):
@@ -16,48 +17,92 @@ class ToolDefinition(ModuleMessage):
     name: str
     method: str = "GET"
     path: str
-    params: List[str] = Field(default_factory=list)
+    params: list[str] = Field(default_factory=list)
     desc: str = ""
+    # Goal routing hints for the manager: trigger words and regex patterns.
+    keywords: list[str] | None = None
+    patterns: list[str] | None = None
+    # Manager result caching; ``cache_ttl`` (seconds) defaults to COMAN_MANAGER_CACHE_TTL.
+    cacheable: bool = False
+    cache_ttl: float | None = None
 
     def __init__(self, **data: Any) -> None:  # pragma: no cover - exercised via endpoints
-        params = data.get("params")
-        if isinstance(params, str):
-            data["params"] = [p.strip() for p in params.split(",") if p.strip()]
+        for key in ("params", "keywords"):
+            value = data.get(key)
+            if isinstance(value, str):
+                data[key] = [p.strip() for p in value.split(",") if p.strip()]
         super().__init__(**data)
         self.method = (self.method or "GET").upper()
         self.params = [p for p in (self.params or []) if p]
 
 
-class ToolRegistry(ModuleResponse):
+class ToolRegistry(NamedItemRegistry):
     """Collection of tools registered in the system."""
 
-    tools: List[ToolDefinition] = Field(default_factory=list)
+    tools: list[ToolDefinition] = Field(default_factory=list)
+
+    def _items(self) -> list[ToolDefinition]:
+        return self.tools
 
     def upsert(self, tool: ToolDefinition) -> None:
-        existing = [t for t in self.tools if t.name != tool.name]
-        existing.append(tool)
-        self.tools = existing
+        self.put_item(tool)
 
-    def find(self, name: str) -> Optional[ToolDefinition]:
-        for tool in self.tools:
-            if tool.name == name:
-                return tool
-        return None
+    def find(self, name: str) -> ToolDefinition | None:
+        return self.get_item(name)
 
-    def names(self) -> List[str]:
-        return [t.name for t in self.tools]
+    def delete(self, name: str) -> bool:
+        return self.remove_item(name)
 
     @classmethod
-    def from_tools(cls, tools: Iterable[ToolDefinition]) -> "ToolRegistry":
+    def from_tools(cls, tools: Iterable[ToolDefinition]) -> ToolRegistry:
         return cls(tools=list(tools))
 
 
+class PlanStep(ModuleMessage):
+    """One tool call of a multi-step plan.
+
+    String values in ``inputs`` may reference the output of an earlier step as
+    ``"${step_id}"`` or ``"${step_id.path.to.value}"``; referenced steps are
+    implicit dependencies in addition to ``depends_on``.
+    """
+
+    id: str
+    tool: str
+    inputs: dict[str, Any] = Field(default_factory=dict)
+    depends_on: list[str] = Field(default_factory=list)
+    # Seconds; the manager's default step timeout applies when unset.
+    timeout: float | None = None
+
+    def __init__(self, **data: Any) -> None:  # pragma: no cover - via FastAPI
+        if not isinstance(data.get("inputs"), dict):
+            data["inputs"] = {}
+        depends_on = data.get("depends_on")
+        if isinstance(depends_on, str):
+            data["depends_on"] = [d.strip() for d in depends_on.split(",") if d.strip()]
+        elif not depends_on:
+            data["depends_on"] = []
+        super().__init__(**data)
+
+
+class PlanStepResult(ModuleResponse):
+    """Outcome of a plan step: ``ok``, ``error``, ``timeout`` or ``cancelled``."""
+
+    id: str
+    tool: str
+    status: str = "ok"
+    query: dict[str, Any] = Field(default_factory=dict)
+    result: Any | None = None
+    error: str | None = None
+    latency_ms: float | None = None
+
+
 class ManagerRunRequest(ModuleRequest):
     """Request payload for the manager's /run endpoint."""
 
     goal: str = ""
-    inputs: Dict[str, Any] = Field(default_factory=dict)
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    inputs: dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = Field(default_factory=dict)
+    plan: list[PlanStep] | None = None
 
     def __init__(self, **data: Any) -> None:  # pragma: no cover - via FastAPI
         inputs = data.get("inputs") or {}
@@ -67,21 +112,48 @@ class ManagerRunRequest(ModuleRequest):
         if not isinstance(metadata, dict):
             metadata = {}
         data.update({"inputs": inputs, "metadata": metadata})
+        plan = data.get("plan")
+        if plan is not None:
+            data["plan"] = [PlanStep.from_payload(step) for step in plan]
         super().__init__(**data)
         self.goal = (self.goal or "").strip()
 
 
+class ManagerBatchRequest(ModuleRequest):
+    """Request payload for the manager's /run-batch endpoint.
+
+    Each entry of ``goals`` is a goal string or a :class:`ManagerRunRequest`
+    payload.  ``concurrency`` can only lower the server-side limit.
+    """
+
+    goals: list[ManagerRunRequest] = Field(default_factory=list)
+    concurrency: int | None = None
+
+    def __init__(self, **data: Any) -> None:  # pragma: no cover - via FastAPI
+        goals = data.get("goals") or []
+        if not isinstance(goals, list):
+            goals = []
+        data["goals"] = [
+            ManagerRunRequest.from_payload({"goal": item} if isinstance(item, str) else item)
+            for item in goals
+        ]
+        super().__init__(**data)
+
+
 class ManagerRunResult(ModuleResponse):
     """Structured response returned by the manager."""
 
     goal: str = ""
-    tool: Optional[str] = None
-    query: Dict[str, Any] = Field(default_factory=dict)
+    tool: str | None = None
+    query: dict[str, Any] = Field(default_factory=dict)
     result: Any | None = None
-    error: Optional[str] = None
-    message: Optional[str] = None
-    known_tools: Optional[ToolRegistry] = None
-
-    def set_known_tools(self, registry: ToolRegistry) -> "ManagerRunResult":
+    error: str | None = None
+    message: str | None = None
+    known_tools: ToolRegistry | None = None
+    # Set for plan runs, in plan order.
+    steps: list[PlanStepResult] | None = None
+    latency_ms: float | None = None
+
+    def set_known_tools(self, registry: ToolRegistry) -> ManagerRunResult:
         self.known_tools = registry
         return self
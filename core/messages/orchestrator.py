@@ -1,13 +1,11 @@
 from __future__ import annotations
 
-from typing import List
-
 try:  # pragma: no cover - optional import for pydantic v1
     from pydantic import Field
 except ImportError:  # pragma: no cover
     from pydantic import Field  # type: ignore
 
-from .base import ModuleResponse
+from .base import ModuleResponse, NamedItemRegistry
 
 
 class Capability(ModuleResponse):
@@ -25,10 +23,21 @@ class Capability(ModuleResponse):
         self.description = self.description.strip()
 
 
-class CapabilityRegistry(ModuleResponse):
-    """Registry of capabilities."""
+class CapabilityRegistry(NamedItemRegistry):
+    """Registry of capabilities, unique by name."""
+
+    capabilities: list[Capability] = Field(default_factory=list)
 
-    capabilities: List[Capability] = Field(default_factory=list)
+    def _items(self) -> list[Capability]:
+        return self.capabilities
 
     def add(self, capability: Capability) -> None:
-        self.capabilities.append(capability)
+        """Register ``capability``, replacing an earlier one with the same name."""
+
+        self.put_item(capability)
+
+    def find(self, name: str) -> Capability | None:
+        return self.get_item(name)
+
+    def delete(self, name: str) -> bool:
+        return self.remove_item(name)
@@ -1,24 +1,213 @@
-import importlib, pkgutil
-from typing import Dict, Type
+import importlib
+import logging
+import pkgutil
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any
+
 from .base_module import BaseModule
+from .dispatch import Dispatcher
+from .http import HttpClientPool
+from .manifest import ModuleSpec, discover_module_specs
+
+log = logging.getLogger("coman.registry")
+
+
+@dataclass
+class ModuleStartupRecord:
+    """Timing breakdown for importing and constructing one module."""
+
+    import_path: str
+    name: str | None = None
+    status: str = "loaded"
+    import_s: float = 0.0
+    init_s: float = 0.0
+    tracer_s: float = 0.0
+    lazy: bool = False
+    error: str | None = None
+
+    @property
+    def total_s(self) -> float:
+        return self.import_s + self.init_s
+
+    def to_payload(self) -> dict[str, Any]:
+        data = asdict(self)
+        for key in ("import_s", "init_s", "tracer_s"):
+            data[key.replace("_s", "_ms")] = round(data.pop(key) * 1000, 3)
+        data["total_ms"] = round(self.total_s * 1000, 3)
+        return data
+
+
 class Core:
     def __init__(self):
-        self.modules: Dict[str, BaseModule] = {}
+        self.modules: dict[str, BaseModule] = {}
         self.scheduler = None
-def load_modules(core: Core):
+        # Modules registered by name but not imported yet (lazy mode).
+        self.module_specs: dict[str, ModuleSpec] = {}
+        self.startup_report: list[ModuleStartupRecord] = []
+        self._module_listeners: list[Callable[[BaseModule], None]] = []
+        self._load_lock = threading.RLock()
+        self.dispatcher = Dispatcher(self)
+        self.http = HttpClientPool.from_settings()
+
+    @property
+    def load_timings(self) -> dict[str, float]:
+        return {r.name: r.total_s for r in self.startup_report if r.name and r.status == "loaded"}
+
+    def add_module_listener(self, listener: Callable[[BaseModule], None]) -> None:
+        """Call ``listener`` for every module that is loaded lazily from now on."""
+
+        self._module_listeners.append(listener)
+
+    def pending_modules(self) -> list[str]:
+        return [name for name in self.module_specs if name not in self.modules]
+
+    def resolve_pending(self, path: str) -> str | None:
+        """Return the name of a not-yet-loaded module owning ``path``."""
+
+        for name, spec in self.module_specs.items():
+            if name not in self.modules and spec.owns_path(path):
+                return name
+        return None
+
+    def get_module(self, name: str) -> BaseModule | None:
+        module = self.modules.get(name)
+        if module is not None:
+            return module
+        spec = self.module_specs.get(name)
+        if spec is None:
+            return None
+        with self._load_lock:
+            module = self.modules.get(name)
+            if module is not None:
+                return module
+            module, record = _import_and_construct(self, spec.import_path)
+            record.lazy = True
+            self.startup_report.append(record)
+            if module is None:
+                self.module_specs.pop(name, None)
+                return None
+            if module.name != name:
+                log.warning(
+                    "Module %s declares name %s; dropping lazy entry",
+                    spec.import_path,
+                    module.name,
+                )
+                self.module_specs.pop(name, None)
+            self.modules[module.name] = module
+            log.info("Lazily loaded module %s in %.1f ms", module.name, record.total_s * 1000)
+        for listener in list(self._module_listeners):
+            listener(module)
+        return module
+
+
+def _import_and_construct(
+    core: Core,
+    modname: str,
+) -> tuple[BaseModule | None, ModuleStartupRecord]:
+    record = ModuleStartupRecord(import_path=modname)
+    started = time.perf_counter()
+    try:
+        module = importlib.import_module(modname)
+    except Exception as e:
+        record.import_s = time.perf_counter() - started
+        record.status, record.error = "failed", f"import: {e}"
+        return None, record
+    record.import_s = time.perf_counter() - started
+    cls: type[BaseModule] = getattr(module, "Module", None)
+    if not cls:
+        record.status, record.error = "skipped", "no Module class"
+        return None, record
+    started = time.perf_counter()
+    try:
+        inst = cls(core)
+    except Exception as e:
+        record.init_s = time.perf_counter() - started
+        record.status, record.error = "failed", f"init: {e}"
+        return None, record
+    record.init_s = time.perf_counter() - started
+    record.name = inst.name
+    record.tracer_s = getattr(inst, "_tracer_setup_s", 0.0)
+    return inst, record
+
+
+def _log_record(record: ModuleStartupRecord) -> None:
+    if record.status == "loaded":
+        log.info(
+            "loaded %s from %s (import %.1f ms, init %.1f ms, tracer %.1f ms)",
+            record.name,
+            record.import_path,
+            record.import_s * 1000,
+            record.init_s * 1000,
+            record.tracer_s * 1000,
+        )
+    else:
+        log.warning("skip %s: %s", record.import_path, record.error)
+
+
+def _register(
+    core: Core,
+    inst: BaseModule | None,
+    record: ModuleStartupRecord,
+) -> BaseModule | None:
+    core.startup_report.append(record)
+    _log_record(record)
+    if inst is not None:
+        core.modules[inst.name] = inst
+    return inst
+
+
+def load_module(core: Core, import_path: str) -> BaseModule | None:
+    """Import, construct and register a single module package."""
+
+    return _register(core, *_import_and_construct(core, import_path))
+
+
+def _discover_modnames() -> list[str]:
     pkg = importlib.import_module("coman.modules")
+    modnames: list[str] = []
     for info in pkgutil.iter_modules(pkg.__path__, pkg.__name__ + "."):
         if not info.ispkg:
             continue
-        modname = f"{info.name}.module"
-        try:
-            module = importlib.import_module(modname)
-            cls: Type[BaseModule] = getattr(module, "Module", None)
-            if not cls:
-                print(f"[load_modules] skip {modname}: no Module class"); continue
-            inst = cls(core)
-            core.modules[inst.name] = inst
-            print(f"[load_modules] loaded {inst.name} from {modname}")
-        except Exception as e:
-            print(f"[load_modules] skip {modname}: {e}")
-            continue
+        modnames.append(f"{info.name}.module")
+    return modnames
+
+
+def load_modules(
+    core: Core,
+    *,
+    lazy: bool = False,
+    parallel: bool = False,
+    max_workers: int | None = None,
+) -> list[ModuleStartupRecord]:
+    """Load every module package and return the per-module startup report.
+
+    ``parallel`` imports and constructs modules on a thread pool; modules are
+    still registered in discovery order so routing stays deterministic.
+    """
+
+    modnames = _register_lazy_modules(core) if lazy else _discover_modnames()
+    if parallel and len(modnames) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="coman-init") as pool:
+            futures = [pool.submit(_import_and_construct, core, modname) for modname in modnames]
+            for future in futures:
+                _register(core, *future.result())
+    else:
+        for modname in modnames:
+            _register(core, *_import_and_construct(core, modname))
+    return core.startup_report
+
+
+def _register_lazy_modules(core: Core) -> list[str]:
+    eager: list[str] = []
+    for spec in discover_module_specs():
+        if spec.name:
+            core.module_specs[spec.name] = spec
+        else:
+            # Without a statically readable name we cannot route to the
+            # module, so it is imported right away.
+            eager.append(spec.import_path)
+    return eager
@@ -0,0 +1,108 @@
+"""In-memory cache for the JSON registries under ``settings.data_dir``.
+
+``load_tools``, ``load_reg`` and ``load_caps`` used to re-open, parse and
+re-validate their file on every request.  :class:`RegistryFileCache` keeps the
+parsed registry together with a change signature - the file's
+``(inode, mtime_ns, size)`` for JSON, the version counter for SQLite - and
+checks it at most once per ``COMAN_REGISTRY_STAT_INTERVAL`` seconds.
+:mod:`core.registry_store` loads through :meth:`load_keyed` and drops the
+entry on writes, so the next read re-parses what was written.
+
+Cached registries are shared between requests: treat them as read-only and
+write through :mod:`core.registry_store`.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from coman.core.config import settings
+
+Signature = tuple[int, int, int] | None
+
+
+def file_signature(path: Path | str) -> Signature:
+    """Return ``(inode, mtime_ns, size)`` for ``path`` or ``None`` if it is missing."""
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+@dataclass
+class _Entry:
+    signature: Hashable
+    value: Any
+    checked_at: float
+
+
+class RegistryFileCache:
+    """Parsed-file cache revalidated by ``stat`` with hit/miss counters."""
+
+    def __init__(self, stat_interval: float | None = None):
+        self._stat_interval = stat_interval
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stat_interval(self) -> float:
+        if self._stat_interval is not None:
+            return self._stat_interval
+        return settings.registry_stat_interval
+
+    def load_keyed(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        signature: Callable[[], Hashable],
+    ) -> Any:
+        """Return the cached value for ``key``, calling ``loader`` when ``signature()`` changed."""
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry.checked_at < self.stat_interval:
+                self.hits += 1
+                return entry.value
+        current = signature()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == current:
+                entry.checked_at = now
+                self.hits += 1
+                return entry.value
+            self.misses += 1
+        value = loader()
+        with self._lock:
+            self._entries[key] = _Entry(current, value, now)
+        return value
+
+    def invalidate(self, path: Path | str | None = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(path), None)
+                self._entries.pop(os.path.abspath(path), None)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "stat_interval_s": self.stat_interval,
+            }
+
+
+registry_cache = RegistryFileCache()
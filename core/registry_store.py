@@ -0,0 +1,370 @@
+"""Storage backends for the tool, integration and capability registries.
+
+``COMAN_REGISTRY_BACKEND`` selects where registries live:
+
+* ``json`` (default) - ``tools.json``, ``integrations.json`` and
+  ``capabilities.json`` in ``settings.data_dir``; writes are atomic
+  (temp file + ``os.replace``) and serialised with a lock file.
+* ``sqlite`` - one WAL-mode database (``COMAN_REGISTRY_DB``) with a row per
+  entry, indexed by ``(kind, name)``; upserts touch only the affected rows and
+  run in a single ``BEGIN IMMEDIATE`` transaction.
+
+:func:`copy_registries` imports/exports between the two, and is exposed as
+``python -m coman.modules.main registry import|export``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sqlite3
+import stat
+import tempfile
+import threading
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, TypeVar
+
+from coman.core.config import settings
+
+from .registry_cache import file_signature, registry_cache
+
+try:  # pragma: no cover - POSIX only
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Registry kind == JSON file stem == list field of the registry model.
+KINDS = ("tools", "integrations", "capabilities")
+
+R = TypeVar("R")
+
+
+def _umask_file_mode() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Read once at import: os.umask can only be queried by setting it.
+_NEW_FILE_MODE = _umask_file_mode()
+
+
+def _check_kind(kind: str) -> None:
+    if kind not in KINDS:
+        raise ValueError(f"Unknown registry kind '{kind}'")
+
+
+def _upsert_payload_items(current: list[dict[str, Any]], items: Iterable[dict[str, Any]]) -> None:
+    """Replace entries by name in place, appending unknown names."""
+
+    positions = {item.get("name"): i for i, item in enumerate(current)}
+    for item in items:
+        position = positions.get(item["name"])
+        if position is None:
+            positions[item["name"]] = len(current)
+            current.append(item)
+        else:
+            current[position] = item
+
+
+class JsonRegistryStore:
+    """Registries stored as one JSON document per kind."""
+
+    backend = "json"
+
+    def __init__(self, data_dir: str | Path):
+        self.data_dir = Path(data_dir)
+        self._lock = threading.RLock()
+
+    def path(self, kind: str) -> Path:
+        _check_kind(kind)
+        return self.data_dir / f"{kind}.json"
+
+    def cache_key(self, kind: str) -> str:
+        return os.path.abspath(self.path(kind))
+
+    def signature(self, kind: str) -> Hashable:
+        return file_signature(self.path(kind))
+
+    def read(self, kind: str) -> dict[str, Any]:
+        path = self.path(kind)
+        try:
+            # utf-8-sig tolerates a BOM left by editors on Windows.
+            with path.open("r", encoding="utf-8-sig") as fh:
+                raw_text = fh.read()
+        except FileNotFoundError:
+            return {kind: []}
+        if not raw_text.strip():
+            return {kind: []}
+        data = json.loads(raw_text)
+        return data if isinstance(data, dict) else {kind: []}
+
+    def items(self, kind: str) -> list[dict[str, Any]]:
+        return list(self.read(kind).get(kind) or [])
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            if fcntl is None:
+                yield
+                return
+            with open(self.data_dir / ".registries.lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write(self, kind: str, payload: dict[str, Any]) -> None:
+        path = self.path(kind)
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = _NEW_FILE_MODE
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{kind}.", suffix=".tmp")
+        try:
+            # mkstemp creates 0600 files; keep the mode a plain open() would give.
+            os.chmod(tmp, mode)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, ensure_ascii=False, indent=2)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+            raise
+
+    def write(self, kind: str, payload: dict[str, Any]) -> None:
+        with self._locked():
+            self._write(kind, payload)
+
+    def upsert(self, kind: str, items: Sequence[dict[str, Any]]) -> None:
+        with self._locked():
+            payload = self.read(kind)
+            current = list(payload.get(kind) or [])
+            _upsert_payload_items(current, items)
+            payload[kind] = current
+            self._write(kind, payload)
+
+    def delete(self, kind: str, names: Iterable[str]) -> int:
+        doomed = set(names)
+        with self._locked():
+            payload = self.read(kind)
+            current = list(payload.get(kind) or [])
+            kept = [item for item in current if item.get("name") not in doomed]
+            if len(kept) != len(current):
+                payload[kind] = kept
+                self._write(kind, payload)
+            return len(current) - len(kept)
+
+
+class SqliteRegistryStore:
+    """Registries stored row-per-entry in a WAL-mode SQLite database."""
+
+    backend = "sqlite"
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS registry_items (
+            kind TEXT NOT NULL,
+            name TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            payload TEXT NOT NULL,
+            PRIMARY KEY (kind, name)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS registry_items_order ON registry_items (kind, position)",
+        """
+        CREATE TABLE IF NOT EXISTS registry_versions (
+            kind TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        )
+        """,
+    )
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit mode: transactions are opened explicitly below.
+            conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._schema_lock:
+                if not self._schema_ready:
+                    for statement in self._SCHEMA:
+                        conn.execute(statement)
+                    self._schema_ready = True
+        return conn
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction; ``BEGIN IMMEDIATE`` serialises concurrent writers."""
+
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def cache_key(self, kind: str) -> str:
+        _check_kind(kind)
+        return f"sqlite:{os.path.abspath(self.path)}#{kind}"
+
+    def signature(self, kind: str) -> Hashable:
+        query = "SELECT version FROM registry_versions WHERE kind = ?"
+        row = self._connection().execute(query, (kind,)).fetchone()
+        return row[0] if row else 0
+
+    def items(self, kind: str) -> list[dict[str, Any]]:
+        _check_kind(kind)
+        rows = self._connection().execute(
+            "SELECT payload FROM registry_items WHERE kind = ? ORDER BY position",
+            (kind,),
+        )
+        return [json.loads(payload) for (payload,) in rows]
+
+    def read(self, kind: str) -> dict[str, Any]:
+        return {kind: self.items(kind)}
+
+    def get(self, kind: str, name: str) -> dict[str, Any] | None:
+        query = "SELECT payload FROM registry_items WHERE kind = ? AND name = ?"
+        row = self._connection().execute(query, (kind, name)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, kind: str) -> None:
+        conn.execute(
+            "INSERT INTO registry_versions (kind, version) VALUES (?, 1) "
+            "ON CONFLICT (kind) DO UPDATE SET version = version + 1",
+            (kind,),
+        )
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, kind: str, items: Sequence[dict[str, Any]]) -> None:
+        (next_position,) = conn.execute(
+            "SELECT COALESCE(MAX(position), -1) + 1 FROM registry_items WHERE kind = ?",
+            (kind,),
+        ).fetchone()
+        conn.executemany(
+            "INSERT INTO registry_items (kind, name, position, payload) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (kind, name) DO UPDATE SET payload = excluded.payload",
+            [
+                (kind, item["name"], next_position + offset, json.dumps(item, ensure_ascii=False))
+                for offset, item in enumerate(items)
+            ],
+        )
+
+    def upsert(self, kind: str, items: Sequence[dict[str, Any]]) -> None:
+        _check_kind(kind)
+        with self.transaction() as conn:
+            self._insert(conn, kind, items)
+            self._bump(conn, kind)
+
+    def write(self, kind: str, payload: dict[str, Any]) -> None:
+        _check_kind(kind)
+        items = list(payload.get(kind) or [])
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM registry_items WHERE kind = ?", (kind,))
+            self._insert(conn, kind, items)
+            self._bump(conn, kind)
+
+    def delete(self, kind: str, names: Iterable[str]) -> int:
+        _check_kind(kind)
+        with self.transaction() as conn:
+            removed = conn.executemany(
+                "DELETE FROM registry_items WHERE kind = ? AND name = ?",
+                [(kind, name) for name in names],
+            ).rowcount
+            if removed:
+                self._bump(conn, kind)
+        return removed
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def registry_db_path() -> str:
+    return settings.registry_db or os.path.join(settings.data_dir, "registries.db")
+
+
+_STORES: dict[tuple, Any] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_registry_store(backend: str | None = None) -> JsonRegistryStore | SqliteRegistryStore:
+    """Return the store configured by ``COMAN_REGISTRY_BACKEND`` (or ``backend``)."""
+
+    backend = (backend or settings.registry_backend).lower()
+    if backend == "sqlite":
+        db_path = registry_db_path()
+        key: tuple = ("sqlite", os.path.abspath(db_path))
+        factory = lambda: SqliteRegistryStore(db_path)  # noqa: E731
+    elif backend == "json":
+        key = ("json", os.path.abspath(settings.data_dir))
+        factory = lambda: JsonRegistryStore(settings.data_dir)  # noqa: E731
+    else:
+        raise ValueError(f"Unknown registry backend '{backend}' (expected 'json' or 'sqlite')")
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = _STORES[key] = factory()
+    return store
+
+
+# Registry helpers used by the modules ----------------------------------------
+
+
+def load_registry(kind: str, cls: type[R]) -> R:  # noqa: UP047
+    """Load a cached registry model; it is shared, so write through the helpers below."""
+
+    store = get_registry_store()
+    return registry_cache.load_keyed(
+        store.cache_key(kind),
+        lambda: cls.from_payload(store.read(kind)),  # type: ignore[attr-defined]
+        lambda: store.signature(kind),
+    )
+
+
+def save_registry(kind: str, registry: Any) -> None:
+    """Replace the whole registry ``kind`` with ``registry``."""
+
+    store = get_registry_store()
+    store.write(kind, registry.to_payload())
+    registry_cache.invalidate(store.cache_key(kind))
+
+
+def upsert_registry_items(kind: str, items: Iterable[Any]) -> None:
+    """Insert or replace entries by name without rewriting the other entries."""
+
+    store = get_registry_store()
+    payloads = [item.to_payload() if hasattr(item, "to_payload") else dict(item) for item in items]
+    store.upsert(kind, payloads)
+    registry_cache.invalidate(store.cache_key(kind))
+
+
+def copy_registries(source: Any, target: Any, kinds: Iterable[str] = KINDS) -> dict[str, int]:
+    """Copy every registry ``kind`` from ``source`` to ``target``; returns entry counts."""
+
+    counts: dict[str, int] = {}
+    for kind in kinds:
+        items = source.items(kind)
+        target.write(kind, {kind: items})
+        registry_cache.invalidate(target.cache_key(kind))
+        counts[kind] = len(items)
+    return counts
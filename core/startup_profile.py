@@ -0,0 +1,203 @@
+"""Startup profiler used by ``python -m coman.modules.main profile-startup``.
+
+The profile runs in a child interpreter started with ``-X importtime`` so
+that every import is measured from a cold process without patching the
+import system.  The child loads the core stage by stage and writes a JSON
+report (stage wall time, RSS, ``Module.__init__`` and tracer provider
+timings); the parent merges it with the parsed import timings.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+_ROOT = Path(__file__).resolve().parents[1]
+
+
+def current_rss_bytes() -> int:
+    """Return the resident set size of this process (0 when unknown)."""
+
+    try:
+        with open("/proc/self/statm", encoding="ascii") as fh:
+            resident_pages = int(fh.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in KiB on Linux and bytes on macOS.
+        return int(peak if sys.platform == "darwin" else peak * 1024)
+    except Exception:
+        return 0
+
+
+def collect_stage_report(lazy: bool = False, parallel: bool = False) -> dict[str, Any]:
+    """Load the core stage by stage and return timings and RSS per stage."""
+
+    stages: list[dict[str, Any]] = []
+    state: dict[str, Any] = {}
+
+    def stage(label: str, func: Callable[[], Any]) -> None:
+        rss_before = current_rss_bytes()
+        started = time.perf_counter()
+        func()
+        stages.append(
+            {
+                "stage": label,
+                "seconds": time.perf_counter() - started,
+                "rss_bytes": current_rss_bytes(),
+                "rss_delta_bytes": current_rss_bytes() - rss_before,
+            },
+        )
+
+    def import_core() -> None:
+        from coman.core import registry
+
+        state["registry"] = registry
+
+    def load() -> None:
+        registry = state["registry"]
+        core = registry.Core()
+        registry.load_modules(core, lazy=lazy, parallel=parallel)
+        state["core"] = core
+
+    def build_app() -> None:
+        from coman.core.app import build_fastapi_app
+
+        build_fastapi_app(state["core"])
+
+    baseline = current_rss_bytes()
+    stage("import core", import_core)
+    stage("load_modules", load)
+    stage("build_fastapi_app", build_app)
+
+    from observability import provider_setup_timings
+
+    core = state["core"]
+    return {
+        "baseline_rss_bytes": baseline,
+        "stages": stages,
+        "modules": [record.to_payload() for record in core.startup_report],
+        "tracer_providers": provider_setup_timings(),
+    }
+
+
+def parse_importtime(stderr: str) -> list[dict[str, Any]]:
+    """Parse ``-X importtime`` lines into ``{"module", "self_us", "cumulative_us"}``."""
+
+    imports: list[dict[str, Any]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:  # header line
+            continue
+        imports.append(
+            {"module": parts[2].strip(), "self_us": self_us, "cumulative_us": cumulative_us},
+        )
+    return imports
+
+
+def profile_startup(lazy: bool = False, parallel: bool = False) -> dict[str, Any]:
+    """Profile a cold start in a child interpreter and return the merged report."""
+
+    fd, report_path = tempfile.mkstemp(suffix=".json", prefix="coman-profile-")
+    os.close(fd)
+    command = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-c",
+        "import sys; from coman.modules.main import main; main(sys.argv[1:])",
+        "profile-startup",
+        "--child-report",
+        report_path,
+    ]
+    if lazy:
+        command.append("--lazy")
+    if parallel:
+        command.append("--parallel-init")
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(_ROOT), env.get("PYTHONPATH", "")) if p)
+    try:
+        proc = subprocess.run(command, capture_output=True, text=True, env=env)
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"startup profile failed with exit code {proc.returncode}:\n{proc.stderr[-2000:]}",
+            )
+        with open(report_path, encoding="utf-8") as fh:
+            report = json.load(fh)
+    finally:
+        with contextlib.suppress(OSError):
+            os.remove(report_path)
+    report["imports"] = parse_importtime(proc.stderr)
+    return report
+
+
+def _mib(value: int) -> str:
+    return f"{value / (1024 * 1024):+.1f} MiB"
+
+
+def format_report(report: dict[str, Any], top: int = 25) -> str:
+    """Render a profile report as sorted, human-readable tables."""
+
+    lines: list[str] = []
+    lines.append(f"Baseline RSS: {report.get('baseline_rss_bytes', 0) / (1024 * 1024):.1f} MiB")
+    lines.append("")
+    lines.append("Stages:")
+    for item in report.get("stages", []):
+        lines.append(
+            f"  {item['stage']:<20} {item['seconds'] * 1000:>9.1f} ms"
+            f"  RSS {_mib(item['rss_delta_bytes'])}"
+            f" (now {item['rss_bytes'] / (1024 * 1024):.1f} MiB)",
+        )
+
+    modules = sorted(report.get("modules", []), key=lambda m: m.get("total_ms", 0), reverse=True)
+    lines.append("")
+    lines.append("Modules (import / Module.__init__ / tracer setup):")
+    for item in modules:
+        label = item.get("name") or item.get("import_path")
+        status = (
+            ""
+            if item.get("status") == "loaded"
+            else f"  [{item.get('status')}: {item.get('error')}]"
+        )
+        lines.append(
+            f"  {label:<20} {item.get('import_ms', 0):>9.1f} ms"
+            f" {item.get('init_ms', 0):>9.1f} ms {item.get('tracer_ms', 0):>9.1f} ms{status}",
+        )
+
+    providers = sorted(
+        report.get("tracer_providers", {}).items(),
+        key=lambda kv: kv[1],
+        reverse=True,
+    )
+    lines.append("")
+    lines.append("Tracer provider creation:")
+    for name, seconds in providers:
+        lines.append(f"  {name:<20} {seconds * 1000:>9.1f} ms")
+
+    imports = sorted(report.get("imports", []), key=lambda i: i["cumulative_us"], reverse=True)
+    lines.append("")
+    lines.append(f"Imports (top {top} by cumulative time):")
+    for item in imports[:top]:
+        lines.append(
+            f"  {item['cumulative_us'] / 1000:>9.1f} ms cumulative"
+            f" {item['self_us'] / 1000:>9.1f} ms self  {item['module']}",
+        )
+    return "\n".join(lines)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 from typing import Any, Dict, Iterable
 
 from .exceptions import HTTPException
@@ -39,8 +41,6 @@ class FastAPI:
 
         signature = None
         try:
-            import inspect
-
             signature = inspect.signature(route.endpoint)
         except (TypeError, ValueError):  # pragma: no cover
             signature = None
@@ -58,6 +58,8 @@ class FastAPI:
 
         try:
             result = route.endpoint(**call_kwargs)
+            if inspect.iscoroutine(result):
+                result = asyncio.run(result)
         except HTTPException as exc:
             return Response(status_code=exc.status_code, json_data={"detail": exc.detail})
 
@@ -9,6 +9,7 @@ from fastapi import APIRouter, FastAPI
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from coman.core.codec import CodecNegotiationMiddleware, CodecResponse
 from observability import instrument_fastapi_app, setup_module_observability
 
 
@@ -73,7 +74,9 @@ app = FastAPI(
     summary="Provides text token frequency statistics.",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=CodecResponse,
 )
+app.add_middleware(CodecNegotiationMiddleware)
 instrument_fastapi_app(app, module_name=SERVICE_NAME, module_version="1.0.0")
 app.include_router(router)
 app.include_router(legacy_router)
@@ -1,8 +1,8 @@
 from __future__ import annotations
-from pathlib import Path
 
 from coman.core.base_module import BaseModule
 from coman.core.config import settings
+from coman.core.registry_store import load_registry, upsert_registry_items
 from coman.core.messages import (
     IntegrationCallRequest,
     IntegrationCallResult,
@@ -12,30 +12,16 @@ from coman.core.messages import (
 from fastapi import Body, HTTPException
 import sys, os, json, importlib, subprocess
 
-
-def _reg_path() -> Path:
-    return Path(settings.data_dir) / "integrations.json"
+from .pool import WorkerError, pools
+from .signatures import signature_cache
 
 
 def load_reg() -> IntegrationRegistry:
-    path = _reg_path()
-    if not path.exists():
-        return IntegrationRegistry()
-    with path.open("r", encoding="utf-8-sig") as f:
-        raw_text = f.read()
-
-    if not raw_text.strip():
-        return IntegrationRegistry()
+    """Return the shared, read-only integration registry."""
 
-    data = json.loads(raw_text)
-    return IntegrationRegistry.from_payload(data)
+    return load_registry("integrations", IntegrationRegistry)
 
 
-def save_reg(registry: IntegrationRegistry) -> None:
-    path = _reg_path()
-    os.makedirs(path.parent, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(registry.to_payload(), f, ensure_ascii=False, indent=2)
 def _is_allowed(path: str) -> bool:
     rp = os.path.realpath(path)
     for base in settings.allowed_integration_paths:
@@ -44,17 +30,21 @@ def _is_allowed(path: str) -> bool:
             if rp == rb or rp.startswith(rb + os.sep): return True
         except Exception: pass
     return False
+_MODULE_FILES: dict = {}
 def _module_file(module: str):
-    try:
-        mod = importlib.import_module(module); return getattr(mod, "__file__", None)
-    except Exception: return None
+    # Модуль уже импортирован — путь к файлу не меняется, повторный import не нужен.
+    path = _MODULE_FILES.get(module)
+    if path is None:
+        try:
+            mod = sys.modules.get(module) or importlib.import_module(module)
+        except Exception:
+            return None
+        path = getattr(mod, "__file__", None)
+        if path:
+            _MODULE_FILES[module] = path
+    return path
 def _sha256(p: str):
-    import hashlib
-    if not p or not os.path.exists(p): return ""
-    h = hashlib.sha256()
-    with open(p,"rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""): h.update(chunk)
-    return h.hexdigest()
+    return signature_cache.digest(p)
 class Module(BaseModule):
     name = "integration"; description = "Register and call external python code by source path (secure)"
     def __init__(self, core):
@@ -80,15 +70,21 @@ class Module(BaseModule):
                 sys.path.append(data.path)
             mod = importlib.import_module(data.module)
             getattr(mod, data.callable)
-            sig = _sha256(_module_file(data.module))
-            registry = load_reg()
+            source = _module_file(data.module)
+            if source:
+                signature_cache.invalidate(source)
+            sig = _sha256(source)
             data.sig = sig
-            registry.upsert(data)
-            save_reg(registry)
+            upsert_registry_items("integrations", [data])
+            # Тёплые процессы держат старый модуль в памяти — пересоздаём пул.
+            pools.discard(data.name)
             return {"ok": True, "sig": sig}
         @self.router.get("/list")
         def listing():
             return load_reg().to_payload()
+        @self.router.get("/pool")
+        def pool_stats():
+            return pools.stats()
         @self.router.post("/call")
         def call(
             name: str,
@@ -134,18 +130,30 @@ class Module(BaseModule):
                 mod = importlib.import_module(module_name)
                 fn = getattr(mod, func_name)
                 return IntegrationCallResult(result=fn(**call_kwargs)).to_payload()
+            if req.mode != "spawn":
+                try:
+                    return pools.get(integration).call(func_name, call_kwargs)
+                except WorkerError as exc:
+                    return IntegrationCallResult(ok=False, stderr=str(exc)).to_payload()
             runner = os.path.join(os.path.dirname(__file__), "runner.py")
             payload = json.dumps({"module": module_name, "callable": func_name, "kwargs": call_kwargs})
-            proc = subprocess.run([sys.executable, runner], input=payload, text=True, capture_output=True, timeout=30)
-            import json as _json
-
+            timeout = settings.integration_call_timeout
+            try:
+                proc = subprocess.run(
+                    [sys.executable, runner],
+                    input=payload,
+                    text=True,
+                    capture_output=True,
+                    timeout=timeout,
+                )
+            except subprocess.TimeoutExpired:
+                result = IntegrationCallResult(ok=False, stderr=f"timed out after {timeout:g}s")
+                return result.to_payload()
             try:
-                resp = _json.loads(proc.stdout)
+                return json.loads(proc.stdout)
             except Exception:
-                resp = IntegrationCallResult(ok=False, stdout=proc.stdout, stderr=proc.stderr).to_payload()
-            else:
-                return resp
-            return resp
+                result = IntegrationCallResult(ok=False, stdout=proc.stdout, stderr=proc.stderr)
+                return result.to_payload()
         @self.router.post("/scaffold")
         def scaffold(name: str, target_dir: str):
             os.makedirs(target_dir, exist_ok=True)
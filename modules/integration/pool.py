@@ -0,0 +1,362 @@
+"""Warm runner processes for integration calls outside ``inproc`` mode.
+
+Spawning ``python runner.py`` per call pays interpreter start-up and the
+integration's imports every time.  :class:`WorkerPool` keeps up to
+``pool_size`` long-lived ``runner.py --serve`` processes per integration,
+each with the integration module imported, and talks to them with
+length-prefixed JSON frames over stdin/stdout.
+
+A worker is replaced after ``worker_max_calls`` calls, once its RSS exceeds
+``worker_max_rss_mb``, after a timeout (it is killed) or when it dies.
+``pool_warmup`` workers are started in the background when the pool is
+created.  Each limit comes from the :class:`IntegrationDefinition` field of
+the same name or the matching ``COMAN_INTEGRATION_*`` setting.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import logging
+import os
+import struct
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from coman.core.config import settings
+
+log = logging.getLogger("coman.integration.pool")
+
+RUNNER = os.path.join(os.path.dirname(__file__), "runner.py")
+_HEADER = struct.Struct(">I")
+
+
+class WorkerError(RuntimeError):
+    """A pooled worker could not complete a call (timeout, crash, no capacity)."""
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    size: int
+    warmup: int
+    max_calls: int
+    max_rss_mb: float
+
+    @classmethod
+    def for_integration(cls, integration: Any) -> PoolConfig:
+        def pick(field: str, default: Any) -> Any:
+            value = getattr(integration, field, None)
+            return default if value is None else value
+
+        size = max(1, int(pick("pool_size", settings.integration_pool_size)))
+        return cls(
+            size=size,
+            warmup=min(size, max(0, int(pick("pool_warmup", settings.integration_pool_warmup)))),
+            max_calls=max(1, int(pick("worker_max_calls", settings.integration_worker_max_calls))),
+            max_rss_mb=float(pick("worker_max_rss_mb", settings.integration_worker_max_rss_mb)),
+        )
+
+
+class _Worker:
+    def __init__(self, runner: str = RUNNER):
+        self.proc = subprocess.Popen(
+            [sys.executable, "-u", runner, "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            bufsize=0,
+        )
+        self.calls = 0
+        self.rss_kb = 0
+        self._timed_out = False
+
+    @property
+    def pid(self) -> int:
+        return self.proc.pid
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def _kill_on_timeout(self) -> None:
+        self._timed_out = True
+        self.proc.kill()
+
+    def _read_exact(self, size: int) -> bytes:
+        chunks = []
+        while size:
+            chunk = self.proc.stdout.read(size)
+            if not chunk:
+                raise EOFError("worker closed its output")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def request(self, payload: dict[str, Any], timeout: float) -> dict[str, Any]:
+        data = json.dumps(payload).encode("utf-8")
+        # A blocking read plus a kill timer works on every platform, unlike select() on pipes.
+        timer = threading.Timer(timeout, self._kill_on_timeout)
+        timer.daemon = True
+        timer.start()
+        try:
+            self.proc.stdin.write(_HEADER.pack(len(data)) + data)
+            self.proc.stdin.flush()
+            (size,) = _HEADER.unpack(self._read_exact(_HEADER.size))
+            response = json.loads(self._read_exact(size).decode("utf-8"))
+        except (OSError, EOFError, ValueError) as exc:
+            self.kill()
+            if self._timed_out:
+                raise WorkerError(f"integration call exceeded {timeout:g}s") from exc
+            raise WorkerError(f"worker {self.pid} failed: {exc}") from exc
+        finally:
+            timer.cancel()
+        self.calls += 1
+        self.rss_kb = int(response.pop("rss_kb", 0) or 0)
+        return response
+
+    def kill(self) -> None:
+        if self.alive():
+            self.proc.kill()
+        self.proc.wait()
+        for stream in (self.proc.stdin, self.proc.stdout):
+            with contextlib.suppress(OSError):
+                stream.close()
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Let the worker exit on end of input, killing it if it lingers."""
+
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        self.kill()
+
+
+class WorkerPool:
+    """Bounded set of warm workers for one integration module."""
+
+    def __init__(
+        self,
+        name: str,
+        module: str,
+        path: str,
+        signature: str,
+        config: PoolConfig,
+        runner: str = RUNNER,
+    ):
+        self.name = name
+        self.module = module
+        self.path = path
+        self.signature = signature
+        self.config = config
+        self._runner = runner
+        self._idle: list[_Worker] = []
+        self._count = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.spawned = 0
+        self.recycled = 0
+        self.calls = 0
+        self.failures = 0
+
+    def warm(self) -> None:
+        """Start ``config.warmup`` workers in the background."""
+
+        def start() -> None:
+            for _ in range(self.config.warmup):
+                with self._cond:
+                    if self._closed or self._count >= self.config.warmup:
+                        return
+                    self._count += 1
+                try:
+                    worker = self._spawn()
+                except WorkerError as exc:
+                    log.warning("Warm-up of integration %s failed: %s", self.name, exc)
+                    with self._cond:
+                        self._count -= 1
+                        self._cond.notify()
+                    return
+                self._checkin(worker)
+
+        if self.config.warmup:
+            threading.Thread(target=start, name=f"coman-warm-{self.name}", daemon=True).start()
+
+    def _spawn(self) -> _Worker:
+        try:
+            worker = _Worker(self._runner)
+        except OSError as exc:
+            raise WorkerError(f"cannot start worker: {exc}") from exc
+        response = worker.request(
+            {"op": "import", "module": self.module, "path": self.path},
+            settings.integration_call_timeout,
+        )
+        if not response.get("ok"):
+            worker.close()
+            raise WorkerError(f"cannot import {self.module}: {response.get('error')}")
+        worker.calls = 0
+        with self._cond:
+            self.spawned += 1
+        return worker
+
+    def _checkout(self, timeout: float) -> _Worker:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise WorkerError(f"pool of integration {self.name} is closed")
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.alive():
+                        return worker
+                    self._count -= 1
+                if self._count < self.config.size:
+                    self._count += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise WorkerError(f"no idle worker for integration {self.name}")
+                self._cond.wait(remaining)
+        try:
+            return self._spawn()
+        except BaseException:
+            with self._cond:
+                self._count -= 1
+                self._cond.notify()
+            raise
+
+    def _checkin(self, worker: _Worker, healthy: bool = True) -> None:
+        limit_kb = self.config.max_rss_mb * 1024
+        retire = (
+            not healthy
+            or not worker.alive()
+            or worker.calls >= self.config.max_calls
+            or (limit_kb > 0 and worker.rss_kb > limit_kb)
+        )
+        with self._cond:
+            if retire or self._closed:
+                self._count -= 1
+                if retire and healthy:
+                    self.recycled += 1
+            else:
+                self._idle.append(worker)
+            self._cond.notify()
+        if retire or self._closed:
+            worker.close()
+
+    def call(
+        self,
+        func_name: str,
+        kwargs: dict[str, Any],
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Run ``module.func_name(**kwargs)`` in a warm worker and return its response."""
+
+        timeout = settings.integration_call_timeout if timeout is None else timeout
+        worker = self._checkout(timeout)
+        payload = {
+            "module": self.module,
+            "callable": func_name,
+            "kwargs": kwargs,
+            "path": self.path,
+        }
+        try:
+            response = worker.request(payload, timeout)
+        except WorkerError:
+            with self._cond:
+                self.failures += 1
+            self._checkin(worker, healthy=False)
+            raise
+        with self._cond:
+            self.calls += 1
+        self._checkin(worker)
+        return response
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._count -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.close()
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "module": self.module,
+                "size": self.config.size,
+                "warmup": self.config.warmup,
+                "max_calls": self.config.max_calls,
+                "max_rss_mb": self.config.max_rss_mb,
+                "workers": self._count,
+                "idle": len(self._idle),
+                "idle_rss_kb": [worker.rss_kb for worker in self._idle],
+                "spawned": self.spawned,
+                "recycled": self.recycled,
+                "calls": self.calls,
+                "failures": self.failures,
+            }
+
+
+class IntegrationPools:
+    """One :class:`WorkerPool` per registered integration."""
+
+    def __init__(self, runner: str = RUNNER):
+        self._runner = runner
+        self._pools: dict[str, WorkerPool] = {}
+        self._lock = threading.Lock()
+
+    def get(self, integration: Any) -> WorkerPool:
+        """Return the pool for ``integration``, replacing it if its definition changed."""
+
+        config = PoolConfig.for_integration(integration)
+        signature = integration.sig or ""
+        stale = None
+        with self._lock:
+            pool = self._pools.get(integration.name)
+            if pool is not None and (
+                pool.module != integration.module
+                or pool.path != integration.path
+                or pool.signature != signature
+                or pool.config != config
+            ):
+                stale, pool = pool, None
+            if pool is None:
+                pool = WorkerPool(
+                    integration.name,
+                    integration.module,
+                    integration.path,
+                    signature,
+                    config,
+                    self._runner,
+                )
+                self._pools[integration.name] = pool
+                pool.warm()
+        if stale is not None:
+            stale.close()
+        return pool
+
+    def discard(self, name: str) -> None:
+        with self._lock:
+            pool = self._pools.pop(name, None)
+        if pool is not None:
+            pool.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            pools = dict(self._pools)
+        return {name: pool.stats() for name, pool in sorted(pools.items())}
+
+
+pools = IntegrationPools()
+atexit.register(pools.close_all)
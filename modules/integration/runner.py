@@ -1,11 +1,90 @@
-import importlib, json, sys, traceback
+import contextlib
+import importlib
+import io
+import json
+import os
+import struct
+import sys
+import traceback
+
+# ``--serve``: long-lived pool worker (see pool.py).  Requests and responses
+# are JSON frames prefixed with a 4-byte big-endian length on stdin/stdout.
+_HEADER = struct.Struct(">I")
+
+
+def _call(payload):
+    path = payload.get("path")
+    if path and path not in sys.path:
+        sys.path.append(path)
+    module = payload["module"]; call = payload["callable"]; kwargs = payload.get("kwargs", {})
+    mod = importlib.import_module(module)
+    fn = getattr(mod, call.split(".")[-1]) if "." in call else getattr(mod, call)
+    return fn(**kwargs)
+
+
+def _rss_kb():
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        try:
+            import resource
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        except Exception:
+            return 0
+
+
+def _read_frame(stream):
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    (size,) = _HEADER.unpack(header)
+    body = stream.read(size)
+    if len(body) < size:
+        return None
+    return json.loads(body.decode("utf-8"))
+
+
+def serve():
+    requests = sys.stdin.buffer
+    # Frames get a private copy of stdout; fd 1 is pointed at stderr so stray
+    # writes from C extensions cannot corrupt the protocol.
+    frames = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    while True:
+        payload = _read_frame(requests)
+        if payload is None:
+            return
+        captured = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(captured):
+                if payload.get("op") == "import":
+                    path = payload.get("path")
+                    if path and path not in sys.path:
+                        sys.path.append(path)
+                    importlib.import_module(payload["module"])
+                    response = {"ok": True}
+                else:
+                    response = {"ok": True, "result": _call(payload)}
+            json.dumps(response)
+        except Exception as e:
+            response = {"ok": False, "error": str(e), "trace": traceback.format_exc()}
+        if captured.getvalue():
+            response["stdout"] = captured.getvalue()
+        response["rss_kb"] = _rss_kb()
+        data = json.dumps(response, default=str).encode("utf-8")
+        frames.write(_HEADER.pack(len(data)) + data)
+        frames.flush()
+
+
 def main():
     try:
         payload = json.load(sys.stdin)
-        module = payload["module"]; call = payload["callable"]; kwargs = payload.get("kwargs", {})
-        mod = importlib.import_module(module)
-        fn = getattr(mod, call.split(".")[-1]) if "." in call else getattr(mod, call)
-        res = fn(**kwargs); print(json.dumps({"ok": True, "result": res}))
+        res = _call(payload)
+        print(json.dumps({"ok": True, "result": res}))
     except Exception as e:
         print(json.dumps({"ok": False, "error": str(e), "trace": traceback.format_exc()})); sys.exit(1)
-if __name__ == "__main__": main()
+
+
+if __name__ == "__main__":
+    serve() if "--serve" in sys.argv[1:] else main()
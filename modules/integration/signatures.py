@@ -0,0 +1,138 @@
+"""SHA-256 digests of integration sources, cached by ``stat``.
+
+``verify_sig`` used to re-hash the integration's source file on every call.
+:class:`SignatureCache` keeps the digest per file keyed by
+``(st_dev, st_ino, st_mtime_ns, st_size)`` and re-hashes only when that tuple
+changes, so a call costs one ``stat``.
+
+With ``COMAN_INTEGRATION_SIG_WATCH`` set to a positive number of seconds, a
+background thread re-stats the known files at that interval instead, and
+lookups of known files skip the ``stat`` entirely; a changed file is then
+noticed within one interval.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+
+from coman.core.config import settings
+
+StatKey = tuple[int, int, int, int]
+
+
+def stat_key(path: str) -> StatKey | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def sha256_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class SignatureCache:
+    """Per-file digest cache revalidated by ``stat`` or a watcher thread."""
+
+    def __init__(self, watch_interval: float | None = None):
+        self._watch_interval = watch_interval
+        self._entries: dict[str, tuple[StatKey, str]] = {}
+        self._lock = threading.Lock()
+        self._watcher: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.hashes = 0
+        self.hits = 0
+
+    @property
+    def watch_interval(self) -> float:
+        if self._watch_interval is not None:
+            return self._watch_interval
+        return settings.integration_sig_watch
+
+    def digest(self, path: str | None) -> str:
+        """Return the SHA-256 of ``path`` or ``""`` when it does not exist."""
+
+        if not path:
+            return ""
+        if self.watch_interval > 0:
+            self._ensure_watcher()
+            with self._lock:
+                entry = self._entries.get(path)
+                if entry is not None:
+                    self.hits += 1
+                    return entry[1]
+        return self._refresh(path)
+
+    def _refresh(self, path: str) -> str:
+        key = stat_key(path)
+        if key is None:
+            with self._lock:
+                self._entries.pop(path, None)
+            return ""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                return entry[1]
+        try:
+            digest = sha256_file(path)
+        except OSError:
+            return ""
+        with self._lock:
+            self.hashes += 1
+            self._entries[path] = (key, digest)
+        return digest
+
+    def _ensure_watcher(self) -> None:
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        with self._lock:
+            if self._watcher is not None and self._watcher.is_alive():
+                return
+            self._stop.clear()
+            self._watcher = threading.Thread(
+                target=self._watch,
+                name="coman-sig-watch",
+                daemon=True,
+            )
+            self._watcher.start()
+
+    def _watch(self) -> None:
+        while not self._stop.wait(max(0.05, self.watch_interval)):
+            with self._lock:
+                paths = list(self._entries)
+            for path in paths:
+                self._refresh(path)
+
+    def stop(self) -> None:
+        self._stop.set()
+        watcher = self._watcher
+        if watcher is not None:
+            watcher.join(timeout=1)
+        self._watcher = None
+
+    def invalidate(self, path: str | None = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "files": len(self._entries),
+                "hashes": self.hashes,
+                "hits": self.hits,
+                "watch_interval_s": self.watch_interval,
+            }
+
+
+signature_cache = SignatureCache()
@@ -1,8 +1,7 @@
 from __future__ import annotations
 from coman.core.base_module import BaseModule
-from coman.core.config import settings
 from fastapi import HTTPException
-import httpx, json
+import json
 def _eval_expr(expr, ctx):
     if not isinstance(expr, dict): return False
     if "all" in expr: return all(_eval_expr(x, ctx) for x in expr["all"])
@@ -20,14 +19,12 @@ class Module(BaseModule):
         super().__init__(core)
         @self.router.post("/rulesx/add")
         def rulesx_add(name: str, expr_json: str, action_json: str, priority: int = 0, enabled: int = 1):
-            with httpx.Client(timeout=10) as c:
-                r = c.post(f"{settings.api_base}/v1/logic/rulesx/add",
-                           params={"name":name,"expr_json":expr_json,"action_json":action_json,"priority":priority,"enabled":enabled})
-                return r.json()
+            r = self.dispatcher.post("/v1/logic/rulesx/add",
+                                     params={"name":name,"expr_json":expr_json,"action_json":action_json,"priority":priority,"enabled":enabled})
+            return r.json()
         @self.router.post("/decide-and-call-advanced")
-        def decide_and_call_advanced(context: dict):
-            with httpx.Client(timeout=10) as c:
-                rules = c.get(f"{settings.api_base}/v1/logic/rulesx/list").json()
+        async def decide_and_call_advanced(context: dict):
+            rules = (await self.dispatcher.aget("/v1/logic/rulesx/list")).json()
             applied = []
             for r in rules:
                 if not r["enabled"]: continue
@@ -40,10 +37,10 @@ class Module(BaseModule):
             chosen = applied[0]; act = chosen["action"]
             integ = act.get("set",{}).get("use_integration"); call = act.get("set",{}).get("use_callable")
             if not (integ and call): raise HTTPException(400, "rule action missing use_integration/use_callable")
-            with httpx.Client(timeout=15) as c:
-                r = c.post(
-                    f"{settings.api_base}/v1/integration/call",
-                    params={"name": integ, "callable": call},
-                    json={"kwargs": context},
-                )
-                return {"applied": applied, "chosen": chosen, "integration_result": r.json()}
+            r = await self.dispatcher.apost(
+                "/v1/integration/call",
+                params={"name": integ, "callable": call},
+                json={"kwargs": context},
+                timeout=15,
+            )
+            return {"applied": applied, "chosen": chosen, "integration_result": r.json()}
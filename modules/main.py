@@ -10,23 +10,33 @@ import subprocess
 import sys
 import threading
 import venv
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from contextlib import contextmanager
 from importlib import import_module
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, Sequence, Set
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    TextIO,
+)
 
-from coman.core.base_module import BaseModule
-from coman.core.registry import Core, load_modules
+# ``modules`` and ``call`` must stay cheap: the core registry (and with it
+# FastAPI and OpenTelemetry) is only imported by the commands that need it.
+if TYPE_CHECKING:
+    from coman.core.base_module import BaseModule
+    from coman.core.registry import Core
 
 
 log = logging.getLogger("coman.main")
 
 
-_BASE_DEPENDENCIES: Dict[str, str] = {
+_BASE_DEPENDENCIES: dict[str, str] = {
     "httpx": "httpx",
 }
 
-_SERVICE_DEPENDENCIES: Dict[str, Dict[str, str]] = {
+_SERVICE_DEPENDENCIES: dict[str, dict[str, str]] = {
     "api": {
         "fastapi": "fastapi",
         "pydantic": "pydantic",
@@ -41,8 +51,8 @@ _SERVICE_DEPENDENCIES: Dict[str, Dict[str, str]] = {
 def ensure_runtime_dependencies(services: Iterable[str]) -> None:
     """Validate that the runtime dependencies for the requested services exist."""
 
-    missing: List[str] = []
-    seen: Set[str] = set()
+    missing: list[str] = []
+    seen: set[str] = set()
 
     def _check_modules(modules: Sequence[str]) -> None:
         for module in modules:
@@ -54,7 +64,7 @@ def ensure_runtime_dependencies(services: Iterable[str]) -> None:
                     missing.append(package)
                     seen.add(package)
 
-    dependency_map: Dict[str, str] = dict(_BASE_DEPENDENCIES)
+    dependency_map: dict[str, str] = dict(_BASE_DEPENDENCIES)
     requested = set(services)
     for service in requested:
         dependency_map.update(_SERVICE_DEPENDENCIES.get(service, {}))
@@ -126,19 +136,37 @@ def create_virtual_environment(
     return python_path
 
 
-def _load_core() -> Core:
+def _load_core(lazy: bool = False, parallel: bool = False) -> Core:
+    from coman.core.config import settings
+    from coman.core.registry import Core, load_modules
+
     core = Core()
-    load_modules(core)
+    load_modules(
+        core,
+        lazy=lazy,
+        parallel=parallel,
+        max_workers=settings.module_init_workers,
+    )
     return core
 
 
-def run_api(host: str = "127.0.0.1", port: int = 8000, reload: bool = False) -> None:
+def run_api(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    reload: bool = False,
+    lazy: bool | None = None,
+    parallel: bool | None = None,
+) -> None:
     """Start the FastAPI application with all registered modules."""
 
     from coman.core.app import build_fastapi_app
+    from coman.core.config import settings
 
     uvicorn = _import_uvicorn()
-    core = _load_core()
+    core = _load_core(
+        lazy=settings.lazy_modules if lazy is None else lazy,
+        parallel=settings.parallel_module_init if parallel is None else parallel,
+    )
     app = build_fastapi_app(core)
     log.info("Starting FastAPI core on %s:%s", host, port)
     uvicorn.run(app, host=host, port=port, reload=reload)  # pragma: no cover - network server
@@ -164,28 +192,23 @@ def _background_thread(target, *args, **kwargs) -> Iterator[threading.Thread]:
             log.info("Background thread %s is still running", thread.name)
 
 
-def run_all(host: str = "127.0.0.1", port: int = 8000, reload: bool = False) -> None:
+def run_all(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    reload: bool = False,
+    lazy: bool | None = None,
+    parallel: bool | None = None,
+) -> None:
     """Run both the FastAPI server and the Telegram bot together."""
 
-    with _background_thread(run_api, host, port, reload):
+    with _background_thread(run_api, host, port, reload, lazy, parallel):
         run_telegram_bot()
 
 
-def _describe_module(module: BaseModule) -> Dict[str, Any]:
-    operations = module.describe_console_operations()
-    return {
-        "name": module.name,
-        "description": module.description,
-        "version": module.version,
-        "operations": operations,
-    }
+def list_modules(as_json: bool = False, refresh: bool = False) -> None:
+    from coman.core.manifest import describe_modules
 
-
-def list_modules(as_json: bool = False) -> None:
-    core = _load_core()
-    modules_info: List[Dict[str, Any]] = []
-    for module in core.modules.values():
-        modules_info.append(_describe_module(module))
+    modules_info: list[dict[str, Any]] = describe_modules(refresh=refresh)
 
     if as_json:
         json.dump(modules_info, sys.stdout, ensure_ascii=False, indent=2)
@@ -210,7 +233,7 @@ def list_modules(as_json: bool = False) -> None:
             print(f"    - {op['name']} {methods_display} {path} {summary}".rstrip())
 
 
-def _parse_kv(arg: str) -> Dict[str, Any]:
+def _parse_kv(arg: str) -> dict[str, Any]:
     if "=" not in arg:
         raise SystemExit(f"Invalid argument '{arg}', expected key=value")
     key, value = arg.split("=", 1)
@@ -225,8 +248,8 @@ def _parse_kv(arg: str) -> Dict[str, Any]:
     return {key: value_obj}
 
 
-def _merge_arguments(json_payload: str | None, args: List[str]) -> Dict[str, Any]:
-    data: Dict[str, Any] = {}
+def _merge_arguments(json_payload: str | None, args: list[str]) -> dict[str, Any]:
+    data: dict[str, Any] = {}
     if json_payload:
         try:
             loaded = json.loads(json_payload)
@@ -240,20 +263,76 @@ def _merge_arguments(json_payload: str | None, args: List[str]) -> Dict[str, Any
     return data
 
 
-def call_module(module_name: str, operation: str, json_payload: str | None, args: List[str]) -> None:
-    core = _load_core()
-    module = core.modules.get(module_name)
+def _load_single_module(module_name: str) -> BaseModule:
+    """Import only the module named ``module_name`` into a fresh core.
+
+    The other modules are registered lazily, so in-process calls to them
+    still import them on demand.
+    """
+
+    from coman.core.manifest import discover_module_specs
+    from coman.core.registry import Core, _register_lazy_modules, load_module
+
+    specs = discover_module_specs()
+    target = next((spec for spec in specs if spec.name == module_name), None)
+    core = Core()
+    if target is not None:
+        _register_lazy_modules(core)
+        module = load_module(core, target.import_path)
+    elif any(spec.name is None for spec in specs):
+        # Some packages could not be described statically; fall back to a full load.
+        core = _load_core()
+        module = core.modules.get(module_name)
+    else:
+        module = None
     if module is None:
-        available = ", ".join(sorted(core.modules)) or "<none>"
+        available = ", ".join(sorted(spec.name for spec in specs if spec.name)) or "<none>"
         raise SystemExit(f"Unknown module '{module_name}'. Available modules: {available}")
+    return module
+
+
+def _call_via_daemon(
+    module_name: str,
+    operation: str,
+    payload: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Forward a call to the warm daemon; ``None`` when it is not running."""
+
+    from coman.core.config import settings
+    from coman.core.daemon import DaemonClient, DaemonUnavailable
 
-    payload = _merge_arguments(json_payload, args)
     try:
-        result = module.invoke_console_operation(operation, payload)
-    except Exception as exc:
-        raise SystemExit(f"Failed to execute {module_name}.{operation}: {exc}") from exc
+        client = DaemonClient(settings.daemon_socket, timeout=settings.daemon_call_timeout)
+        return client.call(module_name, operation, payload)
+    except DaemonUnavailable:
+        return None
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"Failed to execute {module_name}.{operation} via daemon: {exc}") from exc
+
+
+def call_module(
+    module_name: str,
+    operation: str,
+    json_payload: str | None,
+    args: list[str],
+    use_daemon: bool = True,
+) -> None:
+    payload = _merge_arguments(json_payload, args)
+
+    response = _call_via_daemon(module_name, operation, payload) if use_daemon else None
+    if response is not None:
+        if not response.get("ok"):
+            error = response.get("error")
+            raise SystemExit(f"Failed to execute {module_name}.{operation}: {error}")
+        formatted = response.get("result")
+    else:
+        module = _load_single_module(module_name)
+        try:
+            result = module.invoke_console_operation(operation, payload)
+        except Exception as exc:
+            raise SystemExit(f"Failed to execute {module_name}.{operation}: {exc}") from exc
+        formatted = _format_result(result)
 
-    formatted = _format_result(result)
     if isinstance(formatted, str):
         print(formatted)
     else:
@@ -261,6 +340,169 @@ def call_module(module_name: str, operation: str, json_payload: str | None, args
         sys.stdout.write("\n")
 
 
+def _execute_batch_line(
+    index: int,
+    line: str,
+    resolve: Callable[[str], BaseModule | None],
+) -> dict[str, Any]:
+    record: dict[str, Any] = {"index": index}
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+        if "id" in request:
+            record["id"] = request["id"]
+        module_name = request.get("module")
+        operation = request.get("operation")
+        arguments = request.get("args") or {}
+        if not module_name or not operation:
+            raise ValueError("request needs 'module' and 'operation'")
+        if not isinstance(arguments, dict):
+            raise ValueError("'args' must be an object")
+        record.update(module=module_name, operation=operation)
+        module = resolve(module_name)
+        if module is None:
+            raise LookupError(f"Unknown module '{module_name}'")
+        result = module.invoke_console_operation(operation, arguments)
+    except Exception as exc:
+        record.update(ok=False, error=f"{type(exc).__name__}: {exc}")
+        return record
+    record.update(ok=True, result=_format_result(result))
+    return record
+
+
+def _iter_batch_lines(stream: TextIO) -> Iterator[str]:
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def run_batch(
+    stream: TextIO,
+    out: TextIO,
+    resolve: Callable[[str], BaseModule | None],
+    *,
+    workers: int = 4,
+    order: str = "input",
+) -> int:
+    """Execute JSONL ``{module, operation, args}`` requests and stream JSONL results.
+
+    Requests are read lazily and at most ``workers * 4`` are in flight, so
+    large inputs are processed in constant memory.  Returns the number of
+    failed requests.
+    """
+
+    workers = max(1, workers)
+    window = workers * 4
+    failures = 0
+
+    def emit(future: Future[dict[str, Any]]) -> None:
+        nonlocal failures
+        record = future.result()
+        if not record.get("ok"):
+            failures += 1
+        out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        out.flush()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="coman-batch") as pool:
+        in_flight: deque[Future[dict[str, Any]]] = deque()
+        pending: set[Future[dict[str, Any]]] = set()
+        for index, line in enumerate(_iter_batch_lines(stream)):
+            future = pool.submit(_execute_batch_line, index, line, resolve)
+            if order == "input":
+                in_flight.append(future)
+                while len(in_flight) >= window:
+                    emit(in_flight.popleft())
+            else:
+                pending.add(future)
+                while len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for item in done:
+                        emit(item)
+        while in_flight:
+            emit(in_flight.popleft())
+        for item in as_completed(pending):
+            emit(item)
+    return failures
+
+
+def call_batch(source: str, workers: int = 4, order: str = "input") -> None:
+    """Run ``call --batch``: one core, many operations."""
+
+    # Modules are imported on first use, so a batch only pays for what it calls.
+    core = _load_core(lazy=True)
+    if source == "-":
+        failures = run_batch(sys.stdin, sys.stdout, core.get_module, workers=workers, order=order)
+    else:
+        try:
+            with open(source, encoding="utf-8") as fh:
+                failures = run_batch(fh, sys.stdout, core.get_module, workers=workers, order=order)
+        except OSError as exc:
+            raise SystemExit(f"Unable to read batch file {source}: {exc}") from exc
+    if failures:
+        log.warning("%d batch request(s) failed", failures)
+        raise SystemExit(1)
+
+
+def run_daemon(socket_path: str | None = None) -> None:
+    """Keep a fully loaded core resident and serve console calls on a Unix socket."""
+
+    from coman.core.config import settings
+    from coman.core.daemon import DaemonServer, unix_sockets_supported
+
+    if not unix_sockets_supported():
+        raise SystemExit("The daemon requires Unix domain sockets, which this platform lacks")
+    socket_path = socket_path or settings.daemon_socket
+    core = _load_core(parallel=settings.parallel_module_init)
+
+    def handle_line(line: str) -> dict[str, Any]:
+        record = _execute_batch_line(0, line, core.get_module)
+        record.pop("index", None)
+        return record
+
+    try:
+        server = DaemonServer(socket_path, handle_line)
+    except (OSError, RuntimeError) as exc:
+        raise SystemExit(f"Unable to start daemon: {exc}") from exc
+    log.info("Daemon serving %d modules on %s", len(core.modules), socket_path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def migrate_registries(
+    action: str,
+    data_dir: str | None = None,
+    db_path: str | None = None,
+) -> None:
+    """Copy the tool/integration/capability registries between JSON files and SQLite."""
+
+    from coman.core.config import settings
+    from coman.core.registry_store import (
+        JsonRegistryStore,
+        SqliteRegistryStore,
+        copy_registries,
+        registry_db_path,
+    )
+
+    json_store = JsonRegistryStore(data_dir or settings.data_dir)
+    sqlite_store = SqliteRegistryStore(db_path or registry_db_path())
+    if action == "import":
+        source, target = json_store, sqlite_store
+    else:
+        source, target = sqlite_store, json_store
+    try:
+        counts = copy_registries(source, target)
+    finally:
+        sqlite_store.close()
+    for kind, count in counts.items():
+        print(f"{kind}: {count} entries copied to {target.backend}")
+
+
 def _format_result(result: Any) -> Any:
     if result is None:
         return {"ok": True}
@@ -286,6 +528,31 @@ def _format_result(result: Any) -> Any:
     return repr(result)
 
 
+def profile_startup(
+    as_json: bool = False,
+    top: int = 25,
+    lazy: bool = False,
+    parallel: bool = False,
+    child_report: str | None = None,
+) -> None:
+    """Print where cold-start time and memory go, stage by stage."""
+
+    from coman.core import startup_profile
+
+    if child_report:
+        report = startup_profile.collect_stage_report(lazy=lazy, parallel=parallel)
+        with open(child_report, "w", encoding="utf-8") as fh:
+            json.dump(report, fh)
+        return
+
+    report = startup_profile.profile_startup(lazy=lazy, parallel=parallel)
+    if as_json:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+        return
+    print(startup_profile.format_report(report, top=top))
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run Coman services or interact with modules")
     subparsers = parser.add_subparsers(dest="command")
@@ -301,15 +568,33 @@ def _build_parser() -> argparse.ArgumentParser:
     serve.add_argument("--host", default="127.0.0.1", help="Host for the API server")
     serve.add_argument("--port", type=int, default=8000, help="Port for the API server")
     serve.add_argument("--reload", action="store_true", help="Enable auto-reload for the API server")
+    serve.add_argument(
+        "--lazy",
+        action="store_true",
+        default=None,
+        help="Import modules on their first request instead of at startup (COMAN_LAZY_MODULES)",
+    )
+    serve.add_argument(
+        "--parallel-init",
+        dest="parallel_init",
+        action="store_true",
+        default=None,
+        help="Import and construct modules on a thread pool (COMAN_PARALLEL_MODULE_INIT)",
+    )
     serve.add_argument("--verbose", action="store_true", help="Enable debug logging")
 
     modules_cmd = subparsers.add_parser("modules", help="List available modules")
     modules_cmd.add_argument("--json", action="store_true", help="Output JSON instead of text")
+    modules_cmd.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Rebuild the cached module manifest instead of trusting it",
+    )
     modules_cmd.add_argument("--verbose", action="store_true", help="Enable debug logging")
 
     call_cmd = subparsers.add_parser("call", help="Invoke a module operation without the API server")
-    call_cmd.add_argument("module", help="Module name (e.g. analysis)")
-    call_cmd.add_argument("operation", help="Operation name or route (e.g. frequency)")
+    call_cmd.add_argument("module", nargs="?", help="Module name (e.g. analysis)")
+    call_cmd.add_argument("operation", nargs="?", help="Operation name or route (e.g. frequency)")
     call_cmd.add_argument("--json", dest="payload", help="JSON payload with arguments")
     call_cmd.add_argument(
         "--arg",
@@ -317,8 +602,77 @@ def _build_parser() -> argparse.ArgumentParser:
         default=[],
         help="key=value argument (can be provided multiple times)",
     )
+    call_cmd.add_argument(
+        "--batch",
+        metavar="FILE",
+        help=(
+            "Read {module, operation, args} JSON lines from FILE ('-' for stdin)"
+            " and print JSONL results"
+        ),
+    )
+    call_cmd.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of operations executed concurrently in batch mode (default: 4)",
+    )
+    call_cmd.add_argument(
+        "--order",
+        choices=("input", "completion"),
+        default="input",
+        help="Emit batch results in input order or as they complete (default: input)",
+    )
+    call_cmd.add_argument(
+        "--no-daemon",
+        dest="use_daemon",
+        action="store_false",
+        help="Run in-process even if a daemon is listening",
+    )
     call_cmd.add_argument("--verbose", action="store_true", help="Enable debug logging")
 
+    daemon_cmd = subparsers.add_parser(
+        "daemon",
+        help="Keep a loaded core resident and serve 'call' requests over a Unix socket",
+    )
+    daemon_cmd.add_argument("--socket", help="Socket path (default: COMAN_DAEMON_SOCKET)")
+    daemon_cmd.add_argument("--verbose", action="store_true", help="Enable debug logging")
+
+    registry_cmd = subparsers.add_parser(
+        "registry",
+        help="Import the JSON registries into SQLite or export them back",
+    )
+    registry_cmd.add_argument(
+        "action",
+        choices=("import", "export"),
+        help="import: JSON files -> SQLite; export: SQLite -> JSON files",
+    )
+    registry_cmd.add_argument(
+        "--data-dir",
+        dest="data_dir",
+        help="Directory of the JSON files (default: COMAN_DATA_DIR)",
+    )
+    registry_cmd.add_argument(
+        "--db",
+        help="SQLite database (default: COMAN_REGISTRY_DB or data_dir/registries.db)",
+    )
+    registry_cmd.add_argument("--verbose", action="store_true", help="Enable debug logging")
+
+    profile_cmd = subparsers.add_parser(
+        "profile-startup",
+        help="Profile import, module construction and app build time of a cold start",
+    )
+    profile_cmd.add_argument("--json", action="store_true", help="Output the raw JSON report")
+    profile_cmd.add_argument("--top", type=int, default=25, help="Number of imports to show")
+    profile_cmd.add_argument("--lazy", action="store_true", help="Profile lazy module loading")
+    profile_cmd.add_argument(
+        "--parallel-init",
+        dest="parallel_init",
+        action="store_true",
+        help="Profile parallel module initialisation",
+    )
+    profile_cmd.add_argument("--child-report", dest="child_report", help=argparse.SUPPRESS)
+    profile_cmd.add_argument("--verbose", action="store_true", help="Enable debug logging")
+
     venv_cmd = subparsers.add_parser("venv", help="Create or update a virtual environment")
     venv_cmd.add_argument("--path", default=".venv", help="Location for the virtual environment")
     venv_cmd.add_argument(
@@ -336,7 +690,7 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     argv = list(argv or sys.argv[1:])
     if argv and argv[0] in {"api", "telegram", "all", "dual"}:
         argv = ["serve", *argv]
@@ -347,7 +701,7 @@ def _parse_args(argv: List[str] | None = None) -> argparse.Namespace:
     return args
 
 
-def main(argv: List[str] | None = None) -> None:
+def main(argv: list[str] | None = None) -> None:
     args = _parse_args(argv)
     verbose = getattr(args, "verbose", False)
     _configure_logging(verbose)
@@ -355,7 +709,7 @@ def main(argv: List[str] | None = None) -> None:
     command = getattr(args, "command", "serve") or "serve"
     if command == "serve":
         service = getattr(args, "service", "api")
-        services: Set[str]
+        services: set[str]
         if service in {"all", "dual"}:
             services = {"api", "telegram"}
         else:
@@ -363,19 +717,46 @@ def main(argv: List[str] | None = None) -> None:
         ensure_runtime_dependencies(services)
 
         if service == "api":
-            run_api(args.host, args.port, args.reload)
+            run_api(args.host, args.port, args.reload, args.lazy, args.parallel_init)
         elif service == "telegram":
             run_telegram_bot()
         else:
-            run_all(args.host, args.port, args.reload)
+            run_all(args.host, args.port, args.reload, args.lazy, args.parallel_init)
         return
 
     if command == "modules":
-        list_modules(as_json=args.json)
+        list_modules(as_json=args.json, refresh=args.refresh)
         return
 
     if command == "call":
-        call_module(args.module, args.operation, args.payload, args.arg)
+        if args.batch:
+            if args.module or args.operation or args.payload or args.arg:
+                raise SystemExit(
+                    "--batch cannot be combined with module, operation, --json or --arg",
+                )
+            call_batch(args.batch, workers=args.workers, order=args.order)
+            return
+        if not args.module or not args.operation:
+            raise SystemExit("call requires a module and an operation (or --batch FILE)")
+        call_module(args.module, args.operation, args.payload, args.arg, use_daemon=args.use_daemon)
+        return
+
+    if command == "daemon":
+        run_daemon(args.socket)
+        return
+
+    if command == "registry":
+        migrate_registries(args.action, args.data_dir, args.db)
+        return
+
+    if command == "profile-startup":
+        profile_startup(
+            as_json=args.json,
+            top=args.top,
+            lazy=args.lazy,
+            parallel=args.parallel_init,
+            child_report=args.child_report,
+        )
         return
 
     if command == "venv":
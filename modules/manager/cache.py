@@ -0,0 +1,136 @@
+"""Bounded TTL/LRU cache of normalised tool results for the manager.
+
+Only tools declaring ``ToolDefinition.cacheable`` are cached.  Entries are
+keyed by ``(tool, method, path, canonical query)`` where the query is
+serialised with sorted keys, so ``{"a": 1, "b": 2}`` and ``{"b": 2, "a": 1}``
+share an entry.  Each entry expires after the tool's ``cache_ttl`` (or
+``COMAN_MANAGER_CACHE_TTL``); the least recently used entry is evicted once
+``COMAN_MANAGER_CACHE_SIZE`` entries are stored.
+
+Cached results are shared between requests and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from coman.core.config import settings
+
+CacheKey = tuple[str, str, str, str]
+
+MISS = object()
+
+
+@dataclass
+class _Entry:
+    tool: str
+    value: Any
+    expires_at: float
+
+
+@dataclass
+class _ToolStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expired: int = 0
+
+
+class ToolResultCache:
+    """LRU of tool results with per-entry expiry and per-tool counters."""
+
+    def __init__(self, max_entries: int | None = None, default_ttl: float | None = None):
+        self._max_entries = max_entries
+        self._default_ttl = default_ttl
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._stats: dict[str, _ToolStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return settings.manager_cache_size
+
+    def ttl_for(self, tool: Any) -> float:
+        ttl = getattr(tool, "cache_ttl", None)
+        if ttl is None:
+            ttl = self._default_ttl if self._default_ttl is not None else settings.manager_cache_ttl
+        return float(ttl)
+
+    @staticmethod
+    def key(tool: Any, query: dict[str, Any]) -> CacheKey:
+        canonical = json.dumps(query, sort_keys=True, separators=(",", ":"), default=str)
+        return (tool.name, tool.method, tool.path, canonical)
+
+    def _tool_stats(self, tool: str) -> _ToolStats:
+        stats = self._stats.get(tool)
+        if stats is None:
+            stats = self._stats[tool] = _ToolStats()
+        return stats
+
+    def get(self, key: CacheKey) -> Any:
+        """Return the cached value for ``key`` or :data:`MISS`."""
+
+        now = time.monotonic()
+        with self._lock:
+            stats = self._tool_stats(key[0])
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                del self._entries[key]
+                stats.expired += 1
+                entry = None
+            if entry is None:
+                stats.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            stats.hits += 1
+            return entry.value
+
+    def put(self, key: CacheKey, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = _Entry(key[0], value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._tool_stats(evicted.tool).evictions += 1
+
+    def purge(self, tool: str | None = None) -> int:
+        """Drop every entry (or those of ``tool``) and return how many were removed."""
+
+        with self._lock:
+            if tool is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            keys = [key for key, entry in self._entries.items() if entry.tool == tool]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries: dict[str, int] = {}
+            for entry in self._entries.values():
+                entries[entry.tool] = entries.get(entry.tool, 0) + 1
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "tools": {
+                    tool: {
+                        "entries": entries.get(tool, 0),
+                        "hits": stats.hits,
+                        "misses": stats.misses,
+                        "evictions": stats.evictions,
+                        "expired": stats.expired,
+                    }
+                    for tool, stats in sorted(self._stats.items())
+                },
+            }
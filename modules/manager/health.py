@@ -0,0 +1,187 @@
+"""Per-tool latency/error tracking and circuit breaker for the manager.
+
+:class:`ToolHealth` keeps the last ``COMAN_MANAGER_HEALTH_WINDOW`` calls of each
+tool (latency and outcome) to report rolling percentiles and error rates.
+
+Each tool also has a circuit breaker.  After ``COMAN_MANAGER_BREAKER_FAILURES``
+consecutive failures the circuit opens and calls fail immediately with
+:class:`CircuitOpenError` instead of waiting for the downstream timeout.  Once
+``COMAN_MANAGER_BREAKER_COOLDOWN`` seconds have passed the circuit is
+half-open: one probe call is let through at a time, and its outcome closes the
+circuit or opens it for another cooldown.
+
+Failures are exceptions (timeouts, connection errors) and 5xx responses; 4xx
+responses are the caller's problem and count as successes for the breaker.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from coman.core.config import settings
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a tool whose circuit is open."""
+
+    def __init__(self, tool: str, retry_after: float):
+        super().__init__(f"circuit for tool '{tool}' is open, retry in {retry_after:.1f}s")
+        self.tool = tool
+        self.retry_after = retry_after
+
+
+@dataclass
+class _Circuit:
+    window: deque[tuple[float, bool]]
+    calls: int = 0
+    errors: int = 0
+    rejected: int = 0
+    consecutive_failures: int = 0
+    state: str = CLOSED
+    opened_at: float = 0.0
+    probing: bool = False
+    last_error: str | None = None
+
+
+def _percentile(ordered: list, pct: float) -> float | None:
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return round(ordered[rank - 1], 3)
+
+
+class ToolHealth:
+    """Rolling per-tool call statistics plus a circuit breaker per tool."""
+
+    def __init__(
+        self,
+        window: int | None = None,
+        failure_threshold: int | None = None,
+        cooldown: float | None = None,
+    ):
+        self._window = window
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def failure_threshold(self) -> int:
+        if self._failure_threshold is not None:
+            return self._failure_threshold
+        return settings.manager_breaker_failures
+
+    @property
+    def cooldown(self) -> float:
+        if self._cooldown is not None:
+            return self._cooldown
+        return settings.manager_breaker_cooldown
+
+    def _circuit(self, tool: str) -> _Circuit:
+        circuit = self._circuits.get(tool)
+        if circuit is None:
+            size = self._window if self._window is not None else settings.manager_health_window
+            circuit = self._circuits[tool] = _Circuit(window=deque(maxlen=max(1, size)))
+        return circuit
+
+    def acquire(self, tool: str) -> None:
+        """Allow a call to ``tool`` or raise :class:`CircuitOpenError`."""
+
+        now = time.monotonic()
+        with self._lock:
+            circuit = self._circuit(tool)
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.cooldown - now
+                if remaining > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(tool, remaining)
+                circuit.state = HALF_OPEN
+            if circuit.state == HALF_OPEN:
+                if circuit.probing:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(tool, 0.0)
+                circuit.probing = True
+
+    def release(self, tool: str) -> None:
+        """Forget an acquired call that was cancelled before it finished."""
+
+        with self._lock:
+            self._circuit(tool).probing = False
+
+    def record(self, tool: str, latency_ms: float, ok: bool, error: str | None = None) -> None:
+        """Record the outcome of a call allowed by :meth:`acquire`."""
+
+        with self._lock:
+            circuit = self._circuit(tool)
+            circuit.window.append((latency_ms, ok))
+            circuit.calls += 1
+            circuit.probing = False
+            if ok:
+                circuit.consecutive_failures = 0
+                circuit.state = CLOSED
+                return
+            circuit.errors += 1
+            circuit.last_error = error
+            circuit.consecutive_failures += 1
+            if circuit.state == HALF_OPEN or circuit.consecutive_failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+
+    def reset(self, tool: str | None = None) -> None:
+        with self._lock:
+            if tool is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(tool, None)
+
+    def state(self, tool: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(tool)
+            return circuit.state if circuit is not None else CLOSED
+
+    def stats(self, tools: Iterable[str] = ()) -> dict[str, Any]:
+        """Return stats for every tracked tool plus ``tools`` not called yet."""
+
+        now = time.monotonic()
+        with self._lock:
+            names = sorted(set(self._circuits) | set(tools))
+            report: dict[str, Any] = {}
+            for name in names:
+                circuit = self._circuits.get(name)
+                if circuit is None:
+                    report[name] = {"state": CLOSED, "calls": 0, "window": 0}
+                    continue
+                ordered = sorted(latency for latency, _ in circuit.window)
+                failures = sum(1 for _, ok in circuit.window if not ok)
+                error_rate = failures / len(circuit.window) if circuit.window else 0.0
+                entry: dict[str, Any] = {
+                    "state": circuit.state,
+                    "calls": circuit.calls,
+                    "errors": circuit.errors,
+                    "rejected": circuit.rejected,
+                    "window": len(circuit.window),
+                    "error_rate": round(error_rate, 4),
+                    "p50_ms": _percentile(ordered, 50),
+                    "p90_ms": _percentile(ordered, 90),
+                    "p99_ms": _percentile(ordered, 99),
+                    "consecutive_failures": circuit.consecutive_failures,
+                }
+                if circuit.state == OPEN:
+                    retry_in = circuit.opened_at + self.cooldown - now
+                    entry["retry_in_s"] = round(max(0.0, retry_in), 3)
+                if circuit.last_error:
+                    entry["last_error"] = circuit.last_error
+                report[name] = entry
+        return {
+            "failure_threshold": self.failure_threshold,
+            "cooldown_s": self.cooldown,
+            "tools": report,
+        }
@@ -1,57 +1,71 @@
 from __future__ import annotations
-from pathlib import Path
+
+import asyncio
+import contextlib
+import json
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any
 
 from coman.core.base_module import BaseModule
 from coman.core.config import settings
 from coman.core.messages import (
+    ManagerBatchRequest,
     ManagerRunRequest,
     ManagerRunResult,
+    PlanStep,
+    PlanStepResult,
     ToolDefinition,
     ToolRegistry,
 )
-from fastapi import Body, HTTPException, Query
-import os, json, httpx, re
+from coman.core.registry_store import load_registry, save_registry, upsert_registry_items
 
+from coman.core import codec
+from fastapi import Body, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
-def _tools_path() -> Path:
-    return Path(settings.data_dir) / "tools.json"
+from .cache import MISS, ToolResultCache
+from .health import CircuitOpenError, ToolHealth
+from .plan import PlanError, execute_plan
+from .router import GoalRouter
+from .singleflight import SingleFlight
 
 
 def load_tools() -> ToolRegistry:
-    path = _tools_path()
-    if not path.exists():
-        return ToolRegistry()
-    # utf-8-sig — на случай BOM в tools.json
-    with path.open("r", encoding="utf-8-sig") as f:
-        data = json.load(f)
-    return ToolRegistry.from_payload(data)
+    """Return the shared, read-only tool registry."""
+
+    return load_registry("tools", ToolRegistry)
 
 
 def save_tools(registry: ToolRegistry) -> None:
-    path = _tools_path()
-    os.makedirs(path.parent, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(registry.to_payload(), f, ensure_ascii=False, indent=2)
+    save_registry("tools", registry)
 
-URL_RX = re.compile(r'(https?://[^\s\]\)\}\,;"]+)', re.I)
 
-# порядок важен: url/title -> uppercase -> ресурсы
-HEURISTICS = [
-    (re.compile(r"\btitle\b|\burl\b", re.I), "webscraper.title"),
-    (re.compile(r"\bupper(case)?\b", re.I), "text.uppercase"),
-    (re.compile(r"\b(cpu|memory|ram)\b", re.I), "resources.snapshot"),
-]
+def _sse(event: str, data: Any) -> bytes:
+    """Encode one Server-Sent Event; the data is compact JSON on a single line."""
+
+    return b"event: " + event.encode("ascii") + b"\ndata: " + codec.dumps(data) + b"\n\n"
+
 
 class Module(BaseModule):
-    name = "manager"; description = "Minimal AI manager: plan → select tool → execute"
+    name = "manager"
+    description = "Minimal AI manager: plan → select tool → execute"
 
     def __init__(self, core):
         super().__init__(core)
+        self.goal_router = GoalRouter()
+        self.result_cache = ToolResultCache()
+        self.tool_health = ToolHealth()
+        self.inflight = SingleFlight()
 
         @self.router.get("/tools")
         def tools():
             return load_tools().to_payload()
 
+        @self.router.get("/tools/health")
+        def tools_health():
+            return self.tool_health.stats(load_tools().names())
+
         @self.router.post("/tools/register")
         def register_tool(
             payload: ToolDefinition | None = Body(default=None),
@@ -73,76 +87,390 @@ class Module(BaseModule):
                     params=params,
                     desc=desc,
                 )
-            registry = load_tools()
-            registry.upsert(tool)
-            save_tools(registry)
+            upsert_registry_items("tools", [tool])
+            self.goal_router.add(tool, registry=load_tools())
+            # Определение инструмента могло измениться — старые результаты не годятся.
+            self.result_cache.purge(tool.name)
+            self.tool_health.reset(tool.name)
             resp = {"ok": True, "tool": tool.to_payload()}
             return resp
 
+        @self.router.get("/cache")
+        def cache_stats():
+            return self.result_cache.stats()
+
+        @self.router.get("/coalescing")
+        def coalescing_stats():
+            return self.inflight.stats()
+
+        @self.router.post("/cache/purge")
+        def purge_cache(tool: str | None = Query(default=None)):
+            return {"ok": True, "purged": self.result_cache.purge(tool or None)}
+
         @self.router.post("/run")
-        def run(payload: ManagerRunRequest | dict | None = Body(default=None), goal_q: str | None = Query(default=None)):
+        async def run(
+            payload: ManagerRunRequest | dict | None = Body(default=None),
+            goal_q: str | None = Query(default=None),
+        ):
             req = ManagerRunRequest.from_payload(payload)
             if goal_q and not req.goal:
                 req = req.clone(goal=goal_q)
-            goal = req.goal
-            inputs = req.inputs
-
-            # 1) если есть URL — принудительно webscraper.title
-            url_in_text = None
-            m = URL_RX.search(goal or "")
-            if m:
-                url_in_text = m.group(1)
-                tool_name = "webscraper.title"
-            else:
-                tool_name = None
-                for rx, name in HEURISTICS:
-                    if goal and rx.search(goal):
-                        tool_name = name
-                        break
 
             registry = load_tools()
-            if not tool_name:
-                result = ManagerRunResult(goal=goal, error="no_tool", message="No matching tool found")
-                result.set_known_tools(registry)
-                return result.to_payload()
+            if req.plan:
+                return (await self.run_plan(req, registry)).to_payload()
 
-            tool = registry.find(tool_name)
-            if not tool:
-                result = ManagerRunResult(goal=goal, tool=tool_name, error="unknown_tool", message="Tool is not registered")
-                payload = result.to_payload()
-                payload.setdefault("name", tool_name)
-                return payload
-
-            method, path, params = tool.method, tool.path, tool.params
-            query = {}
-            for p in params:
-                if p in (inputs or {}):
-                    query[p] = inputs[p]
-                elif p == "s":
-                    query[p] = goal
-                elif p == "url" and url_in_text:
-                    query["url"] = url_in_text
-
-            with httpx.Client(timeout=20) as c:
-                r = c.get(f"{settings.api_base}{path}", params=query) if method == "GET" else c.post(f"{settings.api_base}{path}", params=query, json={})
-
-            # 2) НОРМАЛИЗАЦИЯ ОТВЕТА: декодируем мягко, разворачиваем строковый JSON, приводим к объекту
+            self.goal_router.sync(registry)
+            tool, outcome = self.route_goal(req, registry)
+            if tool is None:
+                return outcome
             try:
-                res_body = r.json()
-            except Exception:
-                res_body = r.text
-
-            if isinstance(res_body, str):
-                s = res_body.strip()
-                if (s.startswith("{") and s.endswith("}")) or (s.startswith("[") and s.endswith("]")):
-                    try:
-                        res_body = json.loads(s)
-                    except Exception:
-                        pass
-
-            # если всё ещё строка — оборачиваем как {"text": "..."}
-            if isinstance(res_body, str):
-                res_body = {"text": res_body}
-
-            result = ManagerRunResult(goal=goal, tool=tool_name, query=query, result=res_body)
+                _, res_body = await self.invoke_tool(tool, outcome)
+            except CircuitOpenError as exc:
+                result = ManagerRunResult(
+                    goal=req.goal,
+                    tool=tool.name,
+                    query=outcome,
+                    error="circuit_open",
+                    message=str(exc),
+                )
+                return result.to_payload()
+            result = ManagerRunResult(goal=req.goal, tool=tool.name, query=outcome, result=res_body)
             return result.to_payload()
+
+        @self.router.post("/run/stream")
+        async def run_stream(
+            payload: ManagerRunRequest | dict | None = Body(default=None),
+            goal_q: str | None = Query(default=None),
+        ):
+            req = ManagerRunRequest.from_payload(payload)
+            if goal_q and not req.goal:
+                req = req.clone(goal=goal_q)
+            return StreamingResponse(self.stream_run(req), media_type="text/event-stream")
+
+        @self.router.post("/run-batch")
+        async def run_batch(payload: ManagerBatchRequest | dict | None = Body(default=None)):
+            req = ManagerBatchRequest.from_payload(payload)
+            return StreamingResponse(self.stream_batch(req), media_type="application/x-ndjson")
+
+    def route_goal(
+        self,
+        req: ManagerRunRequest,
+        registry: ToolRegistry,
+    ) -> tuple[ToolDefinition | None, dict[str, Any]]:
+        """Return ``(tool, query)`` for ``req`` or ``(None, error payload)``.
+
+        The caller syncs ``self.goal_router`` with ``registry`` first.
+        """
+
+        goal = req.goal
+
+        def usable(name: str) -> bool:
+            # Инструмент без нужных параметров (например, title без URL) вызывать бессмысленно.
+            tool = registry.find(name)
+            if tool is None:
+                return True
+            return set(tool.params) <= self.tool_query(tool, req.inputs, goal).keys()
+
+        # 1) URL в цели — webscraper.title, иначе индекс ключевых слов
+        route = self.goal_router.route(goal, usable)
+        tool_name = route.tool if route else None
+        url_in_text = route.captures.get("url") if route else None
+
+        if not tool_name:
+            result = ManagerRunResult(goal=goal, error="no_tool", message="No matching tool found")
+            result.set_known_tools(registry)
+            return None, result.to_payload()
+
+        tool = registry.find(tool_name)
+        if not tool:
+            result = ManagerRunResult(goal=goal, tool=tool_name, error="unknown_tool", message="Tool is not registered")
+            payload = result.to_payload()
+            payload.setdefault("name", tool_name)
+            return None, payload
+
+        return tool, self.tool_query(tool, req.inputs, goal, url_in_text)
+
+    @staticmethod
+    def tool_query(
+        tool: ToolDefinition,
+        inputs: dict[str, Any],
+        goal: str = "",
+        url_in_text: str | None = None,
+    ) -> dict[str, Any]:
+        query = {}
+        for p in tool.params:
+            if p in (inputs or {}):
+                query[p] = inputs[p]
+            elif p == "s":
+                query[p] = goal
+            elif p == "url" and url_in_text:
+                query["url"] = url_in_text
+        return query
+
+    async def invoke_tool(self, tool: ToolDefinition, query: dict[str, Any]):
+        """Call ``tool`` with ``query`` and return ``(response, normalised body)``.
+
+        Results of ``cacheable`` tools are served from ``self.result_cache``;
+        ``response`` is ``None`` on a cache hit.  Identical concurrent calls of
+        ``GET``/``HEAD`` or cacheable tools share one upstream request through
+        ``self.inflight``.  Upstream calls go through the tool's circuit
+        breaker in ``self.tool_health`` and raise :class:`CircuitOpenError`
+        while it is open.
+        """
+
+        key = None
+        if tool.cacheable:
+            key = self.result_cache.key(tool, query)
+            cached = self.result_cache.get(key)
+            if cached is not MISS:
+                return None, cached
+
+        # Одинаковые одновременные запросы ждут один вызов; POST с побочными эффектами не склеиваем.
+        if settings.manager_coalesce and (tool.cacheable or tool.method in ("GET", "HEAD")):
+            flight_key = key or self.result_cache.key(tool, query)
+            return await self.inflight.do(
+                flight_key,
+                lambda: self._guarded_call(tool, query, key),
+                label=tool.name,
+            )
+        return await self._guarded_call(tool, query, key)
+
+    async def _guarded_call(
+        self,
+        tool: ToolDefinition,
+        query: dict[str, Any],
+        cache_key: Any = None,
+    ):
+        # Открытая цепь отвечает сразу, не дожидаясь таймаута мёртвого сервиса.
+        self.tool_health.acquire(tool.name)
+        started = time.perf_counter()
+        try:
+            r, res_body = await self._invoke_tool(tool, query)
+        except asyncio.CancelledError:
+            self.tool_health.release(tool.name)
+            raise
+        except Exception as exc:
+            latency_ms = (time.perf_counter() - started) * 1000
+            self.tool_health.record(tool.name, latency_ms, False, f"{type(exc).__name__}: {exc}")
+            raise
+        latency_ms = (time.perf_counter() - started) * 1000
+        status = getattr(r, "status_code", 200)
+        ok = status < 500
+        self.tool_health.record(tool.name, latency_ms, ok, None if ok else f"HTTP {status}")
+
+        if cache_key is not None and getattr(r, "is_success", True):
+            self.result_cache.put(cache_key, res_body, self.result_cache.ttl_for(tool))
+        return r, res_body
+
+    async def _invoke_tool(self, tool: ToolDefinition, query: dict[str, Any]):
+        method = tool.method
+        r = await self.dispatcher.arequest(
+            method,
+            tool.path,
+            params=query,
+            json=None if method == "GET" else {},
+            http_timeout=20,
+        )
+
+        # 2) НОРМАЛИЗАЦИЯ ОТВЕТА: декодируем мягко, разворачиваем строковый JSON, приводим к объекту
+        try:
+            res_body = r.json()
+        except Exception:
+            res_body = r.text
+
+        if isinstance(res_body, str):
+            s = res_body.strip()
+            if (s.startswith("{") and s.endswith("}")) or (s.startswith("[") and s.endswith("]")):
+                with contextlib.suppress(Exception):
+                    res_body = codec.loads(s)
+
+        # если всё ещё строка — оборачиваем как {"text": "..."}
+        if isinstance(res_body, str):
+            res_body = {"text": res_body}
+        return r, res_body
+
+    async def run_plan(
+        self,
+        req: ManagerRunRequest,
+        registry: ToolRegistry,
+        on_event: Callable[[str, dict[str, Any]], None] | None = None,
+    ) -> ManagerRunResult:
+        """Execute ``req.plan``: independent steps run concurrently.
+
+        ``on_event`` receives ``dispatch`` and ``step`` progress events.
+        """
+
+        async def call_step(step: PlanStep, inputs: dict[str, Any]):
+            tool = registry.find(step.tool)
+            if tool is None:
+                raise LookupError(f"tool '{step.tool}' is not registered")
+            query = self.tool_query(tool, inputs, req.goal)
+            if on_event is not None:
+                on_event("dispatch", {"step": step.id, "tool": tool.name, "query": query})
+            response, body = await self.invoke_tool(tool, query)
+            # В плане ошибка шага отменяет зависимые шаги.
+            if not getattr(response, "is_success", True):
+                response.raise_for_status()
+            return query, body
+
+        def on_result(step: PlanStepResult) -> None:
+            on_event("step", step.to_payload())
+
+        started = time.perf_counter()
+        try:
+            steps = await execute_plan(req.plan or [], call_step, on_result if on_event else None)
+        except PlanError as exc:
+            raise HTTPException(400, str(exc)) from exc
+        result = ManagerRunResult(
+            goal=req.goal,
+            steps=steps,
+            result={step.id: step.result for step in steps if step.status == "ok"},
+            latency_ms=round((time.perf_counter() - started) * 1000, 3),
+        )
+        failed = [step.id for step in steps if step.status != "ok"]
+        if failed:
+            result.error = "step_failed"
+            result.message = f"Steps not completed: {', '.join(failed)}"
+        return result
+
+    async def stream_run(self, req: ManagerRunRequest) -> AsyncIterator[bytes]:
+        """Run ``req`` and yield Server-Sent Events describing its progress.
+
+        Events: ``route`` (selected tool and query, or the plan's step ids),
+        ``dispatch`` (before each tool call), ``step`` (each finished plan
+        step), then ``result`` with the same payload ``/run`` returns, or
+        ``error``.  Closing the stream cancels the run.
+        """
+
+        registry = load_tools()
+        if req.plan:
+            yield _sse("route", {"goal": req.goal, "plan": [step.id for step in req.plan]})
+            events: asyncio.Queue = asyncio.Queue()
+            task = asyncio.ensure_future(
+                self.run_plan(req, registry, lambda *event: events.put_nowait(event)),
+            )
+            task.add_done_callback(lambda _: events.put_nowait(None))
+            try:
+                while (event := await events.get()) is not None:
+                    yield _sse(*event)
+                try:
+                    result = task.result()
+                except HTTPException as exc:
+                    yield _sse(
+                        "error",
+                        {"goal": req.goal, "error": "invalid_plan", "message": str(exc.detail)},
+                    )
+                    return
+                except Exception as exc:
+                    message = f"{type(exc).__name__}: {exc}"
+                    yield _sse(
+                        "error",
+                        {"goal": req.goal, "error": "plan_failed", "message": message},
+                    )
+                    return
+                yield _sse("result", result.to_payload())
+            finally:
+                task.cancel()
+            return
+
+        self.goal_router.sync(registry)
+        tool, outcome = self.route_goal(req, registry)
+        if tool is None:
+            yield _sse("route", {"goal": req.goal, "tool": outcome.get("tool")})
+            yield _sse("result", outcome)
+            return
+        yield _sse("route", {"goal": req.goal, "tool": tool.name, "query": outcome})
+        yield _sse("dispatch", {"tool": tool.name, "method": tool.method, "path": tool.path})
+        try:
+            _, res_body = await self.invoke_tool(tool, outcome)
+        except Exception as exc:
+            yield _sse(
+                "error",
+                {
+                    "goal": req.goal,
+                    "tool": tool.name,
+                    "error": "dispatch_failed",
+                    "message": f"{type(exc).__name__}: {exc}",
+                },
+            )
+            return
+        result = ManagerRunResult(goal=req.goal, tool=tool.name, query=outcome, result=res_body)
+        yield _sse("result", result.to_payload())
+
+    async def stream_batch(self, req: ManagerBatchRequest) -> AsyncIterator[bytes]:
+        """Run every goal of ``req`` and yield NDJSON lines as calls complete.
+
+        Goals are routed up front; goals resolving to the same tool and query
+        share one call.  Unique calls (and plans) run concurrently, at most
+        ``settings.manager_batch_concurrency`` at a time.  Each line carries
+        the goal's ``index`` in ``req.goals``.
+        """
+
+        registry = load_tools()
+        self.goal_router.sync(registry)
+        limit = max(1, settings.manager_batch_concurrency)
+        if req.concurrency:
+            limit = max(1, min(limit, req.concurrency))
+        slots = asyncio.Semaphore(limit)
+
+        def line(index: int, payload: dict[str, Any]) -> bytes:
+            return codec.dumps({"index": index, **payload}) + b"\n"
+
+        async def call(tool: ToolDefinition, query: dict[str, Any], indices: list[int]):
+            async with slots:
+                try:
+                    _, body = await self.invoke_tool(tool, query)
+                    outcome = {"result": body}
+                except Exception as exc:
+                    message = f"{type(exc).__name__}: {exc}"
+                    outcome = {"error": "dispatch_failed", "message": message}
+            results = []
+            for index in indices:
+                goal = req.goals[index].goal
+                result = ManagerRunResult(goal=goal, tool=tool.name, query=query, **outcome)
+                results.append((index, result.to_payload()))
+            return results
+
+        async def plan(index: int, item: ManagerRunRequest):
+            async with slots:
+                try:
+                    payload = (await self.run_plan(item, registry)).to_payload()
+                except HTTPException as exc:
+                    result = ManagerRunResult(
+                        goal=item.goal,
+                        error="invalid_plan",
+                        message=str(exc.detail),
+                    )
+                    payload = result.to_payload()
+            return [(index, payload)]
+
+        # (tool, query) -> one call shared by every goal resolving to it.
+        calls: dict[str, tuple[ToolDefinition, dict[str, Any], list[int]]] = {}
+        tasks = []
+        for index, item in enumerate(req.goals):
+            if item.plan:
+                tasks.append(plan(index, item))
+                continue
+            tool, outcome = self.route_goal(item, registry)
+            if tool is None:
+                # Реестр целиком есть в GET /tools, не повторяем его в каждой строке.
+                outcome.pop("known_tools", None)
+                yield line(index, outcome)
+                continue
+            key = json.dumps([tool.name, outcome], sort_keys=True, default=str)
+            if key in calls:
+                calls[key][2].append(index)
+            else:
+                calls[key] = (tool, outcome, [index])
+        tasks.extend(call(*entry) for entry in calls.values())
+
+        pending = [asyncio.ensure_future(task) for task in tasks]
+        try:
+            for finished in asyncio.as_completed(pending):
+                for index, payload in await finished:
+                    yield line(index, payload)
+        finally:
+            # Клиент отключился — не продолжаем оставшиеся вызовы.
+            for task in pending:
+                task.cancel()
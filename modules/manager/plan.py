@@ -0,0 +1,163 @@
+"""Concurrent execution of multi-step manager plans.
+
+A plan is a list of :class:`PlanStep` forming a DAG: a step runs once every
+step it depends on has succeeded.  Dependencies are the explicit
+``depends_on`` ids plus every step referenced from ``inputs`` with
+``"${step_id}"`` or ``"${step_id.path.to.value}"``.  A value that is exactly
+one reference is replaced by the referenced output; references embedded in a
+longer string are interpolated as text.
+
+Independent steps run concurrently, each under its own timeout.  When a step
+fails or times out, the steps depending on it (directly or transitively) are
+reported as ``cancelled`` without being started.  ``on_result`` is called with
+each step's result as soon as it is known, for progress streaming.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from coman.core.messages import PlanStep, PlanStepResult
+
+REF_RX = re.compile(r"\$\{([A-Za-z0-9_\-]+)((?:\.[^.}]+)*)\}")
+
+DEFAULT_STEP_TIMEOUT = 20.0
+
+ToolCall = Callable[[PlanStep, dict[str, Any]], Awaitable[tuple[dict[str, Any], Any]]]
+
+
+class PlanError(ValueError):
+    """The plan is not a valid DAG (duplicate ids, unknown references, cycles)."""
+
+
+def _references(value: Any, found: set[str]) -> set[str]:
+    if isinstance(value, str):
+        found.update(match.group(1) for match in REF_RX.finditer(value))
+    elif isinstance(value, dict):
+        for item in value.values():
+            _references(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            _references(item, found)
+    return found
+
+
+def step_dependencies(steps: list[PlanStep]) -> dict[str, list[str]]:
+    """Return ``step id -> dependency ids`` after checking the plan is a DAG."""
+
+    ids = [step.id for step in steps]
+    if len(set(ids)) != len(ids):
+        raise PlanError("step ids must be unique")
+    known = set(ids)
+    deps: dict[str, list[str]] = {}
+    for step in steps:
+        wanted = list(dict.fromkeys([*step.depends_on, *sorted(_references(step.inputs, set()))]))
+        unknown = [dep for dep in wanted if dep not in known]
+        if unknown:
+            raise PlanError(f"step '{step.id}' depends on unknown step(s): {', '.join(unknown)}")
+        if step.id in wanted:
+            raise PlanError(f"step '{step.id}' depends on itself")
+        deps[step.id] = wanted
+
+    # Kahn's algorithm: anything left unvisited sits on a cycle.
+    remaining = {step_id: len(wanted) for step_id, wanted in deps.items()}
+    dependents: dict[str, list[str]] = {step_id: [] for step_id in deps}
+    for step_id, wanted in deps.items():
+        for dep in wanted:
+            dependents[dep].append(step_id)
+    ready = [step_id for step_id, count in remaining.items() if count == 0]
+    visited = 0
+    while ready:
+        step_id = ready.pop()
+        visited += 1
+        for child in dependents[step_id]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                ready.append(child)
+    if visited != len(deps):
+        cyclic = sorted(step_id for step_id, count in remaining.items() if count)
+        raise PlanError(f"plan has a cycle through: {', '.join(cyclic)}")
+    return deps
+
+
+def _lookup(outputs: dict[str, Any], step_id: str, path: str) -> Any:
+    value = outputs[step_id]
+    for key in filter(None, path.split(".")):
+        if isinstance(value, dict):
+            value = value[key]
+        elif isinstance(value, list):
+            value = value[int(key)]
+        else:
+            raise KeyError(key)
+    return value
+
+
+def resolve_references(value: Any, outputs: dict[str, Any]) -> Any:
+    """Substitute ``${step.path}`` references in ``value`` with step outputs."""
+
+    if isinstance(value, str):
+        match = REF_RX.fullmatch(value)
+        if match:
+            return _lookup(outputs, match.group(1), match.group(2))
+        return REF_RX.sub(lambda m: str(_lookup(outputs, m.group(1), m.group(2))), value)
+    if isinstance(value, dict):
+        return {key: resolve_references(item, outputs) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_references(item, outputs) for item in value]
+    return value
+
+
+async def execute_plan(
+    steps: list[PlanStep],
+    call_tool: ToolCall,
+    on_result: Callable[[PlanStepResult], None] | None = None,
+) -> list[PlanStepResult]:
+    """Run ``steps`` concurrently in dependency order; results keep plan order."""
+
+    deps = step_dependencies(steps)
+    outputs: dict[str, Any] = {}
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def run(step: PlanStep) -> PlanStepResult:
+        result = await _run(step)
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    async def _run(step: PlanStep) -> PlanStepResult:
+        upstream = [await tasks[dep] for dep in deps[step.id]]
+        failed = next((res for res in upstream if res.status != "ok"), None)
+        if failed is not None:
+            return PlanStepResult(
+                id=step.id,
+                tool=step.tool,
+                status="cancelled",
+                error=f"dependency '{failed.id}' {failed.status}",
+            )
+
+        result = PlanStepResult(id=step.id, tool=step.tool, status="ok")
+        try:
+            inputs = resolve_references(step.inputs, outputs)
+        except (KeyError, IndexError, ValueError) as exc:
+            result.status, result.error = "error", f"cannot resolve input: {exc!r}"
+            return result
+
+        timeout = step.timeout if step.timeout is not None else DEFAULT_STEP_TIMEOUT
+        started = time.perf_counter()
+        try:
+            result.query, result.result = await asyncio.wait_for(call_tool(step, inputs), timeout)
+            outputs[step.id] = result.result
+        except TimeoutError:
+            result.status, result.error = "timeout", f"step exceeded {timeout:g}s"
+        except Exception as exc:  # tool failures are reported per step
+            result.status, result.error = "error", f"{type(exc).__name__}: {exc}"
+        result.latency_ms = round((time.perf_counter() - started) * 1000, 3)
+        return result
+
+    for step in steps:
+        tasks[step.id] = asyncio.ensure_future(run(step))
+    return list(await asyncio.gather(*tasks.values()))
@@ -0,0 +1,263 @@
+"""Goal router for the manager's ``/run`` endpoint.
+
+:class:`GoalRouter` maps a free-text goal to a tool in one pass over the goal:
+
+* pattern triggers (the built-in URL rule plus every ``ToolDefinition.patterns``
+  entry) are compiled into a single alternation with one named group per
+  pattern, so the leftmost match identifies the tool.  Patterns with their own
+  capturing groups are compiled separately, since numbered backreferences
+  would point at the wrong group inside the alternation;
+* otherwise the goal's words are looked up in an inverted index built from
+  each tool's trigger words (``keywords`` and the built-in heuristics), name
+  and description.
+
+Keyword matches are ranked by tier (trigger words, then name, then
+description), then by the number of goal words matched in that tier, then by
+registration order.  Tools the caller cannot call (``usable`` returns false,
+e.g. a required parameter is missing) are skipped, falling through to the next
+tier.  Lookups cost a dict probe per goal word plus the tools sharing a
+matched word, independent of how many tools are registered, and
+:meth:`GoalRouter.add` updates the index for a single tool.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from re import Pattern
+from typing import Any
+
+log = logging.getLogger("coman.manager.router")
+
+URL_RX = re.compile(r'(https?://[^\s\]\)\}\,;"]+)', re.I)
+
+# Routing rules that predate declared trigger words: (trigger words, tool).
+# Their order breaks ties ahead of registered tools.
+BUILTIN_KEYWORDS: list[tuple[tuple[str, ...], str]] = [
+    (("title", "url"), "webscraper.title"),
+    (("upper", "uppercase"), "text.uppercase"),
+    (("cpu", "memory", "ram"), "resources.snapshot"),
+]
+# Built-in pattern triggers: (regex, tool, parameter bound to the matched text).
+BUILTIN_PATTERNS: list[tuple[str, str, str | None]] = [
+    (URL_RX.pattern, "webscraper.title", "url"),
+]
+
+TIER_TRIGGER, TIER_NAME, TIER_DESC = 0, 1, 2
+
+_WORD_RX = re.compile(r"\w+")
+_STOP_TEXT = "a an and the of to in on for with from by is are be or at as it this that"
+_STOP_WORDS = frozenset(_STOP_TEXT.split())
+
+
+def _words(text: str | None) -> list[str]:
+    return [w for w in _WORD_RX.findall((text or "").lower()) if w not in _STOP_WORDS]
+
+
+@dataclass(frozen=True)
+class Route:
+    tool: str
+    # Goal text captured by a pattern trigger, keyed by the parameter it fills.
+    captures: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class _Pattern:
+    tool: str
+    regex: str
+    param: str | None
+
+
+# Compiled triggers: the shared alternation with its group -> (order, pattern)
+# map, and the patterns searched on their own as (order, regex, pattern).
+_CompiledPatterns = tuple[
+    Pattern[str],
+    dict[str, tuple[int, _Pattern]],
+    list[tuple[int, Pattern[str], _Pattern]],
+]
+
+
+class GoalRouter:
+    """Keyword index and compiled pattern alternation over registered tools."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._source: Any = None
+        # One inverted index per tier: word -> tools (dict used as ordered set).
+        self._postings: tuple[dict[str, dict[str, None]], ...] = ({}, {}, {})
+        self._terms: dict[str, set] = {}
+        self._order: dict[str, int] = {}
+        self._tool_patterns: dict[str, list[str]] = {}
+        self._compiled: _CompiledPatterns | None = None
+        self._reset()
+
+    def _reset(self) -> None:
+        for postings in self._postings:
+            postings.clear()
+        self._terms.clear()
+        self._order.clear()
+        self._tool_patterns.clear()
+        self._compiled = None
+        for position, (words, tool) in enumerate(BUILTIN_KEYWORDS):
+            self._order.setdefault(tool, position - len(BUILTIN_KEYWORDS))
+            for word in words:
+                self._post(word, tool, TIER_TRIGGER)
+
+    def _post(self, word: str, tool: str, tier: int) -> None:
+        self._postings[tier].setdefault(word, {})[tool] = None
+        self._terms.setdefault(tool, set()).add((tier, word))
+
+    def _unpost(self, tool: str) -> None:
+        for tier, word in self._terms.pop(tool, ()):
+            postings = self._postings[tier]
+            tools = postings.get(word)
+            if tools is not None:
+                tools.pop(tool, None)
+                if not tools:
+                    del postings[word]
+
+    def _index_tool(self, tool: Any) -> None:
+        name = tool.name
+        self._unpost(name)
+        self._order.setdefault(name, len(self._order))
+        for words, builtin in BUILTIN_KEYWORDS:
+            if builtin == name:
+                for word in words:
+                    self._post(word, name, TIER_TRIGGER)
+        for keyword in getattr(tool, "keywords", None) or ():
+            for word in _words(keyword):
+                self._post(word, name, TIER_TRIGGER)
+        for word in _words(name):
+            self._post(word, name, TIER_NAME)
+        for word in _words(getattr(tool, "desc", "")):
+            self._post(word, name, TIER_DESC)
+
+        patterns = [p for p in getattr(tool, "patterns", None) or () if p]
+        if patterns or name in self._tool_patterns:
+            self._tool_patterns[name] = patterns
+            self._compiled = None
+
+    def _iter_tools(self, registry: Any) -> Iterable[Any]:
+        items = getattr(registry, "tools", None)
+        return items if items is not None else registry
+
+    def rebuild(self, registry: Any) -> None:
+        """Index every tool in ``registry`` from scratch."""
+
+        with self._lock:
+            self._reset()
+            for tool in self._iter_tools(registry):
+                if isinstance(tool, dict):
+                    tool = _DictTool(tool)
+                self._index_tool(tool)
+            self._source = registry
+
+    def add(self, tool: Any, registry: Any = None) -> None:
+        """Re-index a single registered or updated tool.
+
+        ``registry`` is the registry that now contains ``tool``; passing it
+        keeps :meth:`sync` from rebuilding on the next request.
+        """
+
+        with self._lock:
+            self._index_tool(tool)
+            if registry is not None:
+                self._source = registry
+
+    def sync(self, registry: Any) -> None:
+        """Rebuild when ``registry`` is not the object the index was built from."""
+
+        if registry is not self._source:
+            self.rebuild(registry)
+
+    def _patterns(self) -> _CompiledPatterns:
+        compiled = self._compiled
+        if compiled is not None:
+            return compiled
+        with self._lock:
+            entries = [
+                (_Pattern(tool, regex, param), None) for regex, tool, param in BUILTIN_PATTERNS
+            ]
+            for tool, regexes in self._tool_patterns.items():
+                for regex in regexes:
+                    try:
+                        # Compiled wrapped, as in the alternation, to reject global flags.
+                        own = re.compile(f"(?:{regex})", re.I)
+                        if own.groupindex:
+                            raise re.error("named groups are reserved for the router")
+                    except re.error as exc:
+                        log.warning("Ignoring pattern %r of tool %s: %s", regex, tool, exc)
+                        continue
+                    # Group numbers (backreferences) would shift inside the alternation.
+                    entries.append((_Pattern(tool, regex, None), own if own.groups else None))
+            groups: dict[str, tuple[int, _Pattern]] = {}
+            separate: list[tuple[int, Pattern[str], _Pattern]] = []
+            for order, (entry, own) in enumerate(entries):
+                if own is None:
+                    groups[f"_p{order}"] = (order, entry)
+                else:
+                    separate.append((order, own, entry))
+            alternation = "|".join(
+                f"(?P<{group}>{entry.regex})" for group, (_, entry) in groups.items()
+            )
+            compiled = self._compiled = (re.compile(alternation, re.I), groups, separate)
+        return compiled
+
+    def _match_pattern(self, goal: str) -> Route | None:
+        rx, groups, separate = self._patterns()
+        best: tuple[int, int, _Pattern, str] | None = None
+        match = rx.search(goal)
+        if match is not None:
+            order, entry = groups[match.lastgroup]
+            best = (match.start(), order, entry, match.group(match.lastgroup))
+        for order, own, entry in separate:
+            match = own.search(goal)
+            # Same rule as the alternation: leftmost match, then pattern order.
+            if match is not None and (best is None or (match.start(), order) < best[:2]):
+                best = (match.start(), order, entry, match.group(0))
+        if best is None:
+            return None
+        _, _, entry, text = best
+        return Route(entry.tool, {entry.param: text} if entry.param else {})
+
+    def route(self, goal: str | None, usable: Callable[[str], bool] | None = None) -> Route | None:
+        """Return the tool for ``goal`` or ``None`` when nothing matches.
+
+        ``usable`` filters keyword matches; a tier whose matches are all
+        rejected falls through to the next one.
+        """
+
+        if not goal:
+            return None
+        route = self._match_pattern(goal)
+        if route is not None:
+            return route
+
+        words = set(_words(goal))
+        with self._lock:
+            # A lower tier always wins, so common name or description words
+            # are only scanned when no trigger word matched.
+            for postings in self._postings:
+                hits: dict[str, int] = {}
+                for word in words:
+                    for tool in postings.get(word, ()):
+                        hits[tool] = hits.get(tool, 0) + 1
+                if usable is not None:
+                    hits = {tool: count for tool, count in hits.items() if usable(tool)}
+                if hits:
+                    order = self._order
+                    return Route(min(hits, key=lambda tool: (-hits[tool], order.get(tool, 0))))
+        return None
+
+
+class _DictTool:
+    """Attribute view over a raw tool payload (the vendored pydantic keeps dicts)."""
+
+    def __init__(self, data: dict[str, Any]):
+        self.name = data["name"]
+        self.desc = data.get("desc", "")
+        self.keywords = data.get("keywords")
+        self.patterns = data.get("patterns")
@@ -0,0 +1,87 @@
+"""In-flight coalescing of identical concurrent tool calls.
+
+:class:`SingleFlight` runs at most one call per key at a time: callers that
+arrive while a call for the same key is in flight wait for it and receive the
+same result (or exception) instead of issuing their own upstream request.
+The call runs in its own task, so a waiter that is cancelled does not cancel
+it for the others; it is cancelled only when every waiter has gone.
+
+Shared results must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Future[Any]
+    waiters: int = 0
+
+
+@dataclass
+class _Counters:
+    calls: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent awaitables by key with per-label counters."""
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, _Flight] = {}
+        self._counters: dict[str, _Counters] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]], label: str = "") -> Any:
+        """Await ``call()``, or the call already in flight for ``key``."""
+
+        counters = self._counters.get(label)
+        if counters is None:
+            counters = self._counters[label] = _Counters()
+        counters.calls += 1
+
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(call()))
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            counters.coalesced += 1
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> dict[str, Any]:
+        calls = sum(c.calls for c in self._counters.values())
+        coalesced = sum(c.coalesced for c in self._counters.values())
+        return {
+            "calls": calls,
+            "upstream": calls - coalesced,
+            "coalesced": coalesced,
+            "ratio": round(coalesced / calls, 4) if calls else 0.0,
+            "in_flight": len(self._flights),
+            "tools": {
+                label: {
+                    "calls": c.calls,
+                    "coalesced": c.coalesced,
+                    "ratio": round(c.coalesced / c.calls, 4) if c.calls else 0.0,
+                }
+                for label, c in sorted(self._counters.items())
+            },
+        }
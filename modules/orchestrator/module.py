@@ -1,31 +1,18 @@
 from __future__ import annotations
-from pathlib import Path
 
 from coman.core.base_module import BaseModule
 from coman.core.messages import Capability, CapabilityRegistry
 from fastapi import Body, HTTPException
-import os, json, importlib.util, glob
-from coman.core.config import settings
-
-
-def _cap_path() -> Path:
-    return Path(settings.data_dir) / "capabilities.json"
+import glob
+import importlib.util
+import os
+from coman.core.registry_store import load_registry, upsert_registry_items
 
 
 def load_caps() -> CapabilityRegistry:
-    path = _cap_path()
-    if not path.exists():
-        return CapabilityRegistry()
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    return CapabilityRegistry.from_payload(data)
-
+    """Return the shared, read-only capability registry."""
 
-def save_caps(registry: CapabilityRegistry) -> None:
-    path = _cap_path()
-    os.makedirs(path.parent, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(registry.to_payload(), f, ensure_ascii=False, indent=2)
+    return load_registry("capabilities", CapabilityRegistry)
 class Module(BaseModule):
     name = "orchestrator"; description = "LLM router + capability registry + extensions loader"
     def __init__(self, core):
@@ -41,16 +28,14 @@ class Module(BaseModule):
             endpoint: str = "",
             description: str = "",
         ):
-            registry = load_caps()
             if payload is not None:
                 cap = Capability.from_payload(payload)
             else:
                 cap = Capability(name=name or "", kind=kind, endpoint=endpoint, description=description)
             if not cap.name:
                 raise HTTPException(400, "name is required")
-            registry.add(cap)
-            save_caps(registry)
-            return {"ok": True, "count": len(registry.capabilities)}
+            upsert_registry_items("capabilities", [cap])
+            return {"ok": True, "count": len(load_caps().capabilities)}
         @self.router.post("/extensions/reload")
         def reload_ext(dir_path: str = "./extensions"):
             loaded = []
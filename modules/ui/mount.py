@@ -7,151 +7,164 @@ from fastapi.templating import Jinja2Templates
 import httpx
 import json
 
-from coman.core.config import settings
+from coman.core.dispatch import DispatchError, get_dispatcher
 
 
 _TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
 templates = Jinja2Templates(directory=str(_TEMPLATES_DIR))
 
+# Errors raised by in-process dispatch and by the HTTP fallback for remote modules.
+_CALL_ERRORS = (httpx.HTTPError, DispatchError)
+
+
+def _dispatcher(request: Request):
+    state = getattr(request.app, "state", None)
+    return get_dispatcher(getattr(state, "core", None))
+
 
 def mount_ui(app):
     router = APIRouter()
 
     @router.get("/ui", response_class=HTMLResponse)
-    def index(request: Request):
+    async def index(request: Request):
         return templates.TemplateResponse(request, "index.html", {})
 
     @router.get("/ui/analysis", response_class=HTMLResponse)
-    def analysis_view(request: Request):
+    async def analysis_view(request: Request):
         context = {"text": "", "result_json": None, "error": None}
         return templates.TemplateResponse(request, "analysis.html", context)
 
     @router.post("/ui/analysis/run", response_class=HTMLResponse)
-    def analysis_run(request: Request, text: str = Form(...)):
+    async def analysis_run(request: Request, text: str = Form(...)):
         error = None
         result_json = None
-        with httpx.Client(timeout=10) as c:
+        try:
+            resp = await _dispatcher(request).apost("/v1/analysis/frequency", params={"text": text})
+            resp.raise_for_status()
+        except _CALL_ERRORS as exc:
+            error = f"Request failed: {exc}"
+        else:
             try:
-                resp = c.post(f"{settings.api_base}/v1/analysis/frequency", params={"text": text})
-                resp.raise_for_status()
-            except httpx.HTTPError as exc:
-                error = f"Request failed: {exc}"
-            else:
-                try:
-                    payload = resp.json()
-                except ValueError:
-                    payload = resp.text
-                try:
-                    result_json = json.dumps(payload, ensure_ascii=False, indent=2)
-                except TypeError:
-                    result_json = str(payload)
+                payload = resp.json()
+            except ValueError:
+                payload = resp.text
+            try:
+                result_json = json.dumps(payload, ensure_ascii=False, indent=2)
+            except TypeError:
+                result_json = str(payload)
         context = {"text": text, "result_json": result_json, "error": error}
         return templates.TemplateResponse(request, "analysis.html", context)
 
     @router.get("/ui/tools", response_class=HTMLResponse)
-    def tools_view(request: Request):
-        with httpx.Client(timeout=10) as c:
-            tools = c.get(f"{settings.api_base}/v1/manager/tools").json()
+    async def tools_view(request: Request):
+        tools = (await _dispatcher(request).aget("/v1/manager/tools")).json()
         return templates.TemplateResponse(request, "tools.html", {"tools": tools})
 
     @router.post("/ui/tools/register")
-    def tools_register(request: Request, name: str, method: str, path: str, params: str = "", desc: str = ""):
-        with httpx.Client(timeout=10) as c:
-            c.post(
-                f"{settings.api_base}/v1/manager/tools/register",
-                params={"name": name, "method": method, "path": path, "params": params, "desc": desc},
-            )
+    async def tools_register(
+        request: Request,
+        name: str,
+        method: str,
+        path: str,
+        params: str = "",
+        desc: str = "",
+    ):
+        await _dispatcher(request).apost(
+            "/v1/manager/tools/register",
+            params={"name": name, "method": method, "path": path, "params": params, "desc": desc},
+        )
         return RedirectResponse(url="/ui/tools", status_code=303)
 
     @router.get("/ui/integrations", response_class=HTMLResponse)
-    def integ_view(request: Request):
-        with httpx.Client(timeout=10) as c:
-            lst = c.get(f"{settings.api_base}/v1/integration/list").json()
+    async def integ_view(request: Request):
+        lst = (await _dispatcher(request).aget("/v1/integration/list")).json()
         return templates.TemplateResponse(request, "integrations.html", {"lst": lst})
 
     @router.post("/ui/integrations/register")
-    def integ_register(request: Request, name: str, path: str, module: str, callable: str):
-        with httpx.Client(timeout=10) as c:
-            c.post(
-                f"{settings.api_base}/v1/integration/register",
-                params={"name": name, "path": path, "module": module, "callable": callable},
-            )
+    async def integ_register(request: Request, name: str, path: str, module: str, callable: str):
+        await _dispatcher(request).apost(
+            "/v1/integration/register",
+            params={"name": name, "path": path, "module": module, "callable": callable},
+        )
         return RedirectResponse(url="/ui/integrations", status_code=303)
 
 
     @router.get("/ui/telegram", response_class=HTMLResponse)
-    def telegram_view(request: Request):
+    async def telegram_view(request: Request):
         status = {}
         error = None
-        with httpx.Client(timeout=10) as c:
+        try:
+            resp = await _dispatcher(request).aget("/v1/telegram/status")
+            resp.raise_for_status()
             try:
-                resp = c.get(f"{settings.api_base}/v1/telegram/status")
-                resp.raise_for_status()
-                try:
-                    status = resp.json()
-                except ValueError:
-                    status = {}
-                    error = "Unexpected response from API"
-            except httpx.HTTPError as exc:
-                error = f"Request failed: {exc}"
+                status = resp.json()
+            except ValueError:
+                status = {}
+                error = "Unexpected response from API"
+        except _CALL_ERRORS as exc:
+            error = f"Request failed: {exc}"
         context = {"status": status, "message": None, "error": error}
         return templates.TemplateResponse(request, "telegram.html", context)
 
     @router.post("/ui/telegram/save", response_class=HTMLResponse)
-    def telegram_save(request: Request, token: str = Form(""), action: str = Form("save")):
+    async def telegram_save(request: Request, token: str = Form(""), action: str = Form("save")):
         status = {}
         error = None
         message = None
         payload_token = "" if action == "clear" else token.strip()
 
-        with httpx.Client(timeout=10) as c:
+        c = _dispatcher(request)
+        try:
+            resp = await c.apost("/v1/telegram/token", json={"token": payload_token})
+            resp.raise_for_status()
+            message = "Token saved" if payload_token.strip() else "Token cleared"
+            try:
+                status = resp.json()
+            except ValueError:
+                status = {}
+                error = "Unexpected response from API"
+        except _CALL_ERRORS as exc:
+            error = f"Request failed: {exc}"
+
+        if not status:
             try:
-                resp = c.post(f"{settings.api_base}/v1/telegram/token", json={"token": payload_token})
-                resp.raise_for_status()
-                message = "Token saved" if payload_token.strip() else "Token cleared"
-                try:
-                    status = resp.json()
-                except ValueError:
-                    status = {}
-                    error = "Unexpected response from API"
-            except httpx.HTTPError as exc:
-                error = f"Request failed: {exc}"
-
-            if not status:
-                try:
-                    status_resp = c.get(f"{settings.api_base}/v1/telegram/status")
-                    status_resp.raise_for_status()
-                    status = status_resp.json()
-                except httpx.HTTPError as exc:
-                    if not error:
-                        error = f"Failed to fetch status: {exc}"
-                except ValueError:
-                    if not error:
-                        error = "Failed to parse status response"
+                status_resp = await c.aget("/v1/telegram/status")
+                status_resp.raise_for_status()
+                status = status_resp.json()
+            except _CALL_ERRORS as exc:
+                if not error:
+                    error = f"Failed to fetch status: {exc}"
+            except ValueError:
+                if not error:
+                    error = "Failed to parse status response"
 
         context = {"status": status, "message": message, "error": error}
         return templates.TemplateResponse(request, "telegram.html", context)
 
 
     @router.get("/ui/rules", response_class=HTMLResponse)
-    def rules_view(request: Request):
-        with httpx.Client(timeout=10) as c:
-            rules = c.get(f"{settings.api_base}/v1/logic/rulesx/list").json()
+    async def rules_view(request: Request):
+        rules = (await _dispatcher(request).aget("/v1/logic/rulesx/list")).json()
         return templates.TemplateResponse(request, "rules.html", {"rules": rules})
 
     @router.post("/ui/rules/add")
-    def rules_add(request: Request, name: str, expr_json: str, action_json: str, priority: int = 0):
-        with httpx.Client(timeout=10) as c:
-            c.post(
-                f"{settings.api_base}/v1/logic/rulesx/add",
-                params={
-                    "name": name,
-                    "expr_json": expr_json,
-                    "action_json": action_json,
-                    "priority": priority,
-                    "enabled": 1,
-                },
-            )
+    async def rules_add(
+        request: Request,
+        name: str,
+        expr_json: str,
+        action_json: str,
+        priority: int = 0,
+    ):
+        await _dispatcher(request).apost(
+            "/v1/logic/rulesx/add",
+            params={
+                "name": name,
+                "expr_json": expr_json,
+                "action_json": action_json,
+                "priority": priority,
+                "enabled": 1,
+            },
+        )
         return RedirectResponse(url="/ui/rules", status_code=303)
 
     app.include_router(router)
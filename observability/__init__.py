@@ -2,11 +2,13 @@
 
 from .tracing import (
     instrument_fastapi_app,
+    provider_setup_timings,
     setup_module_observability,
 )
 
 __all__ = [
     "instrument_fastapi_app",
+    "provider_setup_timings",
     "setup_module_observability",
 ]
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from importlib import metadata
 from threading import Lock
 from typing import Any, Callable
@@ -32,6 +33,7 @@ _LOG = logging.getLogger(__name__)
 
 _PROVIDER_LOCK = Lock()
 _PROVIDERS: dict[str, TracerProvider] = {}
+_PROVIDER_SETUP_S: dict[str, float] = {}
 _HTTPX_INSTRUMENTED = False
 _REQUESTS_INSTRUMENTED = False
 
@@ -90,10 +92,12 @@ def _get_or_create_provider(service_name: str, service_version: str | None) -> T
     with _PROVIDER_LOCK:
         provider = _PROVIDERS.get(service_name)
         if provider is None:
+            started = time.perf_counter()
             resource = _build_resource(service_name, service_version)
             provider = TracerProvider(resource=resource)
             _configure_exporters(provider, service_name)
             _PROVIDERS[service_name] = provider
+            _PROVIDER_SETUP_S[service_name] = time.perf_counter() - started
             _LOG.debug(
                 "Created tracer provider for service %s with resource %s",
                 service_name,
@@ -102,6 +106,13 @@ def _get_or_create_provider(service_name: str, service_version: str | None) -> T
         return provider
 
 
+def provider_setup_timings() -> dict[str, float]:
+    """Return the seconds spent creating each service's tracer provider."""
+
+    with _PROVIDER_LOCK:
+        return dict(_PROVIDER_SETUP_S)
+
+
 def _ensure_global_provider(provider: TracerProvider, service_name: str) -> None:
     current = trace.get_tracer_provider()
     current_name = getattr(current, "_coman_service_name", None)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Compare concurrent throughput of blocking vs. async I/O-bound endpoints.
+
+A local upstream answers every request after ``--delay`` seconds.  The script
+fires ``--concurrency`` simultaneous requests at two apps served in-process
+through ``httpx.ASGITransport``:
+
+* ``sync``  - the previous ``def title(url)`` webscraper endpoint, which blocks a
+  Starlette threadpool thread (about 40 by default) for the whole upstream call;
+* ``async`` - the current webscraper module, which awaits the core's pooled
+  ``httpx.AsyncClient`` on the event loop.
+
+Example::
+
+    python scripts/bench_async_endpoints.py --concurrency 200 --delay 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import http.server
+import pathlib
+import sys
+import threading
+import time
+from typing import Any
+
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+
+def _start_upstream(delay: float) -> http.server.ThreadingHTTPServer:
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            time.sleep(delay)
+            body = b"<html><head><title>bench</title></head></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.request_queue_size = 1024
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _sync_app() -> Any:
+    import httpx
+    from bs4 import BeautifulSoup
+
+    from fastapi import FastAPI
+
+    app = FastAPI()
+
+    @app.get("/v1/webscraper/title")
+    def title(url: str):
+        r = httpx.get(url, timeout=10)
+        r.raise_for_status()
+        soup = BeautifulSoup(r.text, "html.parser")
+        return {"url": url, "title": soup.title.string.strip() if soup.title else "(no title)"}
+
+    return app
+
+
+def _async_app() -> Any:
+    from coman.core.registry import Core, load_module
+
+    from fastapi import FastAPI
+
+    core = Core()
+    module = load_module(core, "coman.modules.webscraper_module.module")
+    if module is None:
+        raise SystemExit("webscraper module failed to load")
+    app = FastAPI()
+    app.include_router(module.get_router())
+    return app
+
+
+async def _run(app: Any, url: str, concurrency: int) -> dict[str, float]:
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+        timeout=60,
+    ) as client:
+
+        async def one() -> int:
+            response = await client.get("/v1/webscraper/title", params={"url": url})
+            return response.status_code
+
+        await one()  # warm-up
+        started = time.perf_counter()
+        statuses = await asyncio.gather(*(one() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return {
+        "requests": float(concurrency),
+        "errors": float(sum(1 for status in statuses if status != 200)),
+        "seconds": elapsed,
+        "rps": concurrency / elapsed if elapsed else 0.0,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=0.2, help="Upstream latency in seconds")
+    args = parser.parse_args(argv)
+
+    upstream = _start_upstream(args.delay)
+    url = f"http://127.0.0.1:{upstream.server_address[1]}/"
+    try:
+        for label, factory in (("sync", _sync_app), ("async", _async_app)):
+            stats = asyncio.run(_run(factory(), url, args.concurrency))
+            print(
+                f"{label:<6} {int(stats['requests'])} requests in {stats['seconds']:.2f}s"
+                f"  {stats['rps']:.1f} req/s  errors={int(stats['errors'])}",
+            )
+    finally:
+        upstream.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
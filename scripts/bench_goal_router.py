@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the manager's ``GoalRouter`` at growing tool counts.
+
+Each registered tool gets a name, a description and two trigger words.  The
+script measures ``route`` for goals that hit the first tool, the last tool and
+no tool, and compares it with a per-tool regex scan (what extending the old
+``HEURISTICS`` list to every tool would cost).  ``route`` should stay flat
+from 3 to 3,000 tools.
+
+Example::
+
+    python scripts/bench_goal_router.py --sizes 3,300,3000
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import re
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from core.messages.manager import ToolDefinition, ToolRegistry  # noqa: E402
+from modules.manager.router import GoalRouter  # noqa: E402
+
+
+def _registry(size: int) -> ToolRegistry:
+    return ToolRegistry.from_tools(
+        ToolDefinition(
+            name=f"svc{i}.run",
+            path=f"/v1/svc{i}/run",
+            desc=f"Service number {i} handler",
+            keywords=[f"alpha{i}", f"beta{i}"],
+        )
+        for i in range(size)
+    )
+
+
+def _legacy_router(size: int) -> Callable[[str], Any]:
+    rules = [(re.compile(rf"\balpha{i}\b|\bbeta{i}\b", re.I), f"svc{i}.run") for i in range(size)]
+
+    def route(goal: str) -> Any:
+        for rx, name in rules:
+            if rx.search(goal):
+                return name
+        return None
+
+    return route
+
+
+def _per_route_us(route: Callable[[str], Any], goals: list[str], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for goal in goals:
+            route(goal)
+    return (time.perf_counter() - started) / (repeat * len(goals)) * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="3,300,3000", help="Comma-separated tool counts")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    print(f"{'tools':>8} {'index µs/route':>15} {'scan µs/route':>15}")
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        goals = [
+            "please run alpha0 for me",
+            f"could you handle beta{size - 1} now",
+            "nothing to see in this goal",
+        ]
+        router = GoalRouter()
+        router.rebuild(_registry(size))
+        indexed = _per_route_us(router.route, goals, args.repeat)
+        scan = _per_route_us(_legacy_router(size), goals, max(1, args.repeat // max(1, size // 10)))
+        print(f"{size:>8} {indexed:>15.2f} {scan:>15.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
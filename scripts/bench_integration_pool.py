@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Compare per-call latency of one-shot runner processes and the warm pool.
+
+The one-shot path is what ``/v1/integration/call`` did for every non-inproc
+call: start ``python runner.py``, import the integration and exit.  The pool
+path reuses a warm ``runner.py --serve`` worker.
+
+Example::
+
+    python scripts/bench_integration_pool.py --calls 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import subprocess
+import sys
+import time
+
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from modules.integration.pool import RUNNER, PoolConfig, WorkerPool  # noqa: E402
+
+MODULE = "tests.sample_integration"
+
+
+def _spawn_ms(calls: int) -> float:
+    payload = json.dumps({"module": MODULE, "callable": "run", "kwargs": {"n": 1}})
+    started = time.perf_counter()
+    for _ in range(calls):
+        proc = subprocess.run(
+            [sys.executable, RUNNER],
+            input=payload,
+            text=True,
+            capture_output=True,
+            cwd=_ROOT,
+            timeout=30,
+        )
+        json.loads(proc.stdout)
+    return (time.perf_counter() - started) / calls * 1000
+
+
+def _pool_ms(calls: int) -> float:
+    pool = WorkerPool(
+        "bench",
+        MODULE,
+        str(_ROOT),
+        "",
+        PoolConfig(size=1, warmup=0, max_calls=10**6, max_rss_mb=0),
+    )
+    try:
+        pool.call("run", {"n": 0})  # start and import once
+        started = time.perf_counter()
+        for _ in range(calls):
+            pool.call("run", {"n": 1})
+        return (time.perf_counter() - started) / calls * 1000
+    finally:
+        pool.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    print(f"{'path':>10} {'ms/call':>10}")
+    print(f"{'spawn':>10} {_spawn_ms(args.calls):>10.2f}")
+    print(f"{'pool':>10} {_pool_ms(args.calls):>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for ``IntegrationRegistry`` lookups at growing registry sizes.
+
+For each size the script measures ``find`` on a loaded registry (the
+``/v1/integration/call`` hot path) and compares it with the previous
+implementation, which re-walked and re-validated every entry and scanned the
+list on each lookup.  The per-lookup cost of the current registry should stay
+flat from 100 to 10k integrations.
+
+Example::
+
+    python scripts/bench_integration_registry.py --sizes 100,1000,10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from core.messages.integration import IntegrationDefinition, IntegrationRegistry  # noqa: E402
+
+
+def _payload(size: int) -> dict[str, Any]:
+    return {
+        "integrations": [
+            {"name": f"svc{i}", "path": ".", "module": f"svc{i}.adapter", "callable": "run"}
+            for i in range(size)
+        ],
+    }
+
+
+def _legacy_find(registry: IntegrationRegistry, name: str) -> Any:
+    # Previous behaviour: rebuild the validated list, then scan it.
+    converted: list[IntegrationDefinition] = []
+    for item in registry.integrations:
+        if isinstance(item, IntegrationDefinition):
+            converted.append(item)
+        else:
+            converted.append(IntegrationDefinition.from_payload(item))
+    for item in converted:
+        if item.name == name:
+            return item
+    return None
+
+
+def _per_lookup_us(find: Callable[[str], Any], names: list[str], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for name in names:
+            find(name)
+    return (time.perf_counter() - started) / (repeat * len(names)) * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,10000", help="Comma-separated registry sizes")
+    parser.add_argument("--lookups", type=int, default=200, help="Lookups per measurement")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'size':>8} {'indexed µs/find':>16} {'legacy µs/find':>16}")
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        registry = IntegrationRegistry.from_payload(_payload(size))
+        step = max(1, size // args.lookups)
+        names = [f"svc{i}" for i in range(0, size, step)][: args.lookups]
+        registry.find(names[0])  # build the index once, as a loaded registry would
+        indexed = _per_lookup_us(registry.find, names, args.repeat)
+        legacy = _per_lookup_us(lambda n, r=registry: _legacy_find(r, n), names, 1)
+        print(f"{size:>8} {indexed:>16.2f} {legacy:>16.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for ``ModuleMessage.from_payload`` and ``clone``.
+
+Three paths are measured against the previous implementation, which validated
+once, caught ``ValidationError``, filtered the keys and validated again, and
+cloned through a ``to_payload``/``from_payload`` round trip:
+
+* ``valid``    - well-formed payloads, with and without a custom ``__init__``;
+* ``lenient``  - malformed bodies (a non-mapping body and a dict with an
+  invalid value, which raises);
+* ``clone``    - ``clone(...)`` of a populated message, with and without a
+  custom ``__init__``.
+
+Example::
+
+    python scripts/bench_module_messages.py --number 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from core.messages import ManagerRunRequest, ManagerRunResult, ToolDefinition  # noqa: E402
+from core.messages.base import ValidationError  # noqa: E402
+
+
+def _legacy_from_payload(cls: Any, payload: Any) -> Any:
+    try:
+        return cls.model_validate(payload)
+    except ValidationError:
+        data: dict[str, Any] = {}
+        for field in cls.model_fields:
+            if isinstance(payload, dict) and field in payload:
+                data[field] = payload[field]
+        return cls.model_validate(data)
+
+
+def _legacy_clone(message: Any, **updates: Any) -> Any:
+    data = message.to_payload()
+    data.update(updates)
+    return _legacy_from_payload(type(message), data)
+
+
+def _swallow(func: Callable[[], Any]) -> Callable[[], Any]:
+    def run() -> Any:
+        try:
+            return func()
+        except ValidationError:
+            return None
+
+    return run
+
+
+def _per_call_us(func: Callable[[], Any], number: int) -> float:
+    func()
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - started) / number * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="Calls per measurement")
+    args = parser.parse_args(argv)
+
+    valid = {
+        "name": "text.uppercase",
+        "method": "GET",
+        "path": "/v1/text/uppercase",
+        "trace": "x",
+        "ts": 1,
+    }
+    invalid = {"name": "text.uppercase", "path": "/v1/text/uppercase", "params": 42}
+    request = ManagerRunRequest.from_payload(
+        {
+            "goal": "uppercase",
+            "inputs": {f"k{i}": f"v{i}" for i in range(20)},
+            "metadata": {"trace": "t"},
+        },
+    )
+
+    result = ManagerRunResult.from_payload(
+        {
+            "goal": "uppercase",
+            "tool": "text.uppercase",
+            "query": {"s": "abc"},
+            "result": {"result": "ABC"},
+        },
+    )
+    result_payload = result.to_payload()
+
+    cases = [
+        (
+            "valid",
+            lambda: ManagerRunResult.from_payload(result_payload),
+            lambda: _legacy_from_payload(ManagerRunResult, result_payload),
+        ),
+        (
+            "valid (custom __init__)",
+            lambda: ToolDefinition.from_payload(valid),
+            lambda: _legacy_from_payload(ToolDefinition, valid),
+        ),
+        (
+            "lenient (non-mapping)",
+            lambda: ManagerRunRequest.from_payload(["not", "a", "dict"]),
+            lambda: _legacy_from_payload(ManagerRunRequest, ["not", "a", "dict"]),
+        ),
+        (
+            "lenient (invalid value)",
+            _swallow(lambda: ToolDefinition.from_payload(invalid)),
+            _swallow(lambda: _legacy_from_payload(ToolDefinition, invalid)),
+        ),
+        (
+            "clone",
+            lambda: result.clone(error="timeout"),
+            lambda: _legacy_clone(result, error="timeout"),
+        ),
+        (
+            "clone (custom __init__)",
+            lambda: request.clone(goal="lowercase"),
+            lambda: _legacy_clone(request, goal="lowercase"),
+        ),
+    ]
+
+    print(f"{'path':<26} {'current µs':>12} {'legacy µs':>12}")
+    for label, current, legacy in cases:
+        current_us = _per_call_us(current, args.number)
+        legacy_us = _per_call_us(legacy, args.number)
+        print(f"{label:<26} {current_us:>12.2f} {legacy_us:>12.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,11 +1,34 @@
-import requests
+import threading
 from typing import Any, Dict, Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def shared_session(pool_maxsize: int = 20) -> requests.Session:
+    """Process-wide keep-alive session so bot handlers reuse connections."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
 class ComanAPI:
-    def __init__(self, base_url: str, token: str, timeout_s: int = 12):
+    def __init__(self, base_url: str, token: str, timeout_s: int = 12,
+                 session: Optional[requests.Session] = None):
         self.base_url = base_url.rstrip("/")
         self.token = token
         self.timeout_s = timeout_s
+        self.session = session or shared_session()
 
     def _headers(self) -> Dict[str, str]:
         headers = {"Accept": "application/json"}
@@ -16,7 +39,12 @@ class ComanAPI:
     def get(self, endpoint: str, params: Optional[Dict[str, Any]]=None) -> Dict[str, Any]:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         try:
-            resp = requests.get(url, headers=self._headers(), params=params, timeout=self.timeout_s)
+            resp = self.session.get(
+                url,
+                headers=self._headers(),
+                params=params,
+                timeout=self.timeout_s,
+            )
             resp.raise_for_status()
             return resp.json() if resp.content else {}
         except requests.RequestException as e:
@@ -25,7 +53,12 @@ class ComanAPI:
     def post(self, endpoint: str, json_data: Optional[Dict[str, Any]]=None) -> Dict[str, Any]:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         try:
-            resp = requests.post(url, headers=self._headers(), json=json_data, timeout=self.timeout_s)
+            resp = self.session.post(
+                url,
+                headers=self._headers(),
+                json=json_data,
+                timeout=self.timeout_s,
+            )
             resp.raise_for_status()
             return resp.json() if resp.content else {}
         except requests.RequestException as e:
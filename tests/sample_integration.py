@@ -1,2 +1,16 @@
+import os
+import time
+
+
 def run(**kwargs):
     return {"received": kwargs}
+
+
+def whoami(**kwargs):
+    print("hello from", os.getpid())
+    return {"pid": os.getpid()}
+
+
+def sleep(seconds=0.0):
+    time.sleep(seconds)
+    return {"slept": seconds}
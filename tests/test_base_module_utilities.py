@@ -80,3 +80,63 @@ def test_console_operation_invokes_endpoint() -> None:
 
     with pytest.raises(KeyError):
         module.invoke_console_operation("unknown")
+
+
+def test_console_operation_supports_async_endpoints() -> None:
+    import asyncio
+
+    class DummyCore:
+        pass
+
+    module = BaseModule(DummyCore())
+
+    @module.router.get("/sample-async")
+    async def sample_async(value: int = 1) -> int:
+        await asyncio.sleep(0)
+        return value * 2
+
+    op = module.get_console_operations()["sample_async"]
+    assert op.is_async
+    assert op.invoke({"value": 2}) == 4
+    assert asyncio.run(op.ainvoke({"value": 5})) == 10
+
+
+def test_console_operation_closes_async_http_clients_of_its_loop() -> None:
+    from core.http import HttpClientPool
+
+    pool = HttpClientPool()
+
+    async def fetch() -> Any:
+        return pool.get_async_client()
+
+    operation = ConsoleOperation(name="fetch", route=None, endpoint=fetch, module_name="demo")
+    client = operation.invoke({})
+
+    assert client.is_closed
+    assert len(pool._async_clients) == 0
+
+
+def test_console_operations_are_compiled_once_and_refreshed_on_new_routes() -> None:
+    class DummyCore:
+        pass
+
+    module = BaseModule(DummyCore())
+
+    @module.router.get("/first")
+    def first(item: str, value: int = Query(default=7)) -> tuple[str, int]:
+        return item, value
+
+    op = module.get_console_operations()["first"]
+    assert module.get_console_operations()["first"] is op
+    assert module.invoke_console_operation("First", {"item": "a"}) == ("a", 7)
+    with pytest.raises(TypeError):
+        module.invoke_console_operation("first")
+
+    @module.router.post("/second")
+    def second() -> str:
+        return "second"
+
+    operations = module.get_console_operations()
+    assert operations["first"] is not op
+    assert module.invoke_console_operation("SECOND") == "second"
+    assert module.console_operation_for(operations["second"].route) is operations["second"]
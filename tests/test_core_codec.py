@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import json
+from typing import Any
+
+import pytest
+
+from core import codec
+from core.messages import ToolDefinition
+
+
+def test_dumps_handles_models_non_str_keys_and_big_ints() -> None:
+    tool = ToolDefinition(name="text.uppercase", path="/v1/text/uppercase")
+    payload = {
+        "tool": tool,
+        1: "one",
+        "tags": {"a"},
+        "day": dt.date(2024, 1, 2),
+        "big": 2**70,
+    }
+
+    decoded = codec.loads(codec.dumps(payload))
+
+    assert decoded["tool"]["name"] == "text.uppercase"
+    assert decoded["1"] == "one"
+    assert decoded["tags"] == ["a"]
+    assert decoded["day"] == "2024-01-02"
+    assert decoded["big"] == 2**70
+
+
+def test_dumps_is_compact_utf8() -> None:
+    assert codec.dumps({"k": "привет", "n": [1, 2]}) == '{"k":"привет","n":[1,2]}'.encode()
+
+
+def test_decode_body_by_media_type() -> None:
+    assert codec.decode_body(b'{"a":1}', "application/json; charset=utf-8") == {"a": 1}
+    assert codec.decode_body(b"plain", "text/plain") == "plain"
+
+
+@pytest.mark.skipif(not codec.msgpack_available(), reason="msgpack is not installed")
+def test_accept_negotiation_and_msgpack_round_trip() -> None:
+    assert codec.prefers_msgpack(codec.accept_header())
+    assert codec.prefers_msgpack("application/x-msgpack")
+    assert not codec.prefers_msgpack("application/json, application/msgpack")
+    assert not codec.prefers_msgpack("application/msgpack;q=0.5, application/json")
+    assert not codec.prefers_msgpack(None)
+
+    body = codec.packb({"counts": {"a": 2}})
+    assert codec.decode_body(body, "application/msgpack") == {"counts": {"a": 2}}
+
+
+@pytest.mark.skipif(
+    codec.CodecResponse is None or not codec.msgpack_available(),
+    reason="Starlette and msgpack are required",
+)
+def test_middleware_switches_response_encoding() -> None:
+    sent: list[dict[str, Any]] = []
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        response = codec.CodecResponse({"ok": True})
+        await response(scope, receive, send)
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    async def receive() -> dict[str, Any]:  # pragma: no cover - unused
+        return {"type": "http.request"}
+
+    middleware = codec.CodecNegotiationMiddleware(app)
+    for accept in (b"application/msgpack", b"application/json"):
+        scope = {"type": "http", "headers": [(b"accept", accept)]}
+        asyncio.run(middleware(scope, receive, send))
+
+    msgpack_start, msgpack_body, json_start, json_body = sent
+    assert (b"content-type", b"application/msgpack") in msgpack_start["headers"]
+    assert codec.unpackb(msgpack_body["body"]) == {"ok": True}
+    assert (b"content-type", b"application/json") in json_start["headers"]
+    assert codec.loads(json_body["body"]) == {"ok": True}
+
+
+def test_dumps_rejects_unknown_objects() -> None:
+    with pytest.raises(TypeError):
+        codec.dumps({"value": object()})
+
+
+class _FakeMsgpack:
+    """Stand-in for ``msgpack`` so negotiation is tested without the package."""
+
+    PREFIX = b"\xc1fake"
+
+    @classmethod
+    def packb(cls, obj: Any, default: Any = None, use_bin_type: bool = True) -> bytes:
+        return cls.PREFIX + json.dumps(obj, default=default).encode("utf-8")
+
+    @classmethod
+    def unpackb(cls, data: bytes, raw: bool = False) -> Any:
+        assert data.startswith(cls.PREFIX)
+        return json.loads(data[len(cls.PREFIX) :])
+
+
+@pytest.fixture
+def fake_msgpack(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(codec, "msgpack", _FakeMsgpack)
+
+
+def test_dumps_falls_back_for_integers_wider_than_64_bits() -> None:
+    assert codec.dumps(2**70) == str(2**70).encode("ascii")
+    assert codec.loads(codec.dumps({"big": -(2**70)})) == {"big": -(2**70)}
+
+
+def test_accept_negotiation_with_msgpack(fake_msgpack: None) -> None:
+    assert codec.msgpack_available()
+    assert codec.accept_header() == "application/msgpack, application/json;q=0.9"
+    assert codec.prefers_msgpack("application/msgpack;q=0.9, application/json;q=0.5")
+    assert not codec.prefers_msgpack("application/msgpack;q=bogus, text/html;q=0.1")
+    assert codec.decode_body(codec.packb({"a": [1]}), "application/x-msgpack") == {"a": [1]}
+
+
+def test_msgpack_helpers_require_the_package(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(codec, "msgpack", None)
+    assert codec.accept_header() == "application/json"
+    assert not codec.prefers_msgpack("application/msgpack")
+    with pytest.raises(RuntimeError):
+        codec.packb({})
+    with pytest.raises(RuntimeError):
+        codec.unpackb(b"")
+
+
+def test_stdlib_codec_when_orjson_is_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(codec, "orjson", None)
+    payload = {"k": "привет", "raw": b"bytes", "tool": ToolDefinition(name="t", path="/t")}
+
+    decoded = codec.loads(codec.dumps(payload))
+
+    assert decoded["k"] == "привет"
+    assert decoded["raw"] == "bytes"
+    assert decoded["tool"]["name"] == "t"
+
+
+@pytest.mark.skipif(codec.CodecResponse is None, reason="Starlette is required")
+def test_testclient_round_trip_negotiates_msgpack(fake_msgpack: None) -> None:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    app = FastAPI(default_response_class=codec.CodecResponse)
+    app.add_middleware(codec.CodecNegotiationMiddleware)
+
+    @app.get("/counts")
+    def counts() -> dict[str, Any]:
+        return {"counts": {"a": 2}, "big": 2**70}
+
+    client = TestClient(app)
+    packed = client.get("/counts", headers={"Accept": "application/msgpack"})
+    plain = client.get("/counts", headers={"Accept": "application/json"})
+
+    assert packed.headers["content-type"] == "application/msgpack"
+    assert codec.decode_body(packed.content, packed.headers["content-type"]) == {
+        "counts": {"a": 2},
+        "big": 2**70,
+    }
+    assert plain.headers["content-type"] == "application/json"
+    assert plain.json() == {"counts": {"a": 2}, "big": 2**70}
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from core.daemon import DaemonClient, DaemonServer, DaemonUnavailable, unix_sockets_supported
+
+pytestmark = pytest.mark.skipif(not unix_sockets_supported(), reason="requires Unix sockets")
+
+
+def _echo(line: str) -> dict[str, Any]:
+    request = json.loads(line)
+    return {"ok": True, "result": {"module": request["module"], "args": request["args"]}}
+
+
+def test_daemon_round_trip_and_cleanup(tmp_path: Path) -> None:
+    socket_path = str(tmp_path / "coman.sock")
+    server = DaemonServer(socket_path, _echo)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        client = DaemonClient(socket_path, timeout=5)
+        response = client.call("text", "uppercase", {"s": "hi"})
+        assert response == {"ok": True, "result": {"module": "text", "args": {"s": "hi"}}}
+        with pytest.raises(RuntimeError):
+            DaemonServer(socket_path, _echo)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert not Path(socket_path).exists()
+    with pytest.raises(DaemonUnavailable):
+        DaemonClient(socket_path).call("text", "uppercase", {})
+
+
+def test_daemon_replaces_stale_socket(tmp_path: Path) -> None:
+    socket_path = str(tmp_path / "stale.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()  # leaves the socket file behind with nobody listening
+
+    with pytest.raises(DaemonUnavailable):
+        DaemonClient(socket_path).call("text", "uppercase", {})
+
+    server = DaemonServer(socket_path, _echo)
+    server.server_close()
+
+
+def test_daemon_socket_is_private_and_client_times_out(tmp_path: Path) -> None:
+    socket_path = str(tmp_path / "slow.sock")
+    release = threading.Event()
+
+    def _wedged(line: str) -> dict[str, Any]:
+        release.wait(5)
+        return _echo(line)
+
+    server = DaemonServer(socket_path, _wedged)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+        with pytest.raises(TimeoutError):
+            DaemonClient(socket_path, timeout=0.1).call("text", "uppercase", {})
+    finally:
+        release.set()
+        server.shutdown()
+        server.server_close()
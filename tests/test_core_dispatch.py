@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import types
+from typing import Any
+
+import pytest
+
+from core import dispatch
+from core.dispatch import Dispatcher
+from core.http import HttpClientPool
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from pydantic import BaseModel
+
+
+class Payload(BaseModel):
+    name: str
+    keywords: list[str] = []
+
+
+def _dispatcher() -> tuple[Dispatcher, list[dict[str, Any]]]:
+    router = APIRouter(prefix="/v1/demo")
+
+    @router.post("/register", status_code=201)
+    def register(payload: Payload = Body(...)):
+        return {"name": payload.name, "keywords": payload.keywords}
+
+    @router.get("/items/{item_id}")
+    async def item(item_id: int, limit: int = Query(default=10)):
+        if item_id == 0:
+            raise HTTPException(404, "missing")
+        return {"item_id": item_id, "limit": limit}
+
+    @router.get("/guarded")
+    def guarded(user: str = Depends(lambda: "alice")):
+        return {"user": user}
+
+    module = types.SimpleNamespace(name="demo", router=router)
+    core = types.SimpleNamespace(modules={"demo": module})
+    dispatcher = Dispatcher(core)
+    remote: list[dict[str, Any]] = []
+
+    def fake_http(method: str, path: str, **kwargs: Any) -> Any:
+        remote.append({"method": method, "path": path, **kwargs})
+        return "http"
+
+    dispatcher._http_request = fake_http  # type: ignore[method-assign]
+    return dispatcher, remote
+
+
+def test_dict_body_binds_to_the_declared_model() -> None:
+    dispatcher, _ = _dispatcher()
+
+    response = dispatcher.post("/v1/demo/register", json={"name": "x", "keywords": ["a"]})
+
+    assert response.status_code == 201
+    assert response.json() == {"name": "x", "keywords": ["a"]}
+    assert dispatcher.post("/v1/demo/register", json={"keywords": []}).status_code == 422
+
+
+def test_path_and_query_values_are_validated() -> None:
+    dispatcher, _ = _dispatcher()
+
+    assert dispatcher.get("/v1/demo/items/3", params={"limit": "5"}).json() == {
+        "item_id": 3,
+        "limit": 5,
+    }
+    assert dispatcher.get("/v1/demo/items/3").json() == {"item_id": 3, "limit": 10}
+    invalid = dispatcher.get("/v1/demo/items/3", params={"limit": "many"})
+    assert invalid.status_code == 422
+    assert invalid.json()["detail"][0]["loc"] == ["query", "limit"]
+    assert dispatcher.get("/v1/demo/items/0").status_code == 404
+
+
+def test_sync_request_to_async_endpoint_inside_a_running_loop_points_to_arequest() -> None:
+    dispatcher, _ = _dispatcher()
+
+    async def call_from_loop() -> Any:
+        with pytest.raises(RuntimeError, match="arequest"):
+            dispatcher.get("/v1/demo/items/3")
+        # Sync endpoints still work, and the async API serves the same path.
+        assert dispatcher.post("/v1/demo/register", json={"name": "x"}).status_code == 201
+        return await dispatcher.aget("/v1/demo/items/3")
+
+    assert asyncio.run(call_from_loop()).json() == {"item_id": 3, "limit": 10}
+
+
+def test_routes_with_dependencies_fall_back_to_http() -> None:
+    dispatcher, remote = _dispatcher()
+
+    assert dispatcher.get("/v1/demo/guarded") == "http"
+    assert [call["path"] for call in remote] == ["/v1/demo/guarded"]
+
+
+def test_remote_calls_keep_the_destination_timeout_unless_given(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    timeouts: list[float] = []
+
+    class RecordingPool(HttpClientPool):
+        def request(
+            self,
+            method: str,
+            url: str,
+            *,
+            http_timeout: float | None = None,
+            **kwargs: Any,
+        ) -> Any:
+            timeouts.append(self.timeout_for(url) if http_timeout is None else http_timeout)
+            return "http"
+
+    pool = RecordingPool(timeout=10.0, destination_timeouts={"remote.test": 42.0})
+    dispatcher = Dispatcher(types.SimpleNamespace(modules={}, http=pool))
+    monkeypatch.setattr(dispatch.settings, "remote_base", lambda name: "http://remote.test")
+    monkeypatch.setattr(dispatch.settings, "http_msgpack", False)
+
+    dispatcher.get("/v1/demo/x")
+    dispatcher.get("/v1/demo/x", http_timeout=3)
+
+    assert timeouts == [42.0, 3]
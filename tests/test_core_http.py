@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from core.config import _parse_timeouts
+from core.http import HttpClientPool, aclose_loop_clients, get_http_pool
+
+
+def test_parse_timeouts_skips_invalid_entries() -> None:
+    parsed = _parse_timeouts("api.example.com=30, bad, slow:8080=2.5,x=nan?")
+    assert parsed == {"api.example.com": 30.0, "slow:8080": 2.5}
+
+
+def test_timeout_for_prefers_host_and_port() -> None:
+    pool = HttpClientPool(
+        timeout=10.0,
+        destination_timeouts={"api.example.com": 30.0, "api.example.com:8443": 5.0},
+    )
+    assert pool.timeout_for("https://API.example.com/v1/x") == 30.0
+    assert pool.timeout_for("https://api.example.com:8443/v1/x") == 5.0
+    assert pool.timeout_for("http://other.test/") == 10.0
+
+
+def test_get_http_pool_reuses_core_pool() -> None:
+    class DummyCore:
+        def __init__(self) -> None:
+            self.http = HttpClientPool()
+
+    core = DummyCore()
+    assert get_http_pool(core) is core.http
+    assert get_http_pool(None) is get_http_pool(object())
+
+
+def test_aclose_loop_clients_closes_the_running_loop_clients() -> None:
+    pytest.importorskip("httpx")
+    pool = HttpClientPool()
+
+    async def use_and_close() -> Any:
+        client = pool.get_async_client()
+        await aclose_loop_clients()
+        return client
+
+    client = asyncio.run(use_and_close())
+
+    assert client.is_closed
+    assert len(pool._async_clients) == 0
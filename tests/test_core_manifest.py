@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from core import manifest as manifest_module
+from core import registry as registry_module
+from core.manifest import ModuleManifest, ModuleSpec, fingerprint_package, read_module_attributes
+
+
+def _write_package(root: Path) -> ModuleSpec:
+    package_dir = root / "demo_module"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    source = package_dir / "module.py"
+    source.write_text(
+        "class Module(BaseModule):\n    name = 'demo'; description = 'Demo module'\n",
+    )
+    return ModuleSpec(
+        package="coman.modules.demo_module",
+        import_path="coman.modules.demo_module.module",
+        name="demo",
+        source=str(source),
+    )
+
+
+def _entry(spec: ModuleSpec) -> dict:
+    return {
+        "name": "demo",
+        "import_path": spec.import_path,
+        "description": "Demo module",
+        "version": "1.0.0",
+        "operations": [
+            {"name": "ping", "path": "/v1/demo/ping", "methods": ["GET"], "summary": ""},
+        ],
+        "files": fingerprint_package(os.path.dirname(spec.source)),
+    }
+
+
+def test_read_module_attributes_parses_inline_assignments(tmp_path: Path) -> None:
+    spec = _write_package(tmp_path)
+    assert read_module_attributes(spec.source) == {"name": "demo", "description": "Demo module"}
+
+
+def test_manifest_serves_cached_entries_until_sources_change(tmp_path: Path) -> None:
+    spec = _write_package(tmp_path)
+    manifest = ModuleManifest(tmp_path / "cache" / "manifest.json")
+    manifest.save({spec.package: _entry(spec)})
+
+    fresh, stale = manifest.split([spec])
+    assert list(fresh) == [spec.package]
+    assert stale == []
+    assert fresh[spec.package]["operations"][0]["name"] == "ping"
+
+    # Touching a file without changing it keeps the entry valid.
+    st = os.stat(spec.source)
+    os.utime(spec.source, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+    fresh, stale = manifest.split([spec])
+    assert stale == [] and manifest.touched
+
+    Path(spec.source).write_text("class Module(BaseModule):\n    name = 'demo2'\n")
+    fresh, stale = manifest.split([spec])
+    assert fresh == {}
+    assert stale == [spec]
+
+
+def test_manifest_detects_new_source_files(tmp_path: Path) -> None:
+    spec = _write_package(tmp_path)
+    manifest = ModuleManifest(tmp_path / "manifest.json")
+    manifest.save({spec.package: _entry(spec)})
+
+    (Path(spec.source).parent / "helpers.py").write_text("X = 1\n")
+    _, stale = manifest.split([spec])
+    assert stale == [spec]
+
+
+class _LoadedModule:
+    name = "demo"
+    description = "Demo module"
+    version = "1.0.0"
+
+    def describe_console_operations(self) -> list:
+        return [{"name": "ping", "path": "/v1/demo/ping", "methods": ["GET"], "summary": ""}]
+
+
+@pytest.fixture
+def described(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    spec = _write_package(tmp_path)
+    shared = tmp_path / "base_module.py"
+    shared.write_text("VERSION = 1\n")
+    loads: list[str] = []
+
+    def _load_module(core, import_path):
+        loads.append(import_path)
+        return _LoadedModule()
+
+    monkeypatch.setattr(
+        manifest_module.settings,
+        "cache_dir",
+        str(tmp_path / "cache"),
+        raising=False,
+    )
+    monkeypatch.setattr(manifest_module, "SHARED_SOURCES", (str(shared),))
+    monkeypatch.setattr(manifest_module, "discover_module_specs", lambda: [spec])
+    monkeypatch.setattr(registry_module, "load_module", _load_module)
+    return spec, shared, loads
+
+
+def test_describe_modules_serves_a_warm_manifest_without_imports(described) -> None:
+    spec, _, loads = described
+
+    first = manifest_module.describe_modules()
+    assert loads == [spec.import_path]
+    assert first == [
+        {
+            "name": "demo",
+            "description": "Demo module",
+            "version": "1.0.0",
+            "operations": _LoadedModule().describe_console_operations(),
+        },
+    ]
+
+    assert manifest_module.describe_modules() == first
+    assert loads == [spec.import_path]
+
+
+def test_describe_modules_rebuilds_after_module_or_shared_changes(described) -> None:
+    spec, shared, loads = described
+    manifest_module.describe_modules()
+
+    Path(spec.source).write_text("class Module(BaseModule):\n    name = 'demo'\n")
+    manifest_module.describe_modules()
+    assert len(loads) == 2
+
+    shared.write_text("VERSION = 2\n")
+    manifest_module.describe_modules()
+    assert len(loads) == 3
+
+    manifest_module.describe_modules()
+    manifest_module.describe_modules(refresh=True)
+    assert len(loads) == 4
@@ -51,3 +51,101 @@ def test_load_modules_skips_packages_without_module(monkeypatch: pytest.MonkeyPa
 
     registry.load_modules(core)
     assert core.modules == {}
+
+
+def test_discover_module_specs_reads_names_without_importing() -> None:
+    import sys
+
+    from core.manifest import discover_module_specs
+
+    specs = {spec.name: spec for spec in discover_module_specs()}
+    assert specs["resources"].import_path == "coman.modules.resource_manager.module"
+    assert specs["logic"].description.startswith("Facts & rules")
+    assert "coman.modules.resource_manager.module" not in sys.modules
+
+
+def test_lazy_core_loads_module_on_first_use(monkeypatch: pytest.MonkeyPatch) -> None:
+    from core.manifest import ModuleSpec
+
+    spec = ModuleSpec(
+        package="coman.modules.dummy",
+        import_path="coman.modules.dummy.module",
+        name="dummy",
+    )
+    monkeypatch.setattr(registry, "discover_module_specs", lambda: [spec])
+    imported: list[str] = []
+
+    def fake_import(name: str):
+        imported.append(name)
+        return types.SimpleNamespace(Module=DummyModule)
+
+    monkeypatch.setattr(registry.importlib, "import_module", fake_import)
+
+    core = registry.Core()
+    loaded: list[str] = []
+    core.add_module_listener(lambda module: loaded.append(module.name))
+    registry.load_modules(core, lazy=True)
+
+    assert core.modules == {}
+    assert core.pending_modules() == ["dummy"]
+    assert core.resolve_pending("/v1/dummy/anything") == "dummy"
+    assert core.resolve_pending("/v1/dummyish") is None
+
+    module = core.get_module("dummy")
+    assert isinstance(module, DummyModule)
+    assert core.get_module("dummy") is module
+    assert imported == ["coman.modules.dummy.module"]
+    assert loaded == ["dummy"]
+    assert core.pending_modules() == []
+    assert core.load_timings["dummy"] >= 0
+
+
+def test_parallel_load_keeps_discovery_order_and_reports_timings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import time
+
+    def make_module(module_name: str, delay: float):
+        class _Module(BaseModule):
+            name = module_name
+
+            def __init__(self, core: registry.Core):
+                time.sleep(delay)
+                super().__init__(core)
+
+        return _Module
+
+    classes = {
+        "coman.modules.slow.module": make_module("slow", 0.05),
+        "coman.modules.fast.module": make_module("fast", 0.0),
+    }
+
+    def fake_import(name: str):
+        if name == "coman.modules":
+            return types.SimpleNamespace(__path__=[], __name__="coman.modules")
+        if name in classes:
+            return types.SimpleNamespace(Module=classes[name])
+        raise ImportError(name)
+
+    monkeypatch.setattr(registry.importlib, "import_module", fake_import)
+    monkeypatch.setattr(
+        registry.pkgutil,
+        "iter_modules",
+        lambda *args, **kwargs: [
+            types.SimpleNamespace(name="coman.modules.slow", ispkg=True),
+            types.SimpleNamespace(name="coman.modules.fast", ispkg=True),
+            types.SimpleNamespace(name="coman.modules.broken", ispkg=True),
+        ],
+    )
+
+    core = registry.Core()
+    report = registry.load_modules(core, parallel=True, max_workers=3)
+
+    assert list(core.modules) == ["slow", "fast"]
+    assert [record.status for record in report] == ["loaded", "loaded", "failed"]
+    slow = report[0].to_payload()
+    assert slow["name"] == "slow"
+    assert slow["init_ms"] >= 50
+    assert slow["total_ms"] >= slow["init_ms"]
+    assert "tracer_ms" in slow
+    assert report[2].error.startswith("import:")
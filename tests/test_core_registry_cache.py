@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from core.registry_cache import RegistryFileCache, file_signature
+
+
+def _load(cache: RegistryFileCache, path: Path, calls: list[Path]) -> dict:
+    def _read() -> dict:
+        calls.append(path)
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    return cache.load_keyed(str(path), _read, lambda: file_signature(path))
+
+
+def test_cache_serves_until_file_signature_changes(tmp_path: Path) -> None:
+    path = tmp_path / "tools.json"
+    path.write_text(json.dumps({"v": 1}), encoding="utf-8")
+    calls: list[Path] = []
+    cache = RegistryFileCache(stat_interval=0)
+
+    assert _load(cache, path, calls) == {"v": 1}
+    assert _load(cache, path, calls) == {"v": 1}
+    assert len(calls) == 1
+
+    path.write_text(json.dumps({"v": 22}), encoding="utf-8")
+    assert _load(cache, path, calls) == {"v": 22}
+    assert len(calls) == 2
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_cache_skips_stat_within_interval_until_invalidated(tmp_path: Path) -> None:
+    path = tmp_path / "caps.json"
+    calls: list[Path] = []
+    cache = RegistryFileCache(stat_interval=3600)
+
+    assert _load(cache, path, calls) == {}
+    path.write_text(json.dumps({"v": 1}), encoding="utf-8")
+    # Within the interval no stat() happens, so the external write is not seen yet.
+    assert _load(cache, path, calls) == {}
+
+    cache.invalidate(path)
+    assert _load(cache, path, calls) == {"v": 1}
+    assert len(calls) == 2
+    assert cache.stats()["entries"] == 1
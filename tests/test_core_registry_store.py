@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from core import registry_store
+from core.messages import ToolRegistry
+from core.registry_store import (
+    JsonRegistryStore,
+    SqliteRegistryStore,
+    copy_registries,
+    get_registry_store,
+    load_registry,
+    upsert_registry_items,
+)
+
+
+def _tool(name: str, path: str = "/v1/x") -> dict:
+    return {"name": name, "method": "GET", "path": path, "params": [], "desc": ""}
+
+
+def test_sqlite_upsert_keeps_position_and_bumps_version(tmp_path: Path) -> None:
+    store = SqliteRegistryStore(tmp_path / "reg.db")
+    assert store.signature("tools") == 0
+
+    store.upsert("tools", [_tool("a"), _tool("b")])
+    store.upsert("tools", [_tool("a", "/v1/changed"), _tool("c")])
+
+    assert [item["name"] for item in store.items("tools")] == ["a", "b", "c"]
+    assert store.get("tools", "a")["path"] == "/v1/changed"
+    assert store.get("tools", "missing") is None
+    assert store.signature("tools") == 2
+    assert store.signature("capabilities") == 0
+
+    assert store.delete("tools", ["b"]) == 1
+    assert [item["name"] for item in store.items("tools")] == ["a", "c"]
+    assert store.signature("tools") == 3
+    store.close()
+
+
+def test_sqlite_transaction_rolls_back_on_error(tmp_path: Path) -> None:
+    store = SqliteRegistryStore(tmp_path / "reg.db")
+    store.upsert("tools", [_tool("a")])
+
+    with pytest.raises(KeyError):
+        # The second entry has no name, so the whole batch must be discarded.
+        store.upsert("tools", [_tool("b"), {"path": "/v1/nameless"}])
+
+    assert [item["name"] for item in store.items("tools")] == ["a"]
+    assert store.signature("tools") == 1
+    store.close()
+
+
+def test_json_store_upsert_replaces_in_place(tmp_path: Path) -> None:
+    (tmp_path / "tools.json").write_text(
+        "\ufeff" + json.dumps({"tools": [_tool("a"), _tool("b")]}),
+        encoding="utf-8",
+    )
+    store = JsonRegistryStore(tmp_path)
+
+    store.upsert("tools", [_tool("b", "/v1/new"), _tool("c")])
+
+    data = json.loads((tmp_path / "tools.json").read_text(encoding="utf-8"))
+    assert [item["name"] for item in data["tools"]] == ["a", "b", "c"]
+    assert data["tools"][1]["path"] == "/v1/new"
+    assert store.delete("tools", ["a", "zzz"]) == 1
+    assert [item["name"] for item in store.items("tools")] == ["b", "c"]
+    assert store.items("capabilities") == []
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_json_store_write_keeps_file_mode(tmp_path: Path) -> None:
+    store = JsonRegistryStore(tmp_path)
+    store.write("tools", {"tools": [_tool("a")]})
+    assert stat.S_IMODE(os.stat(store.path("tools")).st_mode) == registry_store._NEW_FILE_MODE
+
+    os.chmod(store.path("tools"), 0o640)
+    store.upsert("tools", [_tool("b")])
+    assert stat.S_IMODE(os.stat(store.path("tools")).st_mode) == 0o640
+
+
+def test_import_export_round_trip(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "tools.json").write_text(
+        json.dumps({"tools": [_tool("a"), _tool("b")]}),
+        encoding="utf-8",
+    )
+    (src / "capabilities.json").write_text(
+        json.dumps(
+            {
+                "capabilities": [
+                    {"name": "cap", "kind": "webhook", "endpoint": "", "description": ""},
+                ],
+            },
+        ),
+        encoding="utf-8",
+    )
+    db = SqliteRegistryStore(tmp_path / "reg.db")
+
+    counts = copy_registries(JsonRegistryStore(src), db)
+    assert counts == {"tools": 2, "integrations": 0, "capabilities": 1}
+
+    out = tmp_path / "out"
+    copy_registries(db, JsonRegistryStore(out))
+    exported = json.loads((out / "tools.json").read_text(encoding="utf-8"))
+    assert exported == {"tools": [_tool("a"), _tool("b")]}
+    db.close()
+
+
+def test_sqlite_backend_serves_cached_registry(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    settings = registry_store.settings
+    monkeypatch.setattr(settings, "data_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "registry_backend", "sqlite")
+    monkeypatch.setattr(settings, "registry_db", "")
+    monkeypatch.setattr(settings, "registry_stat_interval", 0.0)
+
+    store = get_registry_store()
+    assert isinstance(store, SqliteRegistryStore)
+    assert store.path == tmp_path / "registries.db"
+
+    assert load_registry("tools", ToolRegistry).tools == []
+    upsert_registry_items("tools", [_tool("a")])
+    first = load_registry("tools", ToolRegistry)
+    assert first.names() == ["a"]
+    assert load_registry("tools", ToolRegistry) is first
+
+    store.upsert("tools", [_tool("b")])  # written by another process
+    assert load_registry("tools", ToolRegistry).names() == ["a", "b"]
+    store.close()
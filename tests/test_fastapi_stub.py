@@ -43,3 +43,23 @@ def test_stub_testclient_supports_context_manager() -> None:
 
     assert response.status_code == 200
     assert response.json() == {"pong": True}
+
+
+def test_stub_testclient_awaits_async_endpoints() -> None:
+    _load_stub_module("exceptions", "exceptions.py")
+    _load_stub_module("params", "params.py")
+    _load_stub_module("routing", "routing.py")
+    app_module = _load_stub_module("app", "app.py")
+    testclient_module = _load_stub_module("testclient", "testclient.py")
+
+    async def ping(value: int = 1) -> dict:
+        return {"pong": value}
+
+    app = app_module.FastAPI()
+    app.add_api_route("/ping", ping, methods=["GET"])
+
+    with testclient_module.TestClient(app) as client:
+        response = client.get("/ping", params={"value": 2})
+
+    assert response.status_code == 200
+    assert response.json() == {"pong": 2}
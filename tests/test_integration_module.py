@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -72,6 +73,24 @@ def test_call_rejects_foreign_module(tmp_path, monkeypatch):
     assert "registered module" in resp.json()["detail"]
 
 
+def test_spawn_call_reports_timeouts(tmp_path, monkeypatch):
+    client = _make_client(tmp_path, monkeypatch)
+    _register_sample(client, Path(__file__).resolve().parents[2])
+    monkeypatch.setattr(integration_module.settings, "integration_call_timeout", 2.5, raising=False)
+
+    def _hang(command, **kwargs):
+        raise subprocess.TimeoutExpired(command, kwargs["timeout"])
+
+    monkeypatch.setattr(integration_module.subprocess, "run", _hang)
+    resp = client.post(
+        "/v1/integration/call",
+        params={"name": "sample", "mode": "spawn"},
+        json={"kwargs": {}},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json() == {"ok": False, "stderr": "timed out after 2.5s"}
+
+
 def test_list_handles_utf8_bom(tmp_path, monkeypatch):
     client = _make_client(tmp_path, monkeypatch)
 
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from modules.integration.pool import IntegrationPools, PoolConfig, WorkerError, WorkerPool
+
+ROOT = str(Path(__file__).resolve().parents[1])
+
+
+def _pool(**config) -> WorkerPool:
+    options = {"size": 1, "warmup": 0, "max_calls": 100, "max_rss_mb": 0, **config}
+    return WorkerPool("sample", "tests.sample_integration", ROOT, "sig", PoolConfig(**options))
+
+
+def test_workers_stay_warm_and_capture_stdout() -> None:
+    pool = _pool()
+    try:
+        first = pool.call("whoami", {})
+        second = pool.call("whoami", {})
+        assert first["ok"] and second["ok"]
+        assert first["result"]["pid"] == second["result"]["pid"]
+        assert first["stdout"].startswith("hello from")
+        assert pool.call("run", {"value": 1}) == {"ok": True, "result": {"received": {"value": 1}}}
+
+        missing = pool.call("nope", {})
+        assert missing["ok"] is False and "nope" in missing["error"]
+
+        stats = pool.stats()
+        assert (stats["spawned"], stats["calls"], stats["workers"], stats["idle"]) == (1, 4, 1, 1)
+    finally:
+        pool.close()
+
+
+def test_workers_are_recycled_after_max_calls() -> None:
+    pool = _pool(max_calls=2)
+    try:
+        pids = [pool.call("whoami", {})["result"]["pid"] for _ in range(4)]
+        assert pids[0] == pids[1] != pids[2] == pids[3]
+        assert pool.stats()["recycled"] == 2
+    finally:
+        pool.close()
+
+
+def test_timeout_kills_the_worker_and_the_pool_recovers() -> None:
+    pool = _pool()
+    try:
+        with pytest.raises(WorkerError, match="exceeded"):
+            pool.call("sleep", {"seconds": 5}, timeout=0.5)
+        assert pool.call("sleep", {"seconds": 0})["result"] == {"slept": 0}
+        stats = pool.stats()
+        assert (stats["failures"], stats["spawned"]) == (1, 2)
+    finally:
+        pool.close()
+
+
+def test_pools_are_replaced_when_the_definition_changes() -> None:
+    pools = IntegrationPools()
+    integration = SimpleNamespace(
+        name="sample",
+        module="tests.sample_integration",
+        path=ROOT,
+        sig="a",
+        pool_size=1,
+        pool_warmup=0,
+    )
+    try:
+        pool = pools.get(integration)
+        assert pools.get(integration) is pool
+        assert pool.config.size == 1 and pool.config.warmup == 0
+        integration.sig = "b"
+        assert pools.get(integration) is not pool
+        with pytest.raises(WorkerError):
+            pool.call("run", {})
+    finally:
+        pools.close_all()
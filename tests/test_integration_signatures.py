@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from modules.integration.signatures import SignatureCache
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def test_digest_is_rehashed_only_when_the_stat_key_changes(tmp_path: Path) -> None:
+    source = tmp_path / "adapter.py"
+    source.write_bytes(b"def run():\n    return 1\n")
+    cache = SignatureCache(watch_interval=0)
+
+    assert cache.digest(str(source)) == _sha(b"def run():\n    return 1\n")
+    assert cache.digest(str(source)) == _sha(b"def run():\n    return 1\n")
+    assert (cache.hashes, cache.hits) == (1, 1)
+
+    source.write_bytes(b"def run():\n    return 22\n")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.digest(str(source)) == _sha(b"def run():\n    return 22\n")
+    assert cache.hashes == 2
+
+    source.unlink()
+    assert cache.digest(str(source)) == ""
+    assert cache.digest(None) == ""
+    assert cache.stats()["files"] == 0
+
+
+def test_watcher_refreshes_known_files_in_the_background(tmp_path: Path) -> None:
+    source = tmp_path / "adapter.py"
+    source.write_bytes(b"a = 1\n")
+    cache = SignatureCache(watch_interval=0.05)
+    try:
+        assert cache.digest(str(source)) == _sha(b"a = 1\n")
+        source.write_bytes(b"a = 22\n")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        deadline = time.monotonic() + 2
+        while cache.digest(str(source)) != _sha(b"a = 22\n") and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert cache.digest(str(source)) == _sha(b"a = 22\n")
+        assert cache.hashes == 2
+    finally:
+        cache.stop()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+from typing import Any
+
+from coman.modules.main import run_batch
+
+
+class _FakeModule:
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def invoke_console_operation(self, operation: str, arguments: dict[str, Any]) -> Any:
+        with self._lock:
+            self.calls += 1
+        if operation == "boom":
+            raise RuntimeError("exploded")
+        return {"echo": arguments.get("value")}
+
+
+def _lines(*requests: Any) -> io.StringIO:
+    return io.StringIO("\n".join(json.dumps(r) if not isinstance(r, str) else r for r in requests))
+
+
+def test_run_batch_streams_results_in_input_order() -> None:
+    module = _FakeModule()
+    requests = [{"module": "demo", "operation": "echo", "args": {"value": i}} for i in range(25)]
+    out = io.StringIO()
+
+    failures = run_batch(_lines(*requests), out, {"demo": module}.get, workers=3)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert failures == 0
+    assert [r["index"] for r in records] == list(range(25))
+    assert [r["result"]["echo"] for r in records] == list(range(25))
+    assert module.calls == 25
+
+
+def test_run_batch_reports_failures_per_line() -> None:
+    module = _FakeModule()
+    stream = _lines(
+        {"id": "a", "module": "demo", "operation": "boom"},
+        "not json",
+        "",
+        {"module": "missing", "operation": "echo"},
+        {"module": "demo", "operation": "echo", "args": {"value": 1}},
+    )
+    out = io.StringIO()
+
+    failures = run_batch(stream, out, {"demo": module}.get, workers=2, order="completion")
+
+    records = sorted(
+        (json.loads(line) for line in out.getvalue().splitlines()),
+        key=lambda r: r["index"],
+    )
+    assert failures == 3
+    assert [r["ok"] for r in records] == [False, False, False, True]
+    assert records[0]["id"] == "a" and "exploded" in records[0]["error"]
+    assert "Unknown module" in records[2]["error"]
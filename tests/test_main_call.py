@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from coman.core.config import settings
+from coman.modules.main import _format_result, _load_single_module
+
+
+def test_single_module_call_loads_dependencies_on_demand(monkeypatch: pytest.MonkeyPatch) -> None:
+    data_dir = Path(__file__).resolve().parents[1] / "data"
+    monkeypatch.setattr(settings, "data_dir", str(data_dir))
+
+    manager = _load_single_module("manager")
+    assert list(manager.core.modules) == ["manager"]
+    assert "text" in manager.core.module_specs
+
+    result = _format_result(manager.invoke_console_operation("run", {"goal_q": "uppercase hello"}))
+
+    assert result["tool"] == "text.uppercase"
+    assert result["result"] == {"result": "UPPERCASE HELLO"}
+    assert "text" in manager.core.modules
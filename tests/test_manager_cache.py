@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import time
+
+from core.messages import ToolDefinition
+from modules.manager.cache import MISS, ToolResultCache
+
+
+def _tool(name: str, **extra) -> ToolDefinition:
+    return ToolDefinition(
+        name=name,
+        path=f"/v1/{name.replace('.', '/')}",
+        params=["s"],
+        cacheable=True,
+        **extra,
+    )
+
+
+def test_keys_are_canonical_and_lru_evicts_oldest() -> None:
+    cache = ToolResultCache(max_entries=2, default_ttl=60)
+    upper, title = _tool("text.uppercase"), _tool("webscraper.title")
+
+    first = cache.key(upper, {"s": "a", "n": 1})
+    assert first == cache.key(upper, {"n": 1, "s": "a"})
+    assert first != cache.key(title, {"n": 1, "s": "a"})
+
+    cache.put(first, {"result": "A"}, 60)
+    cache.put(cache.key(upper, {"s": "b"}), {"result": "B"}, 60)
+    assert cache.get(first) == {"result": "A"}  # refreshes recency
+    cache.put(cache.key(title, {"s": "c"}), {"title": "C"}, 60)
+
+    assert cache.get(cache.key(upper, {"s": "b"})) is MISS
+    assert cache.get(first) == {"result": "A"}
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["tools"]["text.uppercase"] == {
+        "entries": 1,
+        "hits": 2,
+        "misses": 1,
+        "evictions": 1,
+        "expired": 0,
+    }
+
+
+def test_entries_expire_after_the_tool_ttl() -> None:
+    cache = ToolResultCache(max_entries=8, default_ttl=60)
+    short = _tool("text.uppercase", cache_ttl=0.01)
+    assert cache.ttl_for(short) == 0.01
+    assert cache.ttl_for(_tool("webscraper.title")) == 60
+
+    key = cache.key(short, {"s": "x"})
+    cache.put(key, {"result": "X"}, cache.ttl_for(short))
+    assert cache.get(key) == {"result": "X"}
+    time.sleep(0.02)
+    assert cache.get(key) is MISS
+    assert cache.stats()["tools"]["text.uppercase"]["expired"] == 1
+
+    cache.put(key, {"result": "X"}, 0)
+    assert cache.get(key) is MISS
+
+
+def test_purge_by_tool_or_everything() -> None:
+    cache = ToolResultCache(max_entries=8, default_ttl=60)
+    upper, title = _tool("text.uppercase"), _tool("webscraper.title")
+    for s in ("a", "b"):
+        cache.put(cache.key(upper, {"s": s}), s, 60)
+    cache.put(cache.key(title, {"s": "a"}), "t", 60)
+
+    assert cache.purge("text.uppercase") == 2
+    assert cache.get(cache.key(title, {"s": "a"})) == "t"
+    assert cache.purge() == 1
+    assert cache.stats()["entries"] == 0
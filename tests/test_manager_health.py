@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from modules.manager.health import CLOSED, HALF_OPEN, OPEN, CircuitOpenError, ToolHealth
+
+
+def _fail(health: ToolHealth, tool: str, times: int) -> None:
+    for _ in range(times):
+        health.acquire(tool)
+        health.record(tool, 5.0, False, "TimeoutError: upstream")
+
+
+def test_rolling_percentiles_and_error_rate() -> None:
+    health = ToolHealth(window=10, failure_threshold=100, cooldown=1)
+    for latency in range(1, 21):
+        health.acquire("text.uppercase")
+        health.record("text.uppercase", float(latency), latency % 5 != 0)
+
+    stats = health.stats(["webscraper.title"])
+    entry = stats["tools"]["text.uppercase"]
+    # Only the last ten calls (11..20 ms) are in the window.
+    assert entry["window"] == 10
+    assert entry["calls"] == 20
+    assert entry["errors"] == 4
+    assert entry["error_rate"] == 0.2
+    assert (entry["p50_ms"], entry["p90_ms"], entry["p99_ms"]) == (15.0, 19.0, 20.0)
+    assert stats["tools"]["webscraper.title"] == {"state": CLOSED, "calls": 0, "window": 0}
+
+
+def test_circuit_opens_after_consecutive_failures_and_probes_half_open() -> None:
+    health = ToolHealth(window=10, failure_threshold=3, cooldown=0.05)
+    _fail(health, "svc", 2)
+    health.acquire("svc")
+    health.record("svc", 1.0, True)
+    _fail(health, "svc", 2)
+    assert health.state("svc") == CLOSED
+
+    _fail(health, "svc", 1)
+    assert health.state("svc") == OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        health.acquire("svc")
+    assert excinfo.value.retry_after > 0
+
+    time.sleep(0.06)
+    health.acquire("svc")  # the probe
+    assert health.state("svc") == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        health.acquire("svc")  # only one probe at a time
+    health.record("svc", 1.0, False, "HTTP 503")
+    assert health.state("svc") == OPEN
+
+    time.sleep(0.06)
+    health.acquire("svc")
+    health.record("svc", 1.0, True)
+    assert health.state("svc") == CLOSED
+    stats = health.stats()["tools"]["svc"]
+    assert stats["rejected"] == 2
+    assert stats["last_error"] == "HTTP 503"
+
+
+def test_cancelled_probe_is_released() -> None:
+    health = ToolHealth(window=10, failure_threshold=1, cooldown=0)
+    _fail(health, "svc", 1)
+    health.acquire("svc")
+    health.release("svc")
+    health.acquire("svc")
+    assert health.state("svc") == HALF_OPEN
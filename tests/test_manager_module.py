@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -10,7 +11,8 @@ from modules.text_module import module as text_module
 
 
 class DummyCore:
-    pass
+    def __init__(self) -> None:
+        self.modules = {}
 
 
 def _build_app() -> tuple[FastAPI, TestClient]:
@@ -18,6 +20,7 @@ def _build_app() -> tuple[FastAPI, TestClient]:
     app = FastAPI()
     manager = manager_module.Module(core)
     text = text_module.Module(core)
+    core.modules = {manager.name: manager, text.name: text}
     for router in manager.get_routers():
         app.include_router(router)
     for router in text.get_routers():
@@ -32,36 +35,13 @@ def test_manager_run_executes_uppercase(monkeypatch):
     data_dir = Path(__file__).resolve().parents[1] / "data"
     monkeypatch.setattr(manager_module.settings, "data_dir", str(data_dir))
 
-    class DummyHTTPXClient:
-        def __init__(self, *args, **kwargs):
-            self._enter = False
-
-        def __enter__(self):
-            self._enter = True
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            self._enter = False
-
-        def get(self, url, params=None):
-            assert self._enter
-            path = url.split("/", 3)
-            if len(path) >= 4:
-                endpoint = "/" + path[3]
-            else:
-                endpoint = url
-            return client.get(endpoint, params=params)
-
-        def post(self, url, params=None, json=None):
-            assert self._enter
-            path = url.split("/", 3)
-            if len(path) >= 4:
-                endpoint = "/" + path[3]
-            else:
-                endpoint = url
-            return client.post(endpoint, params=params, json=json)
-
-    monkeypatch.setattr(manager_module, "httpx", type("_DummyHTTPX", (), {"Client": DummyHTTPXClient}))
+    # Tools are dispatched in-process, so no loopback HTTP client is needed.
+    import httpx
+
+    def _no_http(*args, **kwargs):  # pragma: no cover - failure path
+        raise AssertionError("manager must not call the API over HTTP")
+
+    monkeypatch.setattr(httpx, "Client", _no_http)
 
     response = client.post("/v1/manager/run", json={"goal": "uppercase hello"})
     payload = response.json()
@@ -70,3 +50,118 @@ def test_manager_run_executes_uppercase(monkeypatch):
     assert payload["tool"] == "text.uppercase"
     assert payload["query"] == {"s": "uppercase hello"}
     assert payload["result"] == {"result": "UPPERCASE HELLO"}
+
+
+def test_manager_run_executes_plan(monkeypatch):
+    _, client = _build_app()
+
+    data_dir = Path(__file__).resolve().parents[1] / "data"
+    monkeypatch.setattr(manager_module.settings, "data_dir", str(data_dir))
+
+    plan = [
+        {"id": "first", "tool": "text.uppercase", "inputs": {"s": "hello"}},
+        {"id": "second", "tool": "text.uppercase", "inputs": {"s": "${first.result} world"}},
+        {"id": "missing", "tool": "no.such.tool"},
+        {"id": "skipped", "tool": "text.uppercase", "depends_on": ["missing"]},
+    ]
+    response = client.post("/v1/manager/run", json={"goal": "plan", "plan": plan})
+    payload = response.json()
+
+    assert response.status_code == 200
+    steps = {step["id"]: step for step in payload["steps"]}
+    assert steps["second"]["result"] == {"result": "HELLO WORLD"}
+    assert steps["missing"]["status"] == "error"
+    assert steps["skipped"]["status"] == "cancelled"
+    assert payload["error"] == "step_failed"
+    assert set(payload["result"]) == {"first", "second"}
+    assert payload["latency_ms"] >= 0
+
+    cyclic = [{"id": "a", "tool": "text.uppercase", "depends_on": ["a"]}]
+    assert client.post("/v1/manager/run", json={"plan": cyclic}).status_code == 400
+
+
+def test_manager_run_batch_streams_deduplicated_calls(monkeypatch):
+    _, client = _build_app()
+
+    data_dir = Path(__file__).resolve().parents[1] / "data"
+    monkeypatch.setattr(manager_module.settings, "data_dir", str(data_dir))
+
+    calls = []
+    invoke_tool = manager_module.Module.invoke_tool
+
+    async def _counting(self, tool, query):
+        calls.append((tool.name, dict(query)))
+        return await invoke_tool(self, tool, query)
+
+    monkeypatch.setattr(manager_module.Module, "invoke_tool", _counting)
+
+    goals = ["uppercase hello", "nothing to do", {"goal": "uppercase hello"}, "uppercase bye"]
+    response = client.post("/v1/manager/run-batch", json={"goals": goals, "concurrency": 2})
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    by_index = {line["index"]: line for line in lines}
+    assert sorted(by_index) == [0, 1, 2, 3]
+    assert by_index[0]["result"] == by_index[2]["result"] == {"result": "UPPERCASE HELLO"}
+    assert by_index[1]["error"] == "no_tool"
+    assert by_index[3]["result"] == {"result": "UPPERCASE BYE"}
+    assert sorted(calls, key=lambda c: (c[0], json.dumps(c[1], sort_keys=True))) == [
+        ("text.uppercase", {"s": "uppercase bye"}),
+        ("text.uppercase", {"s": "uppercase hello"}),
+    ]
+
+
+def _sse_events(text):
+    events = []
+    for block in text.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_manager_run_stream_emits_progress_events(monkeypatch):
+    _, client = _build_app()
+
+    data_dir = Path(__file__).resolve().parents[1] / "data"
+    monkeypatch.setattr(manager_module.settings, "data_dir", str(data_dir))
+
+    response = client.post("/v1/manager/run/stream", json={"goal": "uppercase hello"})
+    assert response.status_code == 200
+    events = _sse_events(response.text)
+    assert [name for name, _ in events] == ["route", "dispatch", "result"]
+    assert events[0][1]["tool"] == "text.uppercase"
+    assert events[-1][1]["result"] == {"result": "UPPERCASE HELLO"}
+
+    plan = [
+        {"id": "first", "tool": "text.uppercase", "inputs": {"s": "a"}},
+        {"id": "second", "tool": "text.uppercase", "inputs": {"s": "${first.result}b"}},
+    ]
+    events = _sse_events(client.post("/v1/manager/run/stream", json={"plan": plan}).text)
+    assert [name for name, _ in events] == [
+        "route",
+        "dispatch",
+        "step",
+        "dispatch",
+        "step",
+        "result",
+    ]
+    assert events[-1][1]["result"]["second"] == {"result": "AB"}
+
+
+def test_manager_run_stream_reports_unexpected_plan_failures(monkeypatch):
+    _, client = _build_app()
+
+    data_dir = Path(__file__).resolve().parents[1] / "data"
+    monkeypatch.setattr(manager_module.settings, "data_dir", str(data_dir))
+
+    async def _broken(*args, **kwargs):
+        raise RuntimeError("executor crashed")
+
+    monkeypatch.setattr(manager_module, "execute_plan", _broken)
+
+    plan = [{"id": "only", "tool": "text.uppercase", "inputs": {"s": "a"}}]
+    events = _sse_events(client.post("/v1/manager/run/stream", json={"plan": plan}).text)
+    assert [name for name, _ in events] == ["route", "error"]
+    assert events[-1][1]["error"] == "plan_failed"
+    assert "executor crashed" in events[-1][1]["message"]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from core.messages import ManagerRunRequest, PlanStep
+from modules.manager.plan import PlanError, execute_plan, resolve_references, step_dependencies
+
+
+def _plan(*steps: dict[str, Any]) -> list[PlanStep]:
+    return list(ManagerRunRequest.from_payload({"plan": list(steps)}).plan)
+
+
+def test_independent_steps_run_concurrently() -> None:
+    async def call(step: PlanStep, inputs: dict[str, Any]):
+        await asyncio.sleep(0.1)
+        return inputs, {"tool": step.tool}
+
+    steps = _plan(
+        {"id": "title", "tool": "webscraper.title"},
+        {"id": "snapshot", "tool": "resources.snapshot"},
+        {"id": "upper", "tool": "text.uppercase"},
+    )
+    started = time.perf_counter()
+    results = asyncio.run(execute_plan(steps, call))
+    elapsed = time.perf_counter() - started
+
+    assert [r.status for r in results] == ["ok", "ok", "ok"]
+    assert elapsed < 0.25
+    assert all(r.latency_ms >= 90 for r in results)
+
+
+def test_references_feed_outputs_into_dependents() -> None:
+    seen: dict[str, dict[str, Any]] = {}
+
+    async def call(step: PlanStep, inputs: dict[str, Any]):
+        seen[step.id] = inputs
+        if step.id == "title":
+            return {}, {"title": "Example Domain"}
+        return inputs, {"result": str(inputs["s"]).upper()}
+
+    steps = _plan(
+        {"id": "upper", "tool": "text.uppercase", "inputs": {"s": "${title.title}"}},
+        {"id": "title", "tool": "webscraper.title", "inputs": {"url": "https://example.com"}},
+        {"id": "note", "tool": "text.uppercase", "inputs": {"s": "got ${upper.result}!"}},
+    )
+    assert step_dependencies(steps) == {"upper": ["title"], "title": [], "note": ["upper"]}
+
+    results = asyncio.run(execute_plan(steps, call))
+
+    assert [r.id for r in results] == ["upper", "title", "note"]
+    assert seen["upper"] == {"s": "Example Domain"}
+    assert results[2].result == {"result": "GOT EXAMPLE DOMAIN!"}
+    assert resolve_references(["${title}", 3], {"title": {"a": [1]}}) == [{"a": [1]}, 3]
+
+
+def test_failures_and_timeouts_cancel_dependents_only() -> None:
+    async def call(step: PlanStep, inputs: dict[str, Any]):
+        if step.id == "boom":
+            raise RuntimeError("tool crashed")
+        if step.id == "slow":
+            await asyncio.sleep(1)
+        return {}, {"ok": True}
+
+    steps = _plan(
+        {"id": "boom", "tool": "a"},
+        {"id": "after_boom", "tool": "b", "depends_on": "boom"},
+        {"id": "transitive", "tool": "b", "depends_on": ["after_boom"]},
+        {"id": "slow", "tool": "c", "timeout": 0.05},
+        {"id": "after_slow", "tool": "d", "inputs": {"x": "${slow}"}},
+        {"id": "free", "tool": "e"},
+        {"id": "bad_ref", "tool": "e", "inputs": {"x": "${free.missing}"}},
+    )
+    results = {r.id: r for r in asyncio.run(execute_plan(steps, call))}
+
+    assert results["boom"].status == "error"
+    assert "tool crashed" in results["boom"].error
+    assert results["after_boom"].status == "cancelled"
+    assert results["transitive"].status == "cancelled"
+    assert results["transitive"].error == "dependency 'after_boom' cancelled"
+    assert results["slow"].status == "timeout"
+    assert results["after_slow"].status == "cancelled"
+    assert results["free"].status == "ok"
+    assert results["bad_ref"].status == "error"
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        [{"id": "a", "tool": "t"}, {"id": "a", "tool": "t"}],
+        [{"id": "a", "tool": "t", "depends_on": ["ghost"]}],
+        [
+            {"id": "a", "tool": "t", "inputs": {"s": "${b}"}},
+            {"id": "b", "tool": "t", "depends_on": ["a"]},
+        ],
+    ],
+)
+def test_invalid_plans_are_rejected(steps: list[dict[str, Any]]) -> None:
+    with pytest.raises(PlanError):
+        step_dependencies(_plan(*steps))
+
+
+def test_on_result_reports_steps_as_they_finish() -> None:
+    async def call(step: PlanStep, inputs: dict[str, Any]):
+        await asyncio.sleep(0.05 if step.id == "slow" else 0)
+        return {}, step.id
+
+    finished: list[str] = []
+    steps = _plan(
+        {"id": "slow", "tool": "t"},
+        {"id": "fast", "tool": "t"},
+        {"id": "after", "tool": "t", "depends_on": ["fast"]},
+    )
+    results = asyncio.run(execute_plan(steps, call, on_result=lambda res: finished.append(res.id)))
+
+    assert finished == ["fast", "after", "slow"]
+    assert [r.id for r in results] == ["slow", "fast", "after"]
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from core.messages.manager import ToolDefinition, ToolRegistry
+from modules.manager.router import GoalRouter
+
+
+def _registry(*tools: ToolDefinition) -> ToolRegistry:
+    return ToolRegistry.from_tools(tools)
+
+
+def _default_tools() -> ToolRegistry:
+    return _registry(
+        ToolDefinition(
+            name="text.uppercase",
+            path="/v1/text/uppercase",
+            params=["s"],
+            desc="Uppercase string",
+        ),
+        ToolDefinition(
+            name="webscraper.title",
+            path="/v1/webscraper/title",
+            params=["url"],
+            desc="Fetch <title>",
+        ),
+        ToolDefinition(
+            name="resources.snapshot",
+            path="/v1/resources/snapshot",
+            desc="CPU/RAM snapshot",
+        ),
+    )
+
+
+def test_builtin_rules_keep_their_precedence() -> None:
+    router = GoalRouter()
+    router.rebuild(_default_tools())
+
+    route = router.route("uppercase the title of https://example.com/page")
+    assert route.tool == "webscraper.title"
+    assert route.captures == {"url": "https://example.com/page"}
+
+    assert router.route("uppercase the title").tool == "webscraper.title"
+    assert router.route("make it UPPER").tool == "text.uppercase"
+    assert router.route("how much memory is free").tool == "resources.snapshot"
+    assert router.route("") is None
+    assert router.route("nothing relevant here") is None
+
+
+def test_keywords_name_and_description_are_indexed() -> None:
+    router = GoalRouter()
+    router.rebuild(
+        _registry(
+            ToolDefinition(
+                name="weather.forecast",
+                path="/w",
+                desc="Daily forecast",
+                keywords=["rain", "sunny"],
+            ),
+            ToolDefinition(
+                name="calendar.events",
+                path="/c",
+                desc="Upcoming events and rain dates",
+            ),
+        ),
+    )
+
+    # A trigger word outranks a description word.
+    assert router.route("will it rain tomorrow").tool == "weather.forecast"
+    assert router.route("list my calendar").tool == "calendar.events"
+    assert router.route("any upcoming dates").tool == "calendar.events"
+
+
+def test_pattern_triggers_share_one_alternation() -> None:
+    router = GoalRouter()
+    router.rebuild(
+        _registry(
+            ToolDefinition(name="tickets.lookup", path="/t", patterns=[r"\bJIRA-\d+\b"]),
+            ToolDefinition(name="broken", path="/b", patterns=["(unclosed", r"(?P<x>y)"]),
+        ),
+    )
+
+    assert router.route("status of jira-42 please").tool == "tickets.lookup"
+    # Invalid and named-group patterns are skipped; the name is still indexed.
+    assert router.route("unclosed y") is None
+    assert router.route("is it broken").tool == "broken"
+
+
+def test_add_reindexes_a_single_tool() -> None:
+    registry = _default_tools()
+    router = GoalRouter()
+    router.sync(registry)
+    assert router.route("translate this") is None
+
+    tool = ToolDefinition(
+        name="text.translate",
+        path="/v1/text/translate",
+        keywords="translate, language",
+    )
+    registry.upsert(tool)
+    router.add(tool, registry=registry)
+    assert router.route("translate this").tool == "text.translate"
+
+    replaced = ToolDefinition(
+        name="text.translate",
+        path="/v1/text/translate",
+        keywords=["localise"],
+    )
+    registry.upsert(replaced)
+    router.add(replaced, registry=registry)
+    assert router.route("please localise").tool == "text.translate"
+    # "translate" is now only a name word of the tool.
+    assert router.route("translate this").tool == "text.translate"
+
+    # A registry object the router has not seen triggers a full rebuild.
+    router.sync(_default_tools())
+    assert router.route("please localise") is None
+
+
+def test_unusable_tools_fall_through_to_the_next_tier() -> None:
+    registry = _default_tools()
+    router = GoalRouter()
+    router.rebuild(registry)
+
+    def has_url(name: str) -> bool:
+        return "url" not in registry.find(name).params
+
+    # "fetch" is only a description word of webscraper.title, which needs a URL.
+    assert router.route("fetch it").tool == "webscraper.title"
+    assert router.route("fetch it", has_url) is None
+    assert router.route("uppercase the title", has_url).tool == "text.uppercase"
+
+
+def test_patterns_with_backreferences_match_on_their_own() -> None:
+    router = GoalRouter()
+    router.rebuild(
+        _registry(
+            ToolDefinition(name="text.repeat", path="/r", patterns=[r"\b(\w+) \1\b"]),
+            ToolDefinition(name="tickets.lookup", path="/t", patterns=[r"\bJIRA-\d+\b"]),
+        ),
+    )
+
+    assert router.route("say bye bye now").tool == "text.repeat"
+    assert router.route("say bye now") is None
+    # Leftmost match wins across the alternation and separate patterns.
+    assert router.route("jira-1 and then go go").tool == "tickets.lookup"
+    assert router.route("go go to jira-1").tool == "text.repeat"
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from modules.manager.singleflight import SingleFlight
+
+
+def test_concurrent_identical_calls_share_one_upstream_request() -> None:
+    flights = SingleFlight()
+    upstream: list[str] = []
+
+    async def fetch(key: str) -> dict:
+        upstream.append(key)
+        await asyncio.sleep(0.02)
+        return {"title": key}
+
+    async def main() -> list:
+        calls = [
+            flights.do(key, lambda key=key: fetch(key), label="webscraper.title") for key in "aaab"
+        ]
+        return await asyncio.gather(*calls)
+
+    results = asyncio.run(main())
+
+    assert results == [{"title": "a"}] * 3 + [{"title": "b"}]
+    assert upstream == ["a", "b"]
+    stats = flights.stats()
+    counts = (stats["calls"], stats["upstream"], stats["coalesced"], stats["in_flight"])
+    assert counts == (4, 2, 2, 0)
+    assert stats["ratio"] == 0.5
+    assert stats["tools"]["webscraper.title"] == {"calls": 4, "coalesced": 2, "ratio": 0.5}
+
+
+def test_exceptions_are_shared_and_later_calls_start_fresh() -> None:
+    flights = SingleFlight()
+    attempts: list[int] = []
+
+    async def flaky() -> str:
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise RuntimeError("upstream down")
+        return "ok"
+
+    async def main() -> list:
+        first = await asyncio.gather(
+            flights.do("k", flaky),
+            flights.do("k", flaky),
+            return_exceptions=True,
+        )
+        return [*first, await flights.do("k", flaky)]
+
+    first, second, third = asyncio.run(main())
+
+    assert isinstance(first, RuntimeError) and second is first
+    assert third == "ok"
+    assert len(attempts) == 2
+
+
+def test_cancelling_one_waiter_keeps_the_call_for_the_others() -> None:
+    flights = SingleFlight()
+    finished: list[str] = []
+
+    async def slow() -> str:
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            finished.append("cancelled")
+            raise
+        finished.append("done")
+        return "value"
+
+    async def main() -> str:
+        leader = asyncio.ensure_future(flights.do("k", slow))
+        follower = asyncio.ensure_future(flights.do("k", slow))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        result = await follower
+
+        # With no waiters left the upstream call itself is cancelled.
+        lone = asyncio.ensure_future(flights.do("k", slow))
+        await asyncio.sleep(0.01)
+        lone.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await lone
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(main()) == "value"
+    assert finished == ["done", "cancelled"]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
@@ -12,31 +13,6 @@ from modules.manager import module as manager_module
 from modules.text_module import module as text_module
 
 
-class _LocalHttpClient:
-    def __init__(self, test_client: TestClient, base_url: str) -> None:
-        self._client = test_client
-        self._base_url = base_url.rstrip("/")
-
-    def __enter__(self) -> "_LocalHttpClient":
-        return self
-
-    def __exit__(self, exc_type, exc, tb) -> bool:  # type: ignore[override]
-        return False
-
-    def _request(self, method: str, url: str, **kwargs: Any):
-        assert url.startswith(self._base_url)
-        path = url[len(self._base_url) :]
-        if not path:
-            path = "/"
-        return self._client.request(method, path, **kwargs)
-
-    def get(self, url: str, **kwargs: Any):
-        return self._request("GET", url, **kwargs)
-
-    def post(self, url: str, **kwargs: Any):
-        return self._request("POST", url, **kwargs)
-
-
 def test_manager_invokes_text_module_end_to_end(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -53,13 +29,11 @@ def test_manager_invokes_text_module_end_to_end(
 
     app = build_fastapi_app(core)
     client = TestClient(app)
-    base_url = str(client.base_url).rstrip("/")
-    monkeypatch.setattr(manager_module.settings, "api_base", base_url, raising=False)
 
-    def _client_factory(*args: Any, **kwargs: Any) -> _LocalHttpClient:
-        return _LocalHttpClient(client, base_url)
+    def _no_http(*args: Any, **kwargs: Any) -> None:  # pragma: no cover - failure path
+        raise AssertionError("manager must dispatch to the text module in-process")
 
-    monkeypatch.setattr(manager_module.httpx, "Client", _client_factory)
+    monkeypatch.setattr(httpx, "Client", _no_http)
 
     registry = manager_module.ToolRegistry()
     registry.upsert(
@@ -77,3 +51,48 @@ def test_manager_invokes_text_module_end_to_end(
     payload = response.json()
     assert payload["tool"] == "text.uppercase"
     assert payload["result"]["result"] == "UPPERCASE THIS"
+
+
+def test_manager_uses_http_for_remote_modules(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("core.app.mount_ui", lambda _app: None)
+    monkeypatch.setattr(manager_module.settings, "data_dir", str(tmp_path), raising=False)
+    monkeypatch.setattr(manager_module.settings, "api_base", "http://remote-text", raising=False)
+    monkeypatch.setattr(manager_module.settings, "remote_modules", {"text": ""}, raising=False)
+
+    calls: list[tuple[str, str]] = []
+
+    class _RemoteAsyncClient:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            pass
+
+        async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+            calls.append((method, url))
+            return httpx.Response(200, json={"result": "REMOTE"})
+
+        async def aclose(self) -> None:
+            pass
+
+    # The manager's /run endpoint is async and uses the pooled async client.
+    monkeypatch.setattr(httpx, "AsyncClient", _RemoteAsyncClient)
+
+    core = Core()
+    manager = manager_module.Module(core)
+    core.modules = {manager.name: manager}
+    registry = manager_module.ToolRegistry()
+    registry.upsert(
+        manager_module.ToolDefinition(
+            name="text.uppercase",
+            method="GET",
+            path="/v1/text/uppercase",
+            params=["s"],
+        ),
+    )
+    manager_module.save_tools(registry)
+
+    client = TestClient(build_fastapi_app(core))
+    response = client.post("/v1/manager/run", json={"goal": "uppercase remote"})
+    assert response.status_code == 200
+    assert response.json()["result"] == {"result": "REMOTE"}
+    assert calls == [("GET", "http://remote-text/v1/text/uppercase")]
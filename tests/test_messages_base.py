@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import pytest
 from pydantic import Field
 
-from core.messages.base import ModuleMessage
+from core.messages import ManagerRunRequest
+from core.messages.base import ModuleMessage, ValidationError
 
 
 class SampleMessage(ModuleMessage):
@@ -24,3 +26,29 @@ def test_module_message_clone_updates_fields() -> None:
     assert cloned.identifier == 2
     assert cloned.alias_value == "alpha"
     assert original.identifier == 1
+
+
+def test_module_message_from_payload_lenient_inputs() -> None:
+    assert SampleMessage.from_payload(["not", "a", "mapping"]).to_payload() == {
+        "identifier": 0,
+        "alias_value": "",
+    }
+    with pytest.raises(ValidationError):
+        SampleMessage.from_payload({"identifier": "not-a-number", "ignored": 1})
+
+
+def test_module_message_clone_validates_updates_only() -> None:
+    original = SampleMessage(identifier=1, alias_value="alpha")
+    cloned = original.clone(identifier="3", unknown="skipped")
+    assert cloned.identifier == 3
+    assert not hasattr(cloned, "unknown")
+    with pytest.raises(ValidationError):
+        original.clone(identifier="x")
+
+
+def test_module_message_clone_reruns_custom_init() -> None:
+    request = ManagerRunRequest(goal="a", inputs={"k": "v"})
+    cloned = request.clone(goal="  padded  ")
+    assert cloned.goal == "padded"
+    assert cloned.inputs == {"k": "v"}
+    assert request.goal == "a"
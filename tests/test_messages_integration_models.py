@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from core.messages.integration import IntegrationDefinition, IntegrationRegistry
+
+
+def _raw(name: str) -> dict:
+    return {"name": name, "path": ".", "module": f"pkg.{name}", "callable": "run"}
+
+
+def test_integration_registry_validates_only_new_raw_entries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    registry = IntegrationRegistry(integrations=[IntegrationDefinition(**_raw("a"))])
+    converted: list[str] = []
+    original = IntegrationDefinition.from_payload.__func__
+
+    def _tracking(cls, payload=None):
+        converted.append(payload["name"])
+        return original(cls, payload)
+
+    monkeypatch.setattr(IntegrationDefinition, "from_payload", classmethod(_tracking))
+
+    assert registry.find("a") is not None
+    assert converted == []
+
+    registry.integrations.append(_raw("b"))
+    found = registry.find("b")
+    assert isinstance(found, IntegrationDefinition)
+    assert registry.find("a") is not None
+    assert converted == ["b"]
+
+    registry.upsert(_raw("c"))
+    assert isinstance(registry.find("c"), IntegrationDefinition)
+    assert converted == ["b", "c"]
+    assert registry.delete("a") is True
+    assert registry.find("b") is not None
+    assert converted == ["b", "c"]
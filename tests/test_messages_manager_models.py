@@ -28,12 +28,45 @@ def test_tool_registry_roundtrip_and_lookup() -> None:
     registry = ToolRegistry.from_tools(tools)
     registry.upsert(ToolDefinition(name="first", path="/other"))
 
-    assert registry.names() == ["second", "first"]
+    # Updating an existing tool keeps its position for stable serialisation.
+    assert registry.names() == ["first", "second"]
     found = registry.find("first")
     assert found is not None
     assert found.path == "/other"
 
 
+def test_tool_registry_index_tracks_deletes_and_external_changes() -> None:
+    registry = ToolRegistry.from_tools(
+        ToolDefinition(name=name, path=f"/{name}") for name in ("a", "b", "c")
+    )
+    assert registry.delete("b") is True
+    assert registry.delete("b") is False
+    assert registry.names() == ["a", "c"]
+    assert registry.find("c").path == "/c"
+
+    registry.tools.append(ToolDefinition(name="d", path="/d"))
+    assert registry.find("d").path == "/d"
+    assert [tool["name"] for tool in registry.to_payload()["tools"]] == ["a", "c", "d"]
+    assert [tool.name for tool in registry.tools] == ["a", "c", "d"]
+
+    registry.tools = [ToolDefinition(name="z", path="/z")]
+    assert registry.find("z").path == "/z"
+    assert registry.find("a") is None
+
+
+def test_tool_registry_update_keeps_position_in_serialised_list() -> None:
+    registry = ToolRegistry.from_tools(
+        ToolDefinition(name=name, path=f"/{name}") for name in ("a", "b")
+    )
+    registry.upsert(ToolDefinition(name="a", path="/new"))
+    registry.delete("b")
+    registry.upsert(ToolDefinition(name="b", path="/b2"))
+
+    result = ManagerRunResult(goal="demo").set_known_tools(registry)
+    dumped = result.to_payload()["known_tools"]["tools"]
+    assert [(tool["name"], tool["path"]) for tool in dumped] == [("a", "/new"), ("b", "/b2")]
+
+
 def test_manager_run_request_sanitises_inputs() -> None:
     payload = {
         "goal": "  explore  ",
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from core.messages.orchestrator import Capability, CapabilityRegistry
+
+
+def test_capability_registry_add_replaces_by_name() -> None:
+    registry = CapabilityRegistry()
+    registry.add(Capability(name="search", endpoint="/a"))
+    registry.add(Capability(name="notify", endpoint="/b"))
+    registry.add(Capability(name="search", endpoint="/c"))
+
+    assert registry.names() == ["search", "notify"]
+    assert registry.find("search").endpoint == "/c"
+
+
+def test_capability_registry_collapses_duplicates_from_payload() -> None:
+    registry = CapabilityRegistry.from_payload(
+        {
+            "capabilities": [
+                {"name": "search", "endpoint": "/old"},
+                {"name": "notify", "endpoint": "/n"},
+                {"name": "search", "endpoint": "/new"},
+            ],
+        },
+    )
+
+    assert registry.find("search") is not None
+    payload = registry.to_payload()["capabilities"]
+    assert [(c["name"], c["endpoint"]) for c in payload] == [("search", "/new"), ("notify", "/n")]
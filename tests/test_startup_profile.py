@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from core import startup_profile
+
+
+def test_parse_importtime_skips_header_and_noise() -> None:
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        450 |   json.decoder",
+            "INFO coman.registry: loaded text",
+            "import time:      3000 |       9000 | fastapi",
+        ],
+    )
+    assert startup_profile.parse_importtime(stderr) == [
+        {"module": "json.decoder", "self_us": 120, "cumulative_us": 450},
+        {"module": "fastapi", "self_us": 3000, "cumulative_us": 9000},
+    ]
+
+
+def test_format_report_sorts_by_cost() -> None:
+    report = {
+        "baseline_rss_bytes": 10 * 1024 * 1024,
+        "stages": [{"stage": "load_modules", "seconds": 0.5, "rss_bytes": 0, "rss_delta_bytes": 0}],
+        "modules": [
+            {
+                "name": "text",
+                "import_ms": 1.0,
+                "init_ms": 1.0,
+                "tracer_ms": 0.5,
+                "total_ms": 2.0,
+                "status": "loaded",
+            },
+            {
+                "name": "telegram",
+                "import_ms": 90.0,
+                "init_ms": 5.0,
+                "tracer_ms": 0.5,
+                "total_ms": 95.0,
+                "status": "loaded",
+            },
+        ],
+        "tracer_providers": {"text": 0.001, "telegram": 0.002},
+        "imports": [
+            {"module": "json", "self_us": 10, "cumulative_us": 20},
+            {"module": "telegram", "self_us": 100, "cumulative_us": 80000},
+        ],
+    }
+    rendered = startup_profile.format_report(report, top=1)
+    assert rendered.index("telegram") < rendered.index("text")
+    assert "json" not in rendered.split("Imports")[1]
+    assert "load_modules" in rendered
+
+
+def test_collect_stage_report_on_a_lazy_core() -> None:
+    report = startup_profile.collect_stage_report(lazy=True)
+
+    assert [item["stage"] for item in report["stages"]] == [
+        "import core",
+        "load_modules",
+        "build_fastapi_app",
+    ]
+    assert all(item["seconds"] >= 0 for item in report["stages"])
+    assert set(report) == {"baseline_rss_bytes", "stages", "modules", "tracer_providers"}
+    for record in report["modules"]:
+        assert {
+            "import_path",
+            "status",
+            "import_ms",
+            "init_ms",
+            "tracer_ms",
+            "total_ms",
+            "lazy",
+        } <= set(record)
+
+
+def _fake_child(returncode: int, written: list[str]):
+    def run(command: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        report_path = command[command.index("--child-report") + 1]
+        written.append(report_path)
+        assert "--lazy" in command
+        if returncode == 0:
+            Path(report_path).write_text(
+                json.dumps({"stages": [], "modules": []}),
+                encoding="utf-8",
+            )
+        stderr = "import time:       120 |        450 | json\nchild failed"
+        return subprocess.CompletedProcess(command, returncode, "", stderr)
+
+    return run
+
+
+def test_profile_startup_merges_child_report_and_removes_it(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    written: list[str] = []
+    monkeypatch.setattr(startup_profile.subprocess, "run", _fake_child(0, written))
+
+    report = startup_profile.profile_startup(lazy=True)
+
+    assert report["imports"] == [{"module": "json", "self_us": 120, "cumulative_us": 450}]
+    assert report["stages"] == []
+    assert not os.path.exists(written[0])
+
+
+def test_profile_startup_reports_child_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    written: list[str] = []
+    monkeypatch.setattr(startup_profile.subprocess, "run", _fake_child(3, written))
+
+    with pytest.raises(RuntimeError, match="exit code 3") as excinfo:
+        startup_profile.profile_startup(lazy=True)
+
+    assert "child failed" in str(excinfo.value)
+    assert not os.path.exists(written[0])